@@ -0,0 +1,54 @@
+"""
+Бенчмарк часу імпорту `nova_post.api`.
+
+Кожен замір виконується в окремому процесі інтерпретатора, щоб не враховувати кеш `sys.modules`.
+Для порівняння окремо вимірюється вартість, яку раніше `nova_post.api` сплачував при імпорті:
+`from fake_useragent import UserAgent; UserAgent()`.
+
+Запуск::
+
+    python benchmarks/import_time.py --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+SNIPPETS = {
+    "baseline (python -c pass)": "pass",
+    "import nova_post.api": "import nova_post.api",
+    "fake_useragent.UserAgent() (previous import-time cost)": "from fake_useragent import UserAgent; UserAgent()",
+}
+
+TIMER = """
+import time
+_start = time.perf_counter()
+{snippet}
+print(time.perf_counter() - _start)
+"""
+
+
+def measure(snippet: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", TIMER.format(snippet=snippet)], text=True)
+        samples.append(float(output.strip()))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="кількість запусків на кожен замір")
+    args = parser.parse_args()
+
+    for name, snippet in SNIPPETS.items():
+        try:
+            median = measure(snippet, args.runs)
+        except subprocess.CalledProcessError:
+            print(f"{name:<60} unavailable")
+            continue
+        print(f"{name:<60} {median * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
-from typing import List
+from typing import Iterator, List, Optional
 
 from ..models.address import (
     City, Warehouse, Street, Area, AddressSaveRequest, AddressUpdateRequest, AddressDeleteRequest, AddressResponse,
     SearchSettlementsRequest, SearchSettlementsResponse, SearchSettlementStreetsRequest,
     SearchSettlementStreetsResponse, GetCitiesRequest, GetWarehousesRequest, GetStreetsRequest
 )
+from ..paging import fan_out_pages, fetch_all_pages, iter_pages, page_count, page_filters
 
 
 class Address:
@@ -57,6 +58,43 @@ class Address:
         result = self.api.send_request("Address", "getCities", data.model_dump(exclude_unset=True))
         return [City.model_validate(city) for city in result]
 
+    def iter_cities(self, data: Optional[GetCitiesRequest] = None, page_size: int = 500,
+                    prefetch: bool = True) -> Iterator[City]:
+        """
+        Потокове читання міст: наступна сторінка завантажується у фоні, поки обробляється поточна.
+
+        :param data: Pydantic-модель `GetCitiesRequest` з фільтрами (необов'язково); `Page` задає першу сторінку.
+        :param page_size: Кількість записів на сторінці (`Limit`).
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :return: Ітератор об'єктів `City`.
+        """
+        filters, first_page = page_filters(data)
+
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("Address", "getCities", dict(filters, Page=page, Limit=page_size))
+
+        for page in iter_pages(fetch_page, page_size, first_page, prefetch):
+            for item in page:
+                yield City.model_validate(item)
+
+    def get_all_cities(self, data: Optional[GetCitiesRequest] = None, page_size: int = 500,
+                       max_workers: int = 4) -> List[City]:
+        """
+        Отримання повного довідника міст з паралельним завантаженням сторінок.
+
+        :param data: Pydantic-модель `GetCitiesRequest` з фільтрами (необов'язково); `Page` і `Limit` ігноруються.
+        :param page_size: Кількість міст на сторінці.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Список усіх об'єктів `City`.
+        """
+        filters, _ = page_filters(data)
+
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("Address", "getCities", dict(filters, Page=page, Limit=page_size))
+
+        result = fetch_all_pages(fetch_page, page_size, max_workers)
+        return [City.model_validate(city) for city in result]
+
     def get_warehouses(self, data: GetWarehousesRequest) -> List[Warehouse]:
         """
         Отримання списку відділень.
@@ -67,6 +105,43 @@ class Address:
         result = self.api.send_request("Address", "getWarehouses", data.model_dump(exclude_unset=True))
         return [Warehouse.model_validate(wh) for wh in result]
 
+    def iter_warehouses(self, data: Optional[GetWarehousesRequest] = None, page_size: int = 500,
+                        prefetch: bool = True) -> Iterator[Warehouse]:
+        """
+        Потокове читання відділень: наступна сторінка завантажується у фоні, поки обробляється поточна.
+
+        :param data: Pydantic-модель `GetWarehousesRequest` з фільтрами (необов'язково); `Page` задає першу сторінку.
+        :param page_size: Кількість записів на сторінці (`Limit`).
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :return: Ітератор об'єктів `Warehouse`.
+        """
+        filters, first_page = page_filters(data)
+
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("Address", "getWarehouses", dict(filters, Page=page, Limit=page_size))
+
+        for page in iter_pages(fetch_page, page_size, first_page, prefetch):
+            for item in page:
+                yield Warehouse.model_validate(item)
+
+    def get_all_warehouses(self, data: Optional[GetWarehousesRequest] = None, page_size: int = 500,
+                           max_workers: int = 4) -> List[Warehouse]:
+        """
+        Отримання повного довідника відділень з паралельним завантаженням сторінок.
+
+        :param data: Pydantic-модель `GetWarehousesRequest` з фільтрами (необов'язково); `Page` і `Limit` ігноруються.
+        :param page_size: Кількість відділень на сторінці.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Список усіх об'єктів `Warehouse`.
+        """
+        filters, _ = page_filters(data)
+
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("Address", "getWarehouses", dict(filters, Page=page, Limit=page_size))
+
+        result = fetch_all_pages(fetch_page, page_size, max_workers)
+        return [Warehouse.model_validate(wh) for wh in result]
+
     def get_streets(self, data: GetStreetsRequest) -> List[Street]:
         """
         Отримання списку вулиць.
@@ -77,6 +152,40 @@ class Address:
         result = self.api.send_request("Address", "getStreet", data.model_dump(exclude_unset=True))
         return [Street.model_validate(street) for street in result]
 
+    def iter_streets(self, data: GetStreetsRequest, page_size: int = 500, prefetch: bool = True) -> Iterator[Street]:
+        """
+        Потокове читання вулиць міста: наступна сторінка завантажується у фоні, поки обробляється поточна.
+
+        :param data: Pydantic-модель `GetStreetsRequest` з фільтрами; `Page` задає першу сторінку.
+        :param page_size: Кількість записів на сторінці (`Limit`).
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :return: Ітератор об'єктів `Street`.
+        """
+        filters, first_page = page_filters(data)
+
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("Address", "getStreet", dict(filters, Page=page, Limit=page_size))
+
+        for page in iter_pages(fetch_page, page_size, first_page, prefetch):
+            for item in page:
+                yield Street.model_validate(item)
+
+    def get_all_streets(self, city_ref: str, page_size: int = 500, max_workers: int = 4) -> List[Street]:
+        """
+        Отримання всіх вулиць міста з паралельним завантаженням сторінок.
+
+        :param city_ref: Ідентифікатор міста.
+        :param page_size: Кількість вулиць на сторінці.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Список усіх об'єктів `Street` міста.
+        """
+        def fetch_page(page: int) -> list:
+            properties = {"CityRef": city_ref, "Page": page, "Limit": page_size}
+            return self.api.send_request("Address", "getStreet", properties)
+
+        result = fetch_all_pages(fetch_page, page_size, max_workers)
+        return [Street.model_validate(street) for street in result]
+
     def get_areas(self) -> List[Area]:
         """
         Отримання списку областей.
@@ -98,6 +207,35 @@ class Address:
             return SearchSettlementsResponse(TotalCount="0", Addresses=[])
         return SearchSettlementsResponse.model_validate(result[0])
 
+    def search_all_settlements(self, data: SearchSettlementsRequest,
+                               max_workers: int = 4) -> SearchSettlementsResponse:
+        """
+        Пошук населених пунктів з отриманням усіх сторінок результату.
+
+        Перша сторінка визначає кількість сторінок (`TotalCount` / `Limit`), решта завантажуються
+        паралельно й об'єднуються в порядку сторінок.
+
+        :param data: Pydantic-модель `SearchSettlementsRequest`; `Page` ігнорується.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Об'єкт `SearchSettlementsResponse` з усіма знайденими населеними пунктами.
+        """
+        # `Limit` надсилається завжди: за ним рахується кількість сторінок, навіть якщо в запиті він не заданий
+        properties = dict(data.model_dump(exclude={"Page"}, exclude_unset=True), Limit=data.Limit)
+
+        def fetch_page(page: int) -> list:
+            result = self.api.send_request("Address", "searchSettlements", dict(properties, Page=page))
+            return result[0].get("Addresses", []) if result else []
+
+        first = self.api.send_request("Address", "searchSettlements", dict(properties, Page=1))
+        if not first:
+            return SearchSettlementsResponse(TotalCount="0", Addresses=[])
+        total_count = int(first[0].get("TotalCount") or 0)
+        addresses = list(first[0].get("Addresses", []))
+        last_page = page_count(total_count, data.Limit)
+        for page in fan_out_pages(fetch_page, data.Limit, max_workers, 2, last_page):
+            addresses.extend(page)
+        return SearchSettlementsResponse.model_validate({"TotalCount": str(total_count), "Addresses": addresses})
+
     def search_settlement_streets(self, data: SearchSettlementStreetsRequest) -> SearchSettlementStreetsResponse:
         """
         Онлайн-пошук вулиць у вибраному населеному пункті.
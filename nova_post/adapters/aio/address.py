@@ -0,0 +1,250 @@
+from typing import AsyncIterator, List, Optional
+
+from ...models.address import (
+    City, Warehouse, Street, Area, AddressSaveRequest, AddressUpdateRequest, AddressDeleteRequest, AddressResponse,
+    SearchSettlementsRequest, SearchSettlementsResponse, SearchSettlementStreetsRequest,
+    SearchSettlementStreetsResponse, GetCitiesRequest, GetWarehousesRequest, GetStreetsRequest
+)
+from ...paging import afan_out_pages, afetch_all_pages, aiter_pages, page_count, page_filters
+
+
+class Address:
+    """
+    Асинхронний адаптер для роботи з адресами та адресами контрагентів.
+
+    Дозволяє створювати, оновлювати, видаляти адреси, отримувати довідники населених пунктів, вулиць, складів тощо.
+    """
+
+    def __init__(self, api):
+        self.api = api
+
+    async def save_address(self, data: AddressSaveRequest) -> AddressResponse:
+        """
+        Створення адреси контрагента.
+
+        :param data: Pydantic-модель `AddressSaveRequest`, що містить дані для збереження адреси.
+        :return: Об'єкт `AddressResponse` із деталями створеної адреси.
+        """
+        result = await self.api.send_request("Address", "save", data.model_dump(exclude_unset=True))
+        return AddressResponse.model_validate(result[0]) if result else AddressResponse(Ref="", Description="")
+
+    async def update_address(self, data: AddressUpdateRequest) -> AddressResponse:
+        """
+        Оновлення даних адреси контрагента.
+
+        :param data: Pydantic-модель `AddressUpdateRequest`, що містить оновлені дані адреси.
+        :return: Об'єкт `AddressResponse` із оновленою інформацією.
+        """
+        result = await self.api.send_request("Address", "update", data.model_dump(exclude_unset=True))
+        return AddressResponse.model_validate(result[0]) if result else AddressResponse(Ref="", Description="")
+
+    async def delete_address(self, data: AddressDeleteRequest) -> bool:
+        """
+        Видалення адреси контрагента.
+
+        :param data: Pydantic-модель `AddressDeleteRequest`, що містить `Ref` адреси для видалення.
+        :return: `True`, якщо адреса успішно видалена.
+        """
+        result = await self.api.send_request("Address", "delete", data.model_dump(exclude_unset=True))
+        return bool(result)
+
+    async def get_cities(self, data: GetCitiesRequest) -> List[City]:
+        """
+        Отримання списку міст.
+
+        :param data: Pydantic-модель `GetCitiesRequest`, що містить параметри фільтрації.
+        :return: Список об'єктів `City` із деталями міст.
+        """
+        result = await self.api.send_request("Address", "getCities", data.model_dump(exclude_unset=True))
+        return [City.model_validate(city) for city in result]
+
+    async def iter_cities(self, data: Optional[GetCitiesRequest] = None, page_size: int = 500,
+                          prefetch: bool = True) -> AsyncIterator[City]:
+        """
+        Потокове читання міст: наступна сторінка запитується конкурентно, поки обробляється поточна.
+
+        :param data: Pydantic-модель `GetCitiesRequest` з фільтрами (необов'язково); `Page` задає першу сторінку.
+        :param page_size: Кількість записів на сторінці (`Limit`).
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :return: Ітератор об'єктів `City`.
+        """
+        filters, first_page = page_filters(data)
+
+        async def fetch_page(page: int) -> list:
+            return await self.api.send_request("Address", "getCities", dict(filters, Page=page, Limit=page_size))
+
+        async for page in aiter_pages(fetch_page, page_size, first_page, prefetch):
+            for item in page:
+                yield City.model_validate(item)
+
+    async def get_all_cities(self, data: Optional[GetCitiesRequest] = None, page_size: int = 500,
+                             max_workers: int = 4) -> List[City]:
+        """
+        Отримання повного довідника міст з конкурентним завантаженням сторінок.
+
+        :param data: Pydantic-модель `GetCitiesRequest` з фільтрами (необов'язково); `Page` і `Limit` ігноруються.
+        :param page_size: Кількість міст на сторінці.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Список усіх об'єктів `City`.
+        """
+        filters, _ = page_filters(data)
+
+        async def fetch_page(page: int) -> list:
+            return await self.api.send_request("Address", "getCities", dict(filters, Page=page, Limit=page_size))
+
+        result = await afetch_all_pages(fetch_page, page_size, max_workers)
+        return [City.model_validate(city) for city in result]
+
+    async def get_warehouses(self, data: GetWarehousesRequest) -> List[Warehouse]:
+        """
+        Отримання списку відділень.
+
+        :param data: Pydantic-модель `GetWarehousesRequest`, що містить параметри фільтрації.
+        :return: Список об'єктів `Warehouse` із деталями відділень.
+        """
+        result = await self.api.send_request("Address", "getWarehouses", data.model_dump(exclude_unset=True))
+        return [Warehouse.model_validate(wh) for wh in result]
+
+    async def iter_warehouses(self, data: Optional[GetWarehousesRequest] = None, page_size: int = 500,
+                              prefetch: bool = True) -> AsyncIterator[Warehouse]:
+        """
+        Потокове читання відділень: наступна сторінка запитується конкурентно, поки обробляється поточна.
+
+        :param data: Pydantic-модель `GetWarehousesRequest` з фільтрами (необов'язково); `Page` задає першу сторінку.
+        :param page_size: Кількість записів на сторінці (`Limit`).
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :return: Ітератор об'єктів `Warehouse`.
+        """
+        filters, first_page = page_filters(data)
+
+        async def fetch_page(page: int) -> list:
+            return await self.api.send_request("Address", "getWarehouses", dict(filters, Page=page, Limit=page_size))
+
+        async for page in aiter_pages(fetch_page, page_size, first_page, prefetch):
+            for item in page:
+                yield Warehouse.model_validate(item)
+
+    async def get_all_warehouses(self, data: Optional[GetWarehousesRequest] = None, page_size: int = 500,
+                                 max_workers: int = 4) -> List[Warehouse]:
+        """
+        Отримання повного довідника відділень з конкурентним завантаженням сторінок.
+
+        :param data: Pydantic-модель `GetWarehousesRequest` з фільтрами (необов'язково); `Page` і `Limit` ігноруються.
+        :param page_size: Кількість відділень на сторінці.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Список усіх об'єктів `Warehouse`.
+        """
+        filters, _ = page_filters(data)
+
+        async def fetch_page(page: int) -> list:
+            return await self.api.send_request("Address", "getWarehouses", dict(filters, Page=page, Limit=page_size))
+
+        result = await afetch_all_pages(fetch_page, page_size, max_workers)
+        return [Warehouse.model_validate(wh) for wh in result]
+
+    async def get_streets(self, data: GetStreetsRequest) -> List[Street]:
+        """
+        Отримання списку вулиць.
+
+        :param data: Pydantic-модель `GetStreetsRequest`, що містить параметри фільтрації.
+        :return: Список об'єктів `Street` із назвами вулиць.
+        """
+        result = await self.api.send_request("Address", "getStreet", data.model_dump(exclude_unset=True))
+        return [Street.model_validate(street) for street in result]
+
+    async def iter_streets(self, data: GetStreetsRequest, page_size: int = 500,
+                           prefetch: bool = True) -> AsyncIterator[Street]:
+        """
+        Потокове читання вулиць міста: наступна сторінка запитується конкурентно, поки обробляється поточна.
+
+        :param data: Pydantic-модель `GetStreetsRequest` з фільтрами; `Page` задає першу сторінку.
+        :param page_size: Кількість записів на сторінці (`Limit`).
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :return: Ітератор об'єктів `Street`.
+        """
+        filters, first_page = page_filters(data)
+
+        async def fetch_page(page: int) -> list:
+            return await self.api.send_request("Address", "getStreet", dict(filters, Page=page, Limit=page_size))
+
+        async for page in aiter_pages(fetch_page, page_size, first_page, prefetch):
+            for item in page:
+                yield Street.model_validate(item)
+
+    async def get_all_streets(self, city_ref: str, page_size: int = 500, max_workers: int = 4) -> List[Street]:
+        """
+        Отримання всіх вулиць міста з конкурентним завантаженням сторінок.
+
+        :param city_ref: Ідентифікатор міста.
+        :param page_size: Кількість вулиць на сторінці.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Список усіх об'єктів `Street` міста.
+        """
+        async def fetch_page(page: int) -> list:
+            properties = {"CityRef": city_ref, "Page": page, "Limit": page_size}
+            return await self.api.send_request("Address", "getStreet", properties)
+
+        result = await afetch_all_pages(fetch_page, page_size, max_workers)
+        return [Street.model_validate(street) for street in result]
+
+    async def get_areas(self) -> List[Area]:
+        """
+        Отримання списку областей.
+
+        :return: Список об'єктів `Area`, що містять інформацію про області.
+        """
+        result = await self.api.send_request("Address", "getAreas", {})
+        return [Area.model_validate(area) for area in result]
+
+    async def search_settlements(self, data: SearchSettlementsRequest) -> SearchSettlementsResponse:
+        """
+        Онлайн-пошук населених пунктів.
+
+        :param data: Pydantic-модель `SearchSettlementsRequest`, що містить назву або поштовий індекс міста.
+        :return: Об'єкт `SearchSettlementsResponse` із результатами пошуку.
+        """
+        result = await self.api.send_request("Address", "searchSettlements", data.model_dump(exclude_unset=True))
+        if not result:
+            return SearchSettlementsResponse(TotalCount="0", Addresses=[])
+        return SearchSettlementsResponse.model_validate(result[0])
+
+    async def search_all_settlements(self, data: SearchSettlementsRequest,
+                                     max_workers: int = 4) -> SearchSettlementsResponse:
+        """
+        Пошук населених пунктів з отриманням усіх сторінок результату.
+
+        Перша сторінка визначає кількість сторінок (`TotalCount` / `Limit`), решта завантажуються
+        конкурентно й об'єднуються в порядку сторінок.
+
+        :param data: Pydantic-модель `SearchSettlementsRequest`; `Page` ігнорується.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Об'єкт `SearchSettlementsResponse` з усіма знайденими населеними пунктами.
+        """
+        # `Limit` надсилається завжди: за ним рахується кількість сторінок, навіть якщо в запиті він не заданий
+        properties = dict(data.model_dump(exclude={"Page"}, exclude_unset=True), Limit=data.Limit)
+
+        async def fetch_page(page: int) -> list:
+            result = await self.api.send_request("Address", "searchSettlements", dict(properties, Page=page))
+            return result[0].get("Addresses", []) if result else []
+
+        first = await self.api.send_request("Address", "searchSettlements", dict(properties, Page=1))
+        if not first:
+            return SearchSettlementsResponse(TotalCount="0", Addresses=[])
+        total_count = int(first[0].get("TotalCount") or 0)
+        addresses = list(first[0].get("Addresses", []))
+        last_page = page_count(total_count, data.Limit)
+        async for page in afan_out_pages(fetch_page, data.Limit, max_workers, 2, last_page):
+            addresses.extend(page)
+        return SearchSettlementsResponse.model_validate({"TotalCount": str(total_count), "Addresses": addresses})
+
+    async def search_settlement_streets(self, data: SearchSettlementStreetsRequest) -> SearchSettlementStreetsResponse:
+        """
+        Онлайн-пошук вулиць у вибраному населеному пункті.
+
+        :param data: Pydantic-модель `SearchSettlementStreetsRequest`, що містить `SettlementRef` населеного пункту.
+        :return: Об'єкт `SearchSettlementStreetsResponse` із результатами пошуку.
+        """
+        result = await self.api.send_request("Address", "searchSettlementStreets", data.model_dump(exclude_unset=True))
+        if not result:
+            return SearchSettlementStreetsResponse(TotalCount="0", Addresses=[])
+        return SearchSettlementStreetsResponse.model_validate(result[0])
@@ -0,0 +1,96 @@
+from typing import Dict, List, Type
+
+from nova_post.models.common import (TimeIntervalRequest, TimeIntervalResponse, CargoTypeResponse, PalletResponse,
+                                     PayerForRedeliveryResponse, PackListResponse, TiresWheelsResponse,
+                                     CargoDescriptionResponse, ServiceTypeResponse,
+                                     OwnershipFormResponse)
+from ..common import M, _validate_reference_list
+
+
+class Common:
+    """
+    Асинхронний адаптер для роботи з довідниками
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self._validated: Dict[str, tuple] = {}
+
+    async def _get_reference_list(self, method: str, model: Type[M]) -> List[M]:
+        result = await self.api.send_request("Common", method, {})
+        return list(_validate_reference_list(self._validated, method, result, model))
+
+    async def get_time_intervals(self, data: TimeIntervalRequest) -> List[TimeIntervalResponse]:
+        """
+        Отримання списку часових інтервалів для замовлення послуги "Часові інтервали".
+
+        :param data: Pydantic-модель `TimeIntervalRequest`, що містить `RecipientCityRef` для фільтрації за містом.
+        :return: Список об'єктів `TimeIntervalResponse` із часовими інтервалами.
+        """
+        result = await self.api.send_request("Common", "getTimeIntervals", data.model_dump(exclude_unset=True))
+        return [TimeIntervalResponse.model_validate(item) for item in result]
+
+    async def get_cargo_types(self) -> List[CargoTypeResponse]:
+        """
+        Отримання списку типів вантажу.
+
+        :return: Список незмінних об'єктів `CargoTypeResponse`, що містять опис доступних типів вантажу.
+        """
+        return await self._get_reference_list("getCargoTypes", CargoTypeResponse)
+
+    async def get_pallets_list(self) -> List[PalletResponse]:
+        """
+        Отримання списку доступних видів палет.
+
+        :return: Список незмінних об'єктів `PalletResponse`, що містять опис палет.
+        """
+        return await self._get_reference_list("getPalletsList", PalletResponse)
+
+    async def get_types_of_payers_for_redelivery(self) -> List[PayerForRedeliveryResponse]:
+        """
+        Отримання списку типів платників зворотної доставки.
+
+        :return: Список незмінних об'єктів `PayerForRedeliveryResponse`, що містять інформацію про платників
+            зворотної доставки.
+        """
+        return await self._get_reference_list("getTypesOfPayersForRedelivery", PayerForRedeliveryResponse)
+
+    async def get_pack_list(self) -> List[PackListResponse]:
+        """
+        Отримання списку доступних варіантів упаковки.
+
+        :return: Список незмінних об'єктів `PackListResponse`, що містять інформацію про види упаковки.
+        """
+        return await self._get_reference_list("getPackList", PackListResponse)
+
+    async def get_tires_wheels_list(self) -> List[TiresWheelsResponse]:
+        """
+        Отримання списку доступних шин і дисків.
+
+        :return: Список незмінних об'єктів `TiresWheelsResponse`, що містять інформацію про шини та диски.
+        """
+        return await self._get_reference_list("getTiresWheelsList", TiresWheelsResponse)
+
+    async def get_cargo_description_list(self) -> List[CargoDescriptionResponse]:
+        """
+        Отримання списку доступних описів вантажу.
+
+        :return: Список незмінних об'єктів `CargoDescriptionResponse`, що містять інформацію про доступні типи вантажів.
+        """
+        return await self._get_reference_list("getCargoDescriptionList", CargoDescriptionResponse)
+
+    async def get_service_types(self) -> List[ServiceTypeResponse]:
+        """
+        Отримання списку доступних видів технологій доставки.
+
+        :return: Список незмінних об'єктів `ServiceTypeResponse`, що містять інформацію про технології доставки.
+        """
+        return await self._get_reference_list("getServiceTypes", ServiceTypeResponse)
+
+    async def get_ownership_forms_list(self) -> List[OwnershipFormResponse]:
+        """
+        Отримання списку доступних форм власності.
+
+        :return: Список незмінних об'єктів `OwnershipFormResponse`, що містять інформацію про форми власності.
+        """
+        return await self._get_reference_list("getOwnershipFormsList", OwnershipFormResponse)
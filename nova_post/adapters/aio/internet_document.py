@@ -0,0 +1,236 @@
+import asyncio
+from typing import AsyncIterator, List, Union
+
+from ...models.internet_document import (
+    DocumentPriceRequest, DocumentPriceResponse,
+    DocumentDeliveryDateRequest, DocumentDeliveryDateResponse,
+    SaveInternetDocumentRequest, SaveInternetDocumentResponse,
+    UpdateInternetDocumentRequest, UpdateInternetDocumentResponse,
+    DocumentListRequest, DocumentListResponse,
+    DeleteInternetDocumentRequest, DeleteInternetDocumentResponse,
+    GenerateReportRequest, GenerateReportResponse,
+    EWTemplateListRequest, EWTemplateListResponse
+)
+from ...cache import MISSING
+from ...exceptions import NovaPostApiError
+from ...paging import afan_out_pages, aiter_pages, page_filters
+from ..internet_document import _merge_chunks, _split_refs
+
+
+class Internet_document:
+    """
+    Асинхронний адаптер для роботи з експрес-накладними
+    """
+
+    MAX_DOCUMENT_REFS_PER_REQUEST = 100
+
+    def __init__(self, api):
+        self.api = api
+
+    async def get_document_price(self, data: DocumentPriceRequest) -> DocumentPriceResponse:
+        """
+        Розрахунок вартості доставки.
+
+        Якщо в клієнта задано `quote_cache`, запит нормалізується його політикою (вага до тарифного порогу,
+        вартість до діапазону), а котирування повертається з кешу до кінця тарифного дня.
+
+        :param data: Pydantic-модель `GetDocumentPriceRequest`, що містить параметри відправлення.
+        :return: Об'єкт `DocumentPriceResponse` із розрахованою вартістю доставки.
+        """
+        quotes = self.api.quote_cache
+        if quotes is None:
+            result = await self.api.send_request("InternetDocument", "getDocumentPrice",
+                                                 data.model_dump(exclude_unset=True))
+            return DocumentPriceResponse.model_validate(result[0])
+
+        key, properties, quote = quotes.lookup(data)
+        if quote is MISSING:
+            quote = (await self.api.send_request("InternetDocument", "getDocumentPrice", properties))[0]
+            quotes.store(key, quote)
+        return DocumentPriceResponse.model_validate(quote)
+
+    async def get_document_delivery_date(self, data: DocumentDeliveryDateRequest) -> DocumentDeliveryDateResponse:
+        """
+        Отримання прогнозованої дати доставки.
+
+        :param data: Pydantic-модель `GetDocumentDeliveryDateRequest`, що містить дані про відправлення.
+        :return: Об'єкт `DocumentDeliveryDateResponse` з орієнтовною датою доставки.
+        """
+        result = await self.api.send_request("InternetDocument", "getDocumentDeliveryDate",
+                                             data.model_dump(exclude_unset=True))
+        return DocumentDeliveryDateResponse.model_validate(result[0])
+
+    async def save_internet_document(self, data: SaveInternetDocumentRequest) -> SaveInternetDocumentResponse:
+        """
+        Створення експрес-накладної.
+
+        :param data: Pydantic-модель `SaveInternetDocumentRequest`, що містить інформацію про вантаж.
+        :return: Об'єкт `SaveInternetDocumentResponse` із деталями створеної накладної.
+        """
+        result = await self.api.send_request("InternetDocument", "save", data.model_dump(exclude_unset=True))
+        return SaveInternetDocumentResponse.model_validate(result[0])
+
+    async def update_internet_document(self, data: UpdateInternetDocumentRequest) -> UpdateInternetDocumentResponse:
+        """
+        Оновлення даних експрес-накладної.
+
+        :param data: Pydantic-модель `UpdateInternetDocumentRequest`, що містить оновлені параметри накладної.
+        :return: Об'єкт `UpdateInternetDocumentResponse` із підтвердженням оновлення.
+        """
+        result = await self.api.send_request("InternetDocument", "update", data.model_dump(exclude_unset=True))
+        return UpdateInternetDocumentResponse.model_validate(result[0])
+
+    async def get_document_list(self, data: DocumentListRequest) -> List[DocumentListResponse]:
+        """
+        Отримання списку всіх експрес-накладних.
+
+        :param data: Pydantic-модель `GetDocumentListRequest`, що містить параметри фільтрації.
+        :return: Список об'єктів `DocumentListResponse` із деталями накладних.
+        """
+        result = await self.api.send_request("InternetDocument", "getDocumentList", data.model_dump(exclude_unset=True))
+        return [DocumentListResponse.model_validate(item) for item in result]
+
+    async def iter_document_list(self, data: DocumentListRequest, prefetch: bool = True,
+                                 use_cache: bool = True) -> AsyncIterator[DocumentListResponse]:
+        """
+        Потокове читання експрес-накладних: наступна сторінка запитується конкурентно, поки обробляється поточна.
+
+        :param data: Pydantic-модель `DocumentListRequest` з фільтрами; `Page` задає першу сторінку.
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :param use_cache: Читати сторінки через кеш відповідей (див. `NovaPostApi.send_request`).
+        :return: Ітератор об'єктів `DocumentListResponse`.
+        """
+        filters, first_page = page_filters(data)
+
+        async def fetch_page(page: int) -> list:
+            return await self.api.send_request("InternetDocument", "getDocumentList",
+                                               dict(filters, GetFullList=0, Page=page), use_cache=use_cache)
+
+        async for page in aiter_pages(fetch_page, None, first_page, prefetch):
+            for item in page:
+                yield DocumentListResponse.model_validate(item)
+
+    async def get_all_documents(self, data: DocumentListRequest, max_workers: int = 4) -> List[DocumentListResponse]:
+        """
+        Отримання всіх експрес-накладних за період з конкурентним завантаженням сторінок.
+
+        Кількість сторінок заздалегідь невідома, тому сторінки запитуються наперед (не більше `max_workers`
+        одночасно), доки не повернеться порожня. Результат — у порядку сторінок.
+
+        :param data: Pydantic-модель `DocumentListRequest` з фільтрами; `Page` задає першу сторінку.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Список усіх об'єктів `DocumentListResponse`.
+        """
+        filters, first_page = page_filters(data)
+
+        async def fetch_page(page: int) -> list:
+            return await self.api.send_request("InternetDocument", "getDocumentList",
+                                               dict(filters, GetFullList=0, Page=page))
+
+        documents: List[DocumentListResponse] = []
+        async for page in afan_out_pages(fetch_page, None, max_workers, first_page):
+            documents.extend(DocumentListResponse.model_validate(item) for item in page)
+        return documents
+
+    async def delete_internet_document(self, data: DeleteInternetDocumentRequest) -> DeleteInternetDocumentResponse:
+        """
+        Видалення експрес-накладної.
+
+        :param data: Pydantic-модель `DeleteInternetDocumentRequest`, що містить `Ref` накладної для видалення.
+        :return: Об'єкт `DeleteInternetDocumentResponse`, що підтверджує успішне видалення.
+        """
+        result = await self.api.send_request("InternetDocument", "delete", data.model_dump(exclude_unset=True))
+        return DeleteInternetDocumentResponse.model_validate(result[0])
+
+    async def generate_report(self, data: GenerateReportRequest) -> GenerateReportResponse:
+        """
+        Формування звіту за накладними.
+
+        :param data: Pydantic-модель `GenerateReportRequest`, що містить параметри звіту.
+        :return: Об'єкт `GenerateReportResponse` із згенерованим звітом.
+        """
+        result = await self.api.send_request("InternetDocument", "generateReport", data.model_dump(exclude_unset=True))
+        return GenerateReportResponse.model_validate(result[0])
+
+    async def delete_internet_documents(self, data: DeleteInternetDocumentRequest,
+                                        chunk_size: int = MAX_DOCUMENT_REFS_PER_REQUEST,
+                                        max_workers: int = 4) -> List[DeleteInternetDocumentResponse]:
+        """
+        Пакетне видалення експрес-накладних.
+
+        `DocumentRefs` довільної довжини розбиваються на фрагменти по `chunk_size` (не більше ліміту API
+        на один виклик `delete`), фрагменти надсилаються конкурентно, відповіді всіх фрагментів об'єднуються.
+
+        :param data: Pydantic-модель `DeleteInternetDocumentRequest`; повторні `Ref` відкидаються.
+        :param chunk_size: Кількість накладних в одному запиті до API.
+        :param max_workers: Максимальна кількість одночасних запитів.
+        :return: Список `DeleteInternetDocumentResponse` для всіх видалених накладних.
+        :raises NovaPostBatchError: Частина фрагментів завершилася помилкою; `results` містить відповіді
+            успішних фрагментів, `failed` — `Ref` з неуспішних.
+        """
+        requests = _split_refs(data, chunk_size, self.MAX_DOCUMENT_REFS_PER_REQUEST)
+        results = await self._send_chunks("delete", requests, max_workers)
+        return _merge_chunks(requests, results, DeleteInternetDocumentResponse)
+
+    async def generate_reports(self, data: GenerateReportRequest, chunk_size: int = MAX_DOCUMENT_REFS_PER_REQUEST,
+                               max_workers: int = 4) -> List[GenerateReportResponse]:
+        """
+        Пакетне формування звітів за накладними.
+
+        Працює як `delete_internet_documents`: `DocumentRefs` розбиваються на фрагменти з тими самими
+        `Type` і `DateTime`, відповіді всіх фрагментів об'єднуються; помилки фрагментів — так само через
+        `NovaPostBatchError`.
+
+        :param data: Pydantic-модель `GenerateReportRequest`; повторні `Ref` відкидаються.
+        :param chunk_size: Кількість накладних в одному запиті до API.
+        :param max_workers: Максимальна кількість одночасних запитів.
+        :return: Список `GenerateReportResponse` для всіх накладних звіту.
+        """
+        requests = _split_refs(data, chunk_size, self.MAX_DOCUMENT_REFS_PER_REQUEST)
+        results = await self._send_chunks("generateReport", requests, max_workers)
+        return _merge_chunks(requests, results, GenerateReportResponse)
+
+    async def _send_chunks(self, method: str, requests: List[dict],
+                           max_workers: int) -> List[Union[list, NovaPostApiError]]:
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def send(properties: dict) -> Union[list, NovaPostApiError]:
+            async with semaphore:
+                try:
+                    return await self.api.send_request("InternetDocument", method, properties)
+                except NovaPostApiError as error:
+                    return error
+
+        return list(await asyncio.gather(*(send(properties) for properties in requests)))
+
+    async def get_ew_template_list(self, data: EWTemplateListRequest) -> List[EWTemplateListResponse]:
+        """
+        Отримання списку документів у заявці на виклик кур’єра.
+
+        :param data: Pydantic-модель `GetEWTemplateListRequest`, що містить параметри запиту.
+        :return: Список об'єктів `EWTemplateListResponse` із деталями документів.
+        """
+        result = await self.api.send_request("InternetDocument", "getEWTemplateList",
+                                             data.model_dump(exclude_unset=True))
+        return [EWTemplateListResponse.model_validate(item) for item in result]
+
+    async def iter_ew_template_list(self, data: EWTemplateListRequest,
+                                    prefetch: bool = True) -> AsyncIterator[EWTemplateListResponse]:
+        """
+        Потокове читання документів у заявці на виклик кур’єра: наступна сторінка запитується конкурентно,
+        поки обробляється поточна.
+
+        :param data: Pydantic-модель `EWTemplateListRequest` з фільтрами; `Page` задає першу сторінку.
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :return: Ітератор об'єктів `EWTemplateListResponse`.
+        """
+        filters, first_page = page_filters(data)
+        page_size = data.Limit
+
+        async def fetch_page(page: int) -> list:
+            return await self.api.send_request("InternetDocument", "getEWTemplateList",
+                                               dict(filters, Page=page, Limit=page_size))
+
+        async for page in aiter_pages(fetch_page, page_size, first_page, prefetch):
+            for item in page:
+                yield EWTemplateListResponse.model_validate(item)
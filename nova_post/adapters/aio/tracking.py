@@ -0,0 +1,61 @@
+import asyncio
+from typing import Iterable, List, Union
+
+from ...exceptions import NovaPostApiError
+
+from ...models.tracking import TrackingRequest, TrackingResponse, TrackingBulkResponse
+from ..tracking import _split_documents, _merge_tracking_results
+
+
+class Tracking:
+    """
+    Асинхронний адаптер для відстеження відправлення
+    """
+
+    MAX_DOCUMENTS_PER_REQUEST = 100
+
+    def __init__(self, api):
+        self.api = api
+
+    async def track_parcel(self, data: TrackingRequest) -> TrackingResponse:
+        """
+        Відстеження посилки за номером експрес-накладної та (опціонально) номером телефону.
+
+        :param data: Pydantic-модель `TrackingRequest`, що містить номер відправлення та (необов'язково) номер телефону.
+        :return: Об'єкт `TrackingResponse`, що містить інформацію про статус відправлення.
+        """
+        properties = {
+            "Documents": [data.model_dump(exclude_unset=True)]
+        }
+
+        result = await self.api.send_request("TrackingDocument", "getStatusDocuments", properties)
+        return TrackingResponse.model_validate(result[0])
+
+    async def track_parcels(self, data: Iterable[TrackingRequest], chunk_size: int = MAX_DOCUMENTS_PER_REQUEST,
+                            max_workers: int = 4) -> TrackingBulkResponse:
+        """
+        Пакетне відстеження посилок.
+
+        Запити розбиваються на фрагменти по `chunk_size` накладних (не більше ліміту API на один виклик
+        `getStatusDocuments`), фрагменти надсилаються конкурентно. Помилка одного фрагмента не скасовує
+        результати інших: номери накладних із нього повертаються в `Failed`.
+
+        :param data: Ітерована послідовність `TrackingRequest`; повторні номери накладних відкидаються.
+        :param chunk_size: Кількість накладних в одному запиті до API.
+        :param max_workers: Максимальна кількість одночасних запитів.
+        :return: Об'єкт `TrackingBulkResponse` з відповідями за номерами накладних, списком номерів без відповіді
+            та номерами, запит яких завершився помилкою.
+        """
+        chunks = _split_documents(data, chunk_size, self.MAX_DOCUMENTS_PER_REQUEST)
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def fetch(chunk: List[dict]) -> Union[List[dict], NovaPostApiError]:
+            async with semaphore:
+                try:
+                    return await self.api.send_request("TrackingDocument", "getStatusDocuments",
+                                                       {"Documents": chunk})
+                except NovaPostApiError as error:
+                    return error
+
+        results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return _merge_tracking_results(chunks, list(results))
@@ -1,10 +1,31 @@
-from typing import List
+from typing import Dict, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
 
 from nova_post.models.common import (TimeIntervalRequest, TimeIntervalResponse, CargoTypeResponse, PalletResponse,
                                      PayerForRedeliveryResponse, PackListResponse, TiresWheelsResponse,
                                      CargoDescriptionResponse, ServiceTypeResponse,
                                      OwnershipFormResponse)
 
+M = TypeVar("M", bound=BaseModel)
+
+
+def _validate_reference_list(validated: Dict[str, tuple], method: str, result: list,
+                             model: Type[M]) -> Tuple[M, ...]:
+    """
+    Валідація довідника з повторним використанням уже створених моделей.
+
+    Кеш відповідей у пам'яті повертає той самий об'єкт `data` для повторних запитів, тому якщо `result`
+    збігається з попередньою відповіддю, повертається вже створений кортеж моделей без повторної валідації.
+    Адаптери віддають його копію-список: моделі спільні (тому незмінні), а сам список належить викликачу.
+    """
+    entry = validated.get(method)
+    if entry is not None and entry[0] is result:
+        return entry[1]
+    models = tuple(model.model_validate(item) for item in result)
+    validated[method] = (result, models)
+    return models
+
 
 class Common:
     """
@@ -13,6 +34,11 @@ class Common:
 
     def __init__(self, api):
         self.api = api
+        self._validated: Dict[str, tuple] = {}
+
+    def _get_reference_list(self, method: str, model: Type[M]) -> List[M]:
+        result = self.api.send_request("Common", method, {})
+        return list(_validate_reference_list(self._validated, method, result, model))
 
     def get_time_intervals(self, data: TimeIntervalRequest) -> List[TimeIntervalResponse]:
         """
@@ -28,70 +54,63 @@ class Common:
         """
         Отримання списку типів вантажу.
 
-        :return: Список об'єктів `CargoTypeResponse`, що містять опис доступних типів вантажу.
+        :return: Список незмінних об'єктів `CargoTypeResponse`, що містять опис доступних типів вантажу.
         """
-        result = self.api.send_request("Common", "getCargoTypes", {})
-        return [CargoTypeResponse.model_validate(item) for item in result]
+        return self._get_reference_list("getCargoTypes", CargoTypeResponse)
 
     def get_pallets_list(self) -> List[PalletResponse]:
         """
         Отримання списку доступних видів палет.
 
-        :return: Список об'єктів `PalletResponse`, що містять опис палет.
+        :return: Список незмінних об'єктів `PalletResponse`, що містять опис палет.
         """
-        result = self.api.send_request("Common", "getPalletsList", {})
-        return [PalletResponse.model_validate(item) for item in result]
+        return self._get_reference_list("getPalletsList", PalletResponse)
 
     def get_types_of_payers_for_redelivery(self) -> List[PayerForRedeliveryResponse]:
         """
         Отримання списку типів платників зворотної доставки.
 
-        :return: Список об'єктів `PayerForRedeliveryResponse`, що містять інформацію про платників зворотної доставки.
+        :return: Список незмінних об'єктів `PayerForRedeliveryResponse`, що містять інформацію про платників
+            зворотної доставки.
         """
-        result = self.api.send_request("Common", "getTypesOfPayersForRedelivery", {})
-        return [PayerForRedeliveryResponse.model_validate(item) for item in result]
+        return self._get_reference_list("getTypesOfPayersForRedelivery", PayerForRedeliveryResponse)
 
     def get_pack_list(self) -> List[PackListResponse]:
         """
         Отримання списку доступних варіантів упаковки.
 
-        :return: Список об'єктів `PackListResponse`, що містять інформацію про види упаковки.
+        :return: Список незмінних об'єктів `PackListResponse`, що містять інформацію про види упаковки.
         """
-        result = self.api.send_request("Common", "getPackList", {})
-        return [PackListResponse.model_validate(item) for item in result]
+        return self._get_reference_list("getPackList", PackListResponse)
 
     def get_tires_wheels_list(self) -> List[TiresWheelsResponse]:
         """
         Отримання списку доступних шин і дисків.
 
-        :return: Список об'єктів `TiresWheelsResponse`, що містять інформацію про шини та диски.
+        :return: Список незмінних об'єктів `TiresWheelsResponse`, що містять інформацію про шини та диски.
         """
-        result = self.api.send_request("Common", "getTiresWheelsList", {})
-        return [TiresWheelsResponse.model_validate(item) for item in result]
+        return self._get_reference_list("getTiresWheelsList", TiresWheelsResponse)
 
     def get_cargo_description_list(self) -> List[CargoDescriptionResponse]:
         """
         Отримання списку доступних описів вантажу.
 
-        :return: Список об'єктів `CargoDescriptionResponse`, що містять інформацію про доступні типи вантажів.
+        :return: Список незмінних об'єктів `CargoDescriptionResponse`, що містять інформацію про доступні типи вантажів.
         """
-        result = self.api.send_request("Common", "getCargoDescriptionList", {})
-        return [CargoDescriptionResponse.model_validate(item) for item in result]
+        return self._get_reference_list("getCargoDescriptionList", CargoDescriptionResponse)
 
     def get_service_types(self) -> List[ServiceTypeResponse]:
         """
         Отримання списку доступних видів технологій доставки.
 
-        :return: Список об'єктів `ServiceTypeResponse`, що містять інформацію про технології доставки.
+        :return: Список незмінних об'єктів `ServiceTypeResponse`, що містять інформацію про технології доставки.
         """
-        result = self.api.send_request("Common", "getServiceTypes", {})
-        return [ServiceTypeResponse.model_validate(item) for item in result]
+        return self._get_reference_list("getServiceTypes", ServiceTypeResponse)
 
     def get_ownership_forms_list(self) -> List[OwnershipFormResponse]:
         """
         Отримання списку доступних форм власності.
 
-        :return: Список об'єктів `OwnershipFormResponse`, що містять інформацію про форми власності.
+        :return: Список незмінних об'єктів `OwnershipFormResponse`, що містять інформацію про форми власності.
         """
-        result = self.api.send_request("Common", "getOwnershipFormsList", {})
-        return [OwnershipFormResponse.model_validate(item) for item in result]
+        return self._get_reference_list("getOwnershipFormsList", OwnershipFormResponse)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from ..models.contact_person import (
     ContactPersonRequest,
@@ -10,6 +10,7 @@ from ..models.counterparty import (
     GetCounterpartiesResponse, GetCounterpartiesRequest, DeleteCounterpartiesRequest, CounterpartyAddressResponse,
     CounterpartyAddressRequest, CounterpartyOptionsResponse, CounterpartyOptionsRequest,
 )
+from ..paging import iter_pages, page_filters
 
 
 class Counterparty:
@@ -43,6 +44,24 @@ class Counterparty:
         result = self.api.send_request("Counterparty", "getCounterparties", data.model_dump(exclude_unset=True))
         return [GetCounterpartiesResponse.model_validate(cp) for cp in result]
 
+    def iter_counterparties(self, data: GetCounterpartiesRequest,
+                            prefetch: bool = True) -> Iterator[GetCounterpartiesResponse]:
+        """
+        Потокове читання контрагентів: наступна сторінка завантажується у фоні, поки обробляється поточна.
+
+        :param data: Pydantic-модель `GetCounterpartiesRequest` з фільтрами; `Page` задає першу сторінку.
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :return: Ітератор об'єктів `GetCounterpartiesResponse`.
+        """
+        filters, first_page = page_filters(data)
+
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("Counterparty", "getCounterparties", dict(filters, Page=page))
+
+        for page in iter_pages(fetch_page, None, first_page, prefetch):
+            for item in page:
+                yield GetCounterpartiesResponse.model_validate(item)
+
     def update(self, data: CounterpartyRequest) -> CounterpartyResponse:
         """
         Оновлення даних контрагента.
@@ -94,6 +113,25 @@ class Counterparty:
                                        data.model_dump(exclude_unset=True))
         return [ContactPersonResponse.model_validate(item) for item in result]
 
+    def iter_counterparty_contact_persons(self, data: GetContactPersonRequest,
+                                          prefetch: bool = True) -> Iterator[ContactPersonResponse]:
+        """
+        Потокове читання контактних осіб контрагента: наступна сторінка завантажується у фоні,
+        поки обробляється поточна.
+
+        :param data: Pydantic-модель `GetContactPersonRequest` з фільтрами; `Page` задає першу сторінку.
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :return: Ітератор об'єктів `ContactPersonResponse`.
+        """
+        filters, first_page = page_filters(data)
+
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("Counterparty", "getCounterpartyContactPersons", dict(filters, Page=page))
+
+        for page in iter_pages(fetch_page, None, first_page, prefetch):
+            for item in page:
+                yield ContactPersonResponse.model_validate(item)
+
     def save_contact_person(self, data: ContactPersonRequest) -> ContactPersonResponse:
         """
         Створення контактної особи контрагента.
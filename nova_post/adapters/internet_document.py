@@ -1,4 +1,5 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Union
 
 from ..models.internet_document import (
     DocumentPriceRequest, DocumentPriceResponse,
@@ -10,6 +11,10 @@ from ..models.internet_document import (
     GenerateReportRequest, GenerateReportResponse,
     EWTemplateListRequest, EWTemplateListResponse
 )
+from ..cache import MISSING
+from ..exceptions import NovaPostApiError, NovaPostBatchError
+from ..paging import fan_out_pages, iter_pages, page_filters
+from ..utils import chunked
 
 
 class Internet_document:
@@ -17,6 +22,8 @@ class Internet_document:
     Адаптер для роботи з експрес-накладними
     """
 
+    MAX_DOCUMENT_REFS_PER_REQUEST = 100
+
     def __init__(self, api):
         self.api = api
 
@@ -24,11 +31,22 @@ class Internet_document:
         """
         Розрахунок вартості доставки.
 
+        Якщо в клієнта задано `quote_cache`, запит нормалізується його політикою (вага до тарифного порогу,
+        вартість до діапазону), а котирування повертається з кешу до кінця тарифного дня.
+
         :param data: Pydantic-модель `GetDocumentPriceRequest`, що містить параметри відправлення.
         :return: Об'єкт `DocumentPriceResponse` із розрахованою вартістю доставки.
         """
-        result = self.api.send_request("InternetDocument", "getDocumentPrice", data.model_dump(exclude_unset=True))
-        return DocumentPriceResponse.model_validate(result[0])
+        quotes = self.api.quote_cache
+        if quotes is None:
+            result = self.api.send_request("InternetDocument", "getDocumentPrice", data.model_dump(exclude_unset=True))
+            return DocumentPriceResponse.model_validate(result[0])
+
+        key, properties, quote = quotes.lookup(data)
+        if quote is MISSING:
+            quote = self.api.send_request("InternetDocument", "getDocumentPrice", properties)[0]
+            quotes.store(key, quote)
+        return DocumentPriceResponse.model_validate(quote)
 
     def get_document_delivery_date(self, data: DocumentDeliveryDateRequest) -> DocumentDeliveryDateResponse:
         """
@@ -71,6 +89,48 @@ class Internet_document:
         result = self.api.send_request("InternetDocument", "getDocumentList", data.model_dump(exclude_unset=True))
         return [DocumentListResponse.model_validate(item) for item in result]
 
+    def iter_document_list(self, data: DocumentListRequest, prefetch: bool = True,
+                           use_cache: bool = True) -> Iterator[DocumentListResponse]:
+        """
+        Потокове читання експрес-накладних: наступна сторінка завантажується у фоні, поки обробляється поточна.
+
+        :param data: Pydantic-модель `DocumentListRequest` з фільтрами; `Page` задає першу сторінку.
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :param use_cache: Читати сторінки через кеш відповідей (див. `NovaPostApi.send_request`).
+        :return: Ітератор об'єктів `DocumentListResponse`.
+        """
+        filters, first_page = page_filters(data)
+
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("InternetDocument", "getDocumentList", dict(filters, GetFullList=0, Page=page),
+                                         use_cache=use_cache)
+
+        for page in iter_pages(fetch_page, None, first_page, prefetch):
+            for item in page:
+                yield DocumentListResponse.model_validate(item)
+
+    def get_all_documents(self, data: DocumentListRequest, max_workers: int = 4) -> List[DocumentListResponse]:
+        """
+        Отримання всіх експрес-накладних за період з паралельним завантаженням сторінок.
+
+        Кількість сторінок заздалегідь невідома, тому сторінки запитуються наперед (не більше `max_workers`
+        одночасно), доки не повернеться порожня. Результат — у порядку сторінок.
+
+        :param data: Pydantic-модель `DocumentListRequest` з фільтрами; `Page` задає першу сторінку.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Список усіх об'єктів `DocumentListResponse`.
+        """
+        filters, first_page = page_filters(data)
+
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("InternetDocument", "getDocumentList",
+                                         dict(filters, GetFullList=0, Page=page))
+
+        documents: List[DocumentListResponse] = []
+        for page in fan_out_pages(fetch_page, None, max_workers, first_page):
+            documents.extend(DocumentListResponse.model_validate(item) for item in page)
+        return documents
+
     def delete_internet_document(self, data: DeleteInternetDocumentRequest) -> DeleteInternetDocumentResponse:
         """
         Видалення експрес-накладної.
@@ -91,6 +151,57 @@ class Internet_document:
         result = self.api.send_request("InternetDocument", "generateReport", data.model_dump(exclude_unset=True))
         return GenerateReportResponse.model_validate(result[0])
 
+    def delete_internet_documents(self, data: DeleteInternetDocumentRequest,
+                                  chunk_size: int = MAX_DOCUMENT_REFS_PER_REQUEST,
+                                  max_workers: int = 4) -> List[DeleteInternetDocumentResponse]:
+        """
+        Пакетне видалення експрес-накладних.
+
+        `DocumentRefs` довільної довжини розбиваються на фрагменти по `chunk_size` (не більше ліміту API
+        на один виклик `delete`), фрагменти надсилаються паралельно, відповіді всіх фрагментів об'єднуються.
+
+        :param data: Pydantic-модель `DeleteInternetDocumentRequest`; повторні `Ref` відкидаються.
+        :param chunk_size: Кількість накладних в одному запиті до API.
+        :param max_workers: Максимальна кількість одночасних запитів.
+        :return: Список `DeleteInternetDocumentResponse` для всіх видалених накладних.
+        :raises NovaPostBatchError: Частина фрагментів завершилася помилкою; `results` містить відповіді
+            успішних фрагментів, `failed` — `Ref` з неуспішних.
+        """
+        requests = _split_refs(data, chunk_size, self.MAX_DOCUMENT_REFS_PER_REQUEST)
+        results = self._send_chunks("delete", requests, max_workers)
+        return _merge_chunks(requests, results, DeleteInternetDocumentResponse)
+
+    def generate_reports(self, data: GenerateReportRequest, chunk_size: int = MAX_DOCUMENT_REFS_PER_REQUEST,
+                         max_workers: int = 4) -> List[GenerateReportResponse]:
+        """
+        Пакетне формування звітів за накладними.
+
+        Працює як `delete_internet_documents`: `DocumentRefs` розбиваються на фрагменти з тими самими
+        `Type` і `DateTime`, відповіді всіх фрагментів об'єднуються; помилки фрагментів — так само через
+        `NovaPostBatchError`.
+
+        :param data: Pydantic-модель `GenerateReportRequest`; повторні `Ref` відкидаються.
+        :param chunk_size: Кількість накладних в одному запиті до API.
+        :param max_workers: Максимальна кількість одночасних запитів.
+        :return: Список `GenerateReportResponse` для всіх накладних звіту.
+        """
+        requests = _split_refs(data, chunk_size, self.MAX_DOCUMENT_REFS_PER_REQUEST)
+        results = self._send_chunks("generateReport", requests, max_workers)
+        return _merge_chunks(requests, results, GenerateReportResponse)
+
+    def _send_chunks(self, method: str, requests: List[dict],
+                     max_workers: int) -> List[Union[list, NovaPostApiError]]:
+        def send(properties: dict) -> Union[list, NovaPostApiError]:
+            try:
+                return self.api.send_request("InternetDocument", method, properties)
+            except NovaPostApiError as error:
+                return error
+
+        if len(requests) <= 1 or max_workers <= 1:
+            return [send(properties) for properties in requests]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+            return list(executor.map(send, requests))
+
     def get_ew_template_list(self, data: EWTemplateListRequest) -> List[EWTemplateListResponse]:
         """
         Отримання списку документів у заявці на виклик кур’єра.
@@ -100,3 +211,49 @@ class Internet_document:
         """
         result = self.api.send_request("InternetDocument", "getEWTemplateList", data.model_dump(exclude_unset=True))
         return [EWTemplateListResponse.model_validate(item) for item in result]
+
+    def iter_ew_template_list(self, data: EWTemplateListRequest,
+                              prefetch: bool = True) -> Iterator[EWTemplateListResponse]:
+        """
+        Потокове читання документів у заявці на виклик кур’єра: наступна сторінка завантажується у фоні,
+        поки обробляється поточна.
+
+        :param data: Pydantic-модель `EWTemplateListRequest` з фільтрами; `Page` задає першу сторінку.
+        :param prefetch: Завантажувати наступну сторінку заздалегідь.
+        :return: Ітератор об'єктів `EWTemplateListResponse`.
+        """
+        filters, first_page = page_filters(data)
+        page_size = data.Limit
+
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("InternetDocument", "getEWTemplateList",
+                                         dict(filters, Page=page, Limit=page_size))
+
+        for page in iter_pages(fetch_page, page_size, first_page, prefetch):
+            for item in page:
+                yield EWTemplateListResponse.model_validate(item)
+
+
+def _split_refs(data, chunk_size: int, limit: int) -> List[dict]:
+    """
+    Параметри запитів для фрагментів `DocumentRefs`: решта полів запиту повторюється в кожному фрагменті.
+    """
+    properties = data.model_dump(exclude_unset=True, exclude={"DocumentRefs"})
+    refs = list(dict.fromkeys(data.DocumentRefs or []))
+    return [dict(properties, DocumentRefs=chunk) for chunk in chunked(refs, min(chunk_size, limit))]
+
+
+def _merge_chunks(requests: List[dict], results: List[Union[list, NovaPostApiError]], model) -> list:
+    """
+    Об'єднання відповідей фрагментів; якщо хоч один фрагмент завершився помилкою, відповіді решти не
+    відкидаються, а передаються разом із неуспішними `Ref` у `NovaPostBatchError`.
+    """
+    merged, failed = [], {}
+    for properties, result in zip(requests, results):
+        if isinstance(result, NovaPostApiError):
+            failed.update((ref, str(result)) for ref in properties["DocumentRefs"])
+            continue
+        merged.extend(model.model_validate(item) for item in result or [])
+    if failed:
+        raise NovaPostBatchError(merged, failed)
+    return merged
@@ -1,4 +1,10 @@
-from ..models.tracking import TrackingRequest, TrackingResponse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Union
+
+from ..exceptions import NovaPostApiError
+
+from ..models.tracking import TrackingRequest, TrackingResponse, TrackingBulkResponse
+from ..utils import chunked
 
 
 class Tracking:
@@ -6,6 +12,8 @@ class Tracking:
     Адапртер для відстеження відправлення
     """
 
+    MAX_DOCUMENTS_PER_REQUEST = 100
+
     def __init__(self, api):
         self.api = api
 
@@ -22,3 +30,58 @@ class Tracking:
 
         result = self.api.send_request("TrackingDocument", "getStatusDocuments", properties)
         return TrackingResponse.model_validate(result[0])
+
+    def track_parcels(self, data: Iterable[TrackingRequest], chunk_size: int = MAX_DOCUMENTS_PER_REQUEST,
+                      max_workers: int = 4) -> TrackingBulkResponse:
+        """
+        Пакетне відстеження посилок.
+
+        Запити розбиваються на фрагменти по `chunk_size` накладних (не більше ліміту API на один виклик
+        `getStatusDocuments`), фрагменти надсилаються паралельно. Помилка одного фрагмента не скасовує
+        результати інших: номери накладних із нього повертаються в `Failed`.
+
+        :param data: Ітерована послідовність `TrackingRequest`; повторні номери накладних відкидаються.
+        :param chunk_size: Кількість накладних в одному запиті до API.
+        :param max_workers: Максимальна кількість одночасних запитів.
+        :return: Об'єкт `TrackingBulkResponse` з відповідями за номерами накладних, списком номерів без відповіді
+            та номерами, запит яких завершився помилкою.
+        """
+        chunks = _split_documents(data, chunk_size, self.MAX_DOCUMENTS_PER_REQUEST)
+
+        def fetch(chunk: List[dict]) -> Union[List[dict], NovaPostApiError]:
+            try:
+                return self.api.send_request("TrackingDocument", "getStatusDocuments", {"Documents": chunk})
+            except NovaPostApiError as error:
+                return error
+
+        if len(chunks) <= 1 or max_workers <= 1:
+            results = [fetch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                results = list(executor.map(fetch, chunks))
+
+        return _merge_tracking_results(chunks, results)
+
+
+def _split_documents(data: Iterable[TrackingRequest], chunk_size: int, limit: int) -> List[List[dict]]:
+    documents: Dict[str, dict] = {}
+    for item in data:
+        documents.setdefault(item.DocumentNumber, item.model_dump(exclude_unset=True))
+    return list(chunked(documents.values(), min(chunk_size, limit)))
+
+
+def _merge_tracking_results(chunks: List[List[dict]],
+                            results: List[Union[List[dict], NovaPostApiError]]) -> TrackingBulkResponse:
+    found: Dict[str, TrackingResponse] = {}
+    failed: Dict[str, str] = {}
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, NovaPostApiError):
+            failed.update((doc["DocumentNumber"], str(result)) for doc in chunk)
+            continue
+        for item in result or []:
+            response = TrackingResponse.model_validate(item)
+            found[response.Number] = response
+
+    missing = [doc["DocumentNumber"] for chunk in chunks for doc in chunk
+               if doc["DocumentNumber"] not in found and doc["DocumentNumber"] not in failed]
+    return TrackingBulkResponse(Documents=found, Missing=missing, Failed=failed)
@@ -1,49 +1,149 @@
 import requests
 import importlib
-from .exceptions import NovaPostApiError
-from .logger import logger
-from fake_useragent import UserAgent
-ua = UserAgent()
+import logging
+import time
+from typing import TYPE_CHECKING, Optional
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+from .exceptions import NovaPostApiError, NovaPostTimeoutError, NovaPostConnectionError, NovaPostHttpError
+from .cache import MISSING, ResponseCache, cache_key
+from .logger import logger, RedactedPayload
+from .rate_limit import RateLimiter
+from .retry import READ_METHOD_PREFIXES, RetryPolicy
+from .singleflight import SingleFlight
+from .transport import PooledHTTPAdapter
+from .user_agent import UserAgentPolicy, resolve_user_agent
 
+if TYPE_CHECKING:
+    # Лише для анотацій: quotes тягне моделі накладних і zoneinfo, що помітно сповільнює імпорт клієнта
+    from .quotes import QuoteCache
 
-class NovaPostApi:
+
+class BaseNovaPostApi:
+    """
+    Спільна частина синхронного та асинхронного клієнтів.
+
+    Формує тіло запиту, розбирає відповідь API та ліниво завантажує адаптери з пакета `ADAPTERS_PACKAGE`.
+
+    :param api_key: API-ключ Нової Пошти.
+    :param user_agent: Значення заголовка User-Agent або політика, що його повертає
+        (наприклад, `RotatingUserAgent`). За замовчуванням — статичний заголовок SDK.
+    :param retry_policy: Політика повторних спроб `RetryPolicy`; за замовчуванням кожен запит виконується один раз.
+    :param rate_limiter: Обмежувач частоти запитів `RateLimiter`; може бути спільним для кількох клієнтів.
+    :param cache: Кеш відповідей `ResponseCache` для методів із заданим TTL; за замовчуванням вимкнено.
+    :param coalesce: Об'єднувати одночасні однакові запити методів читання (`get*`, `search*`) в один:
+        учасники отримують спільний результат. Ключ — канонічний `(modelName, calledMethod, methodProperties)`.
+    :param quote_cache: Кеш котирувань `QuoteCache` для `internet_document.get_document_price`;
+        за замовчуванням вимкнено.
+    """
     API_URL = "https://api.novaposhta.ua/v2.0/json/"
     DEFAULT_TIMEOUT = 10
+    ADAPTERS_PACKAGE = ".adapters"
+    SINGLE_FLIGHT = SingleFlight
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, user_agent: Optional[UserAgentPolicy] = None,
+                 retry_policy: Optional[RetryPolicy] = None, rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[ResponseCache] = None, coalesce: bool = True,
+                 quote_cache: Optional["QuoteCache"] = None):
         self.api_key = api_key
-        self.session = requests.Session()
+        self.user_agent = resolve_user_agent(user_agent)
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.single_flight = self.SINGLE_FLIGHT() if coalesce else None
+        self.quote_cache = quote_cache
         self._adapters_cache = {}
 
-    def send_request(self, model: str, method: str, properties: dict, timeout: int = DEFAULT_TIMEOUT):
-        headers = {
-            "User-Agent": ua.random,
+    def _build_headers(self) -> dict:
+        return {
+            "User-Agent": self.user_agent(),
         }
 
-        payload = {
+    def _build_payload(self, model: str, method: str, properties: dict) -> dict:
+        return {
             "apiKey": self.api_key,
             "modelName": model,
             "calledMethod": method,
             "methodProperties": properties
         }
 
-        logger.info(f"Запрос: {payload}")
+    @staticmethod
+    def _log_request(payload: dict):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Запрос %s/%s: %s", payload["modelName"], payload["calledMethod"], RedactedPayload(payload))
 
-        try:
-            response = self.session.post(self.API_URL, json=payload, timeout=timeout, headers=headers)
-            result = response.json()
-        except requests.Timeout:
-            logger.error(f"Ошибка: запрос к {model}/{method} превысил {timeout} секунд")
-            raise NovaPostApiError(f"Таймаут запроса: {timeout} секунд")
-        except ValueError as e:
-            logger.error("Ошибка JSON: Некорректный ответ")
-            raise NovaPostApiError("Некорректный JSON ответ API")
+    @staticmethod
+    def _log_response(model: str, method: str, started: float, error: Optional[NovaPostApiError] = None):
+        # Єдине місце логування відповіді API: успіх — INFO, помилка HTTP чи API — ERROR разом із текстом помилки
+        success = error is None
+        level = logging.INFO if success else logging.ERROR
+        if logger.isEnabledFor(level):
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            extra = {
+                "nova_post_model": model,
+                "nova_post_method": method,
+                "nova_post_elapsed_ms": elapsed_ms,
+                "nova_post_success": success,
+            }
+            if success:
+                logger.log(level, "Ответ %s/%s за %.1f мс", model, method, elapsed_ms, extra=extra)
+            else:
+                logger.log(level, "Ответ %s/%s за %.1f мс: %s", model, method, elapsed_ms, error, extra=extra)
+
+    def _cache_lookup(self, model: str, method: str, properties: dict):
+        """
+        Пошук відповіді в кеші: повертає `(ключ, TTL, значення)`; значення — `MISSING`, якщо відповіді
+        немає або метод не кешується (тоді TTL дорівнює `None`).
+        """
+        ttl = self.cache.ttl_for(model, method) if self.cache is not None else None
+        if ttl is None:
+            return None, None, MISSING
+        key = cache_key(model, method, properties)
+        return key, ttl, self.cache.get(key)
+
+    def _flight_key(self, model: str, method: str, properties: dict, key: Optional[str]) -> Optional[str]:
+        """
+        Ключ для об'єднання однакових запитів або `None`, якщо об'єднання вимкнено чи метод не є методом читання.
+        """
+        if self.single_flight is None or not method.startswith(READ_METHOD_PREFIXES):
+            return None
+        return key if key is not None else cache_key(model, method, properties)
+
+    def _retry_policy_for(self, model: str, method: str) -> Optional[RetryPolicy]:
+        policy = self.retry_policy
+        return policy if policy is not None and policy.applies_to(model, method) else None
 
+    def _rate_limit_delay(self, model: str, method: str) -> float:
+        if self.rate_limiter is None:
+            return 0.0
+        delay = self.rate_limiter.reserve(self.api_key, model, method)
+        if delay > 0:
+            logger.debug("Ограничение частоты: запрос %s/%s ждёт %.3f с", model, method, delay)
+        return delay
+
+    @staticmethod
+    def _attempt_timeout(timeout: float, deadline: Optional[float]) -> float:
+        if deadline is None:
+            return timeout
+        return max(min(timeout, deadline - time.monotonic()), 0.001)
+
+    @staticmethod
+    def _log_retry(model: str, method: str, attempt: int, error: NovaPostApiError, delay: float):
+        logger.warning("Повтор запроса %s/%s после попытки %d через %.2f с: %s", model, method, attempt, delay, error)
+
+    def _check_status(self, model: str, method: str, started: float, status_code: int):
+        if status_code in self.RETRYABLE_STATUS_CODES:
+            error = NovaPostHttpError(status_code)
+            self._log_response(model, method, started, error)
+            raise error
+
+    def _unwrap_result(self, model: str, method: str, started: float, result: dict):
         if not result.get('success'):
-            errors = result.get('errors', ["Неизвестная ошибка API"])
-            logger.error(f"Ошибка API: {errors}")
-            raise NovaPostApiError(errors)
+            error = NovaPostApiError(result.get('errors', ["Неизвестная ошибка API"]))
+            self._log_response(model, method, started, error)
+            raise error
 
+        self._log_response(model, method, started)
         return result['data']
 
     def __getattr__(self, adapter_name: str):
@@ -51,7 +151,7 @@ class NovaPostApi:
             return self._adapters_cache[adapter_name]
 
         try:
-            module = importlib.import_module(f".adapters.{adapter_name}", package=__package__)
+            module = importlib.import_module(f"{self.ADAPTERS_PACKAGE}.{adapter_name}", package=__package__)
         except ModuleNotFoundError as e:
             raise AttributeError(f"Адаптер '{adapter_name}' не найден.") from e
 
@@ -64,3 +164,144 @@ class NovaPostApi:
         adapter_instance = adapter_class(self)
         self._adapters_cache[adapter_name] = adapter_instance
         return adapter_instance
+
+
+class NovaPostApi(BaseNovaPostApi):
+    """
+    Синхронний клієнт API Нової Пошти на базі `requests.Session`.
+
+    :param api_key: API-ключ Нової Пошти.
+    :param user_agent: Значення заголовка User-Agent або політика, що його повертає.
+    :param retry_policy: Політика повторних спроб `RetryPolicy` для тимчасових збоїв.
+    :param rate_limiter: Обмежувач частоти запитів `RateLimiter`.
+    :param cache: Кеш відповідей `ResponseCache`.
+    :param coalesce: Об'єднувати одночасні однакові запити читання з різних потоків (`SingleFlight`).
+    :param quote_cache: Кеш котирувань вартості доставки `QuoteCache`.
+    :param pool_connections: Кількість пулів з'єднань (хостів), що зберігаються в кеші.
+    :param pool_maxsize: Максимальна кількість з'єднань з API, що зберігаються для повторного використання.
+        Варто виставляти не меншою за кількість потоків, що одночасно користуються клієнтом.
+    :param pool_block: Чекати на вільне з'єднання замість відкриття тимчасового понад `pool_maxsize`.
+    :param keep_alive: Зберігати з'єднання відкритими між запитами (`False` надсилає `Connection: close`).
+    :param session: Власна `requests.Session`; якщо не задано, створюється нова.
+    :param adapter: Власний транспортний адаптер для `https://`; за замовчуванням `PooledHTTPAdapter`
+        з наведеними вище параметрами пулу. Для переданої `session` без `adapter` монтування не виконується.
+    """
+
+    def __init__(self, api_key: str, user_agent: Optional[UserAgentPolicy] = None,
+                 retry_policy: Optional[RetryPolicy] = None, rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[ResponseCache] = None, *, coalesce: bool = True,
+                 quote_cache: Optional["QuoteCache"] = None,
+                 pool_connections: int = DEFAULT_POOLSIZE, pool_maxsize: int = DEFAULT_POOLSIZE,
+                 pool_block: bool = False, keep_alive: bool = True,
+                 session: Optional[requests.Session] = None, adapter: Optional[HTTPAdapter] = None):
+        super().__init__(api_key, user_agent, retry_policy, rate_limiter, cache, coalesce, quote_cache)
+        self.session = session if session is not None else requests.Session()
+
+        if adapter is None and session is None:
+            adapter = PooledHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                        pool_block=pool_block)
+        if adapter is not None:
+            self.session.mount("https://", adapter)
+        self.adapter = self.session.get_adapter(self.API_URL)
+
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def connection_stats(self) -> dict:
+        """
+        Статистика пулу з'єднань: кількість запитів, створених і повторно використаних з'єднань
+        та з'єднань, відкинутих через переповнений пул.
+
+        :return: Словник з ключами `requests`, `created`, `reused`, `discarded`; порожній, якщо адаптер
+            не веде статистики.
+        """
+        stats = getattr(self.adapter, "stats", None)
+        return stats.as_dict() if stats is not None else {}
+
+    def close(self):
+        """
+        Закриття сесії та всіх з'єднань пулу.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def send_request(self, model: str, method: str, properties: dict, timeout: int = BaseNovaPostApi.DEFAULT_TIMEOUT,
+                     use_cache: bool = True):
+        """
+        Виклик методу API.
+
+        :param use_cache: Читати й зберігати відповідь у кеші `cache` і приєднуватися до однакового запиту,
+            що вже виконується; `False` — окремий запит до API, надісланий після виклику (наприклад,
+            для синхронізації довідників чи звірки збереження, яким потрібні актуальні дані).
+        """
+        key, ttl, cached = self._cache_lookup(model, method, properties) if use_cache else (None, None, MISSING)
+        if cached is not MISSING:
+            return cached
+
+        flight_key = self._flight_key(model, method, properties, key) if use_cache else None
+        if flight_key is not None:
+            return self.single_flight.do(flight_key, lambda: self._fetch(model, method, properties, timeout, key, ttl))
+        return self._fetch(model, method, properties, timeout, key, ttl)
+
+    def _fetch(self, model: str, method: str, properties: dict, timeout: float, key: Optional[str],
+               ttl: Optional[float]):
+        data = self._send_with_retry(self._build_payload(model, method, properties), timeout)
+
+        if ttl is not None:
+            self.cache.set(key, data, ttl)
+        return data
+
+    def _send_with_retry(self, payload: dict, timeout: float):
+        model, method = payload["modelName"], payload["calledMethod"]
+        policy = self._retry_policy_for(model, method)
+        if policy is None:
+            return self._send(payload, timeout)
+
+        deadline = time.monotonic() + policy.deadline if policy.deadline is not None else None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return self._send(payload, self._attempt_timeout(timeout, deadline))
+            except NovaPostApiError as error:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                delay = policy.next_delay(attempt, error, remaining)
+                if delay is None:
+                    raise
+                self._log_retry(model, method, attempt, error, delay)
+                time.sleep(delay)
+
+    def _send(self, payload: dict, timeout: float):
+        model, method = payload["modelName"], payload["calledMethod"]
+        headers = self._build_headers()
+
+        delay = self._rate_limit_delay(model, method)
+        if delay > 0:
+            time.sleep(delay)
+
+        self._log_request(payload)
+        started = time.perf_counter()
+
+        try:
+            response = self.session.post(self.API_URL, json=payload, timeout=timeout, headers=headers)
+        except requests.Timeout:
+            logger.error("Ошибка: запрос к %s/%s превысил %s секунд", model, method, timeout)
+            raise NovaPostTimeoutError(f"Таймаут запроса: {timeout} секунд")
+        except requests.ConnectionError as e:
+            logger.error("Ошибка соединения при запросе к %s/%s: %s", model, method, e)
+            raise NovaPostConnectionError(f"Ошибка соединения: {e}") from e
+
+        self._check_status(model, method, started, response.status_code)
+
+        try:
+            result = response.json()
+        except ValueError as e:
+            logger.error("Ошибка JSON: Некорректный ответ")
+            raise NovaPostApiError("Некорректный JSON ответ API")
+
+        return self._unwrap_result(model, method, started, result)
@@ -0,0 +1,182 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+from .api import BaseNovaPostApi
+from .cache import MISSING, ResponseCache
+from .exceptions import NovaPostApiError, NovaPostTimeoutError, NovaPostConnectionError
+from .logger import logger
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .user_agent import UserAgentPolicy
+
+if TYPE_CHECKING:
+    from .quotes import QuoteCache
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - залежить від оточення
+    aiohttp = None
+
+
+class AsyncSingleFlight:
+    """
+    Асинхронний варіант `SingleFlight` для одного циклу подій.
+
+    Виклик виконується окремим завданням `asyncio`, на яке чекають усі учасники через `asyncio.shield`:
+    скасування одного з них не перериває запит для решти.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.shared = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Виконує `await fn()` або приєднується до вже запущеного виклику з тим самим ключем.
+
+        :param key: Ключ виклику (наприклад, `cache_key` запиту).
+        :param fn: Функція без аргументів, що повертає корутину запиту.
+        :return: Результат корутини, спільний для всіх учасників.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Future):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Помилку вже отримали учасники; якщо всі скасувалися, asyncio не скаржиться на неї в лозі
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+class AsyncNovaPostApi(BaseNovaPostApi):
+    """
+    Асинхронний клієнт API Нової Пошти на базі `aiohttp`.
+
+    Адаптери (`address`, `common`, `counterparty`, `internet_document`, `tracking`) завантажуються ліниво
+    з пакета `nova_post.adapters.aio`, повертають ті самі pydantic-моделі, що й синхронний клієнт,
+    але їхні методи потрібно викликати через `await`.
+
+    Приклад::
+
+        async with AsyncNovaPostApi(api_key) as api:
+            cities = await api.address.get_cities(GetCitiesRequest(FindByString="Київ"))
+    """
+    ADAPTERS_PACKAGE = ".adapters.aio"
+    SINGLE_FLIGHT = AsyncSingleFlight
+
+    def __init__(self, api_key: str, session: Optional["aiohttp.ClientSession"] = None,
+                 user_agent: Optional[UserAgentPolicy] = None, retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None, cache: Optional[ResponseCache] = None,
+                 coalesce: bool = True, quote_cache: Optional["QuoteCache"] = None):
+        if aiohttp is None:
+            raise ImportError("Для AsyncNovaPostApi потрібен aiohttp: pip install nova-post[async]")
+        super().__init__(api_key, user_agent, retry_policy, rate_limiter, cache, coalesce, quote_cache)
+        self._session = session
+        self._owns_session = session is None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """
+        Сесія `aiohttp`, створюється при першому запиті всередині запущеного циклу подій.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self._session
+
+    async def send_request(self, model: str, method: str, properties: dict,
+                           timeout: int = BaseNovaPostApi.DEFAULT_TIMEOUT, use_cache: bool = True):
+        """
+        Виклик методу API; `use_cache=False` оминає кеш `cache` і об'єднання запитів (див. `NovaPostApi.send_request`).
+        """
+        key, ttl, cached = self._cache_lookup(model, method, properties) if use_cache else (None, None, MISSING)
+        if cached is not MISSING:
+            return cached
+
+        flight_key = self._flight_key(model, method, properties, key) if use_cache else None
+        if flight_key is not None:
+            return await self.single_flight.do(flight_key,
+                                               lambda: self._fetch(model, method, properties, timeout, key, ttl))
+        return await self._fetch(model, method, properties, timeout, key, ttl)
+
+    async def _fetch(self, model: str, method: str, properties: dict, timeout: float, key: Optional[str],
+                     ttl: Optional[float]):
+        data = await self._send_with_retry(self._build_payload(model, method, properties), timeout)
+
+        if ttl is not None:
+            self.cache.set(key, data, ttl)
+        return data
+
+    async def _send_with_retry(self, payload: dict, timeout: float):
+        model, method = payload["modelName"], payload["calledMethod"]
+        policy = self._retry_policy_for(model, method)
+        if policy is None:
+            return await self._send(payload, timeout)
+
+        deadline = time.monotonic() + policy.deadline if policy.deadline is not None else None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self._send(payload, self._attempt_timeout(timeout, deadline))
+            except NovaPostApiError as error:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                delay = policy.next_delay(attempt, error, remaining)
+                if delay is None:
+                    raise
+                self._log_retry(model, method, attempt, error, delay)
+                await asyncio.sleep(delay)
+
+    async def _send(self, payload: dict, timeout: float):
+        model, method = payload["modelName"], payload["calledMethod"]
+        headers = self._build_headers()
+
+        if self.rate_limiter is not None and self.rate_limiter.blocking:
+            delay = await asyncio.to_thread(self._rate_limit_delay, model, method)
+        else:
+            delay = self._rate_limit_delay(model, method)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        self._log_request(payload)
+        started = time.perf_counter()
+
+        try:
+            async with self.session.post(self.API_URL, json=payload, headers=headers,
+                                         timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                self._check_status(model, method, started, response.status)
+                result = await response.json(content_type=None)
+        except asyncio.TimeoutError:
+            logger.error("Ошибка: запрос к %s/%s превысил %s секунд", model, method, timeout)
+            raise NovaPostTimeoutError(f"Таймаут запроса: {timeout} секунд")
+        except aiohttp.ClientConnectionError as e:
+            logger.error("Ошибка соединения при запросе к %s/%s: %s", model, method, e)
+            raise NovaPostConnectionError(f"Ошибка соединения: {e}") from e
+        except ValueError:
+            logger.error("Ошибка JSON: Некорректный ответ")
+            raise NovaPostApiError("Некорректный JSON ответ API")
+
+        return self._unwrap_result(model, method, started, result)
+
+    async def close(self):
+        """
+        Закриття сесії, якщо її створив сам клієнт.
+        """
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,200 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pydantic import ValidationError
+
+from .journal import AsyncJournaledSaver, JournaledSaver, SaveJournal, content_key
+from .logger import logger
+from .models.internet_document import SaveInternetDocumentRequest, SaveInternetDocumentResponse
+
+BulkResult = Tuple[int, Union[SaveInternetDocumentResponse, Exception]]
+
+
+def idempotency_key(data: SaveInternetDocumentRequest) -> str:
+    """
+    Ключ ідемпотентності за замовчуванням — хеш вмісту запиту без `DateTime` (див. `journal.content_key`).
+    """
+    return content_key(data.model_dump(exclude_unset=True))
+
+
+class BaseBulkWaybillCreator:
+    """
+    Спільна частина синхронного та асинхронного пакетного створення накладних: перевірка вхідних даних
+    і план запитів.
+    """
+    SAVER = JournaledSaver
+
+    def __init__(self, api, journal: Optional[SaveJournal] = None, max_workers: int = 8):
+        self.api = api
+        self.journal = journal
+        self.saver = self.SAVER(api, journal) if journal is not None else None
+        self.max_workers = max(1, max_workers)
+        self.created = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def _plan(self, items: Iterable[Union[SaveInternetDocumentRequest, dict]],
+              keys: Optional[Iterable[str]]) -> Tuple[List[BulkResult], List[BulkResult], List[tuple]]:
+        """
+        Перевірка всіх запитів до відправки першого з них.
+
+        :return: `(помилки перевірки, відповіді з журналу, завдання)`; завдання —
+            `(ключ, запит, індекси входу з цим ключем)`.
+        """
+        items = list(items)
+        keys = list(keys) if keys is not None else None
+        if keys is not None and len(keys) != len(items):
+            raise ValueError("keys must have the same length as items")
+
+        invalid: List[BulkResult] = []
+        groups: Dict[str, Tuple[SaveInternetDocumentRequest, List[int]]] = {}
+        for index, item in enumerate(items):
+            try:
+                data = item if isinstance(item, SaveInternetDocumentRequest) else \
+                    SaveInternetDocumentRequest.model_validate(item)
+            except ValidationError as error:
+                invalid.append((index, error))
+                continue
+            key = keys[index] if keys is not None else idempotency_key(data)
+            if key in groups:
+                groups[key][1].append(index)
+            else:
+                groups[key] = (data, [index])
+
+        done: List[BulkResult] = []
+        tasks = []
+        for key, (data, indexes) in groups.items():
+            stored = self.journal.completed(key) if self.journal is not None else None
+            if stored is not None:
+                response = SaveInternetDocumentResponse.model_validate(stored)
+                done.extend((index, response) for index in indexes)
+            else:
+                tasks.append((key, data, indexes))
+        self.failed += len(invalid)
+        self.skipped += len(done)
+        if invalid:
+            logger.warning("Пакетное создание накладных: %d записей не прошли проверку", len(invalid))
+        return invalid, done, tasks
+
+    def _finish(self, key: str, data: SaveInternetDocumentRequest, indexes: List[int],
+                outcome: Union[SaveInternetDocumentResponse, Exception]) -> List[BulkResult]:
+        if isinstance(outcome, Exception):
+            self.failed += len(indexes)
+            logger.error("Не удалось создать накладную для записей %s: %s", indexes, outcome)
+        else:
+            self.created += 1
+            self.skipped += len(indexes) - 1
+        return [(index, outcome) for index in indexes]
+
+
+class BulkWaybillCreator(BaseBulkWaybillCreator):
+    """
+    Пакетне створення експрес-накладних через `save_internet_document`.
+
+    Усі запити перевіряються до відправки першого з них: помилки перевірки повертаються одразу
+    і не зупиняють решту. Далі запити виконуються паралельно, не більше `max_workers` одночасно, з
+    урахуванням `rate_limiter` і `retry_policy` клієнта. Результати видаються в порядку завершення
+    парами `(індекс входу, SaveInternetDocumentResponse або помилка)`.
+
+    Кожен запит має ключ ідемпотентності: переданий у `keys` (наприклад, номер замовлення) або хеш вмісту.
+    Записи з однаковим ключем створюють одну накладну. Якщо задано `journal`, накладні створюються через
+    `JournaledSaver`: після перезапуску вже створені накладні повертаються з журналу без повторного запиту,
+    а після таймауту накладна спершу шукається серед уже створених.
+
+    :param api: Синхронний клієнт `NovaPostApi`.
+    :param journal: Журнал `SaveJournal`; без нього ідемпотентність діє лише в межах одного виклику.
+    :param max_workers: Кількість одночасних запитів.
+    """
+
+    def create(self, items: Iterable[Union[SaveInternetDocumentRequest, dict]],
+               keys: Optional[Sequence[str]] = None) -> Iterator[BulkResult]:
+        """
+        Створення накладних.
+
+        :param items: Запити `SaveInternetDocumentRequest` або словники з тими самими полями.
+        :param keys: Ключі ідемпотентності для кожного запиту (за замовчуванням — хеш вмісту).
+        :return: Ітератор пар `(індекс, відповідь або помилка)` у порядку завершення.
+        """
+        invalid, done, tasks = self._plan(items, keys)
+        yield from invalid
+        yield from done
+
+        pending = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for task in tasks:
+                pending[executor.submit(self._save, task[0], task[1])] = task
+                if len(pending) >= self.max_workers * 2:
+                    yield from self._drain(pending)
+            while pending:
+                yield from self._drain(pending)
+        finally:
+            # Споживач зупинився раніше: запити, що ще не почалися, скасовуються, а вже відправлені
+            # дочікуються й записуються в журнал, щоб наступний запуск не створив дублікатів
+            for future in pending:
+                future.cancel()
+            for future, (key, data, indexes) in pending.items():
+                if not future.cancelled():
+                    error = future.exception()
+                    self._finish(key, data, indexes, error if error is not None else future.result())
+            executor.shutdown(wait=True)
+
+    def _save(self, key: str, data: SaveInternetDocumentRequest) -> SaveInternetDocumentResponse:
+        if self.saver is not None:
+            return self.saver.save_internet_document(data, key)
+        return self.api.internet_document.save_internet_document(data)
+
+    def _drain(self, pending: dict) -> Iterator[BulkResult]:
+        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in finished:
+            key, data, indexes = pending.pop(future)
+            error = future.exception()
+            yield from self._finish(key, data, indexes, error if error is not None else future.result())
+
+
+class AsyncBulkWaybillCreator(BaseBulkWaybillCreator):
+    """
+    Асинхронний варіант `BulkWaybillCreator` для `AsyncNovaPostApi`: не більше `max_workers`
+    одночасних завдань `asyncio`.
+    """
+    SAVER = AsyncJournaledSaver
+
+    async def create(self, items: Iterable[Union[SaveInternetDocumentRequest, dict]],
+                     keys: Optional[Sequence[str]] = None) -> AsyncIterator[BulkResult]:
+        invalid, done, tasks = self._plan(items, keys)
+        for result in invalid + done:
+            yield result
+
+        pending: Dict[asyncio.Task, tuple] = {}
+        try:
+            for task in tasks:
+                pending[asyncio.ensure_future(self._save(task[0], task[1]))] = task
+                if len(pending) >= self.max_workers:
+                    for result in await self._drain(pending):
+                        yield result
+            while pending:
+                for result in await self._drain(pending):
+                    yield result
+        finally:
+            # Уже відправлені запити дочікуються й записуються в журнал (див. `BulkWaybillCreator.create`)
+            if pending:
+                await asyncio.wait(pending)
+                for task, (key, data, indexes) in pending.items():
+                    if not task.cancelled():
+                        error = task.exception()
+                        self._finish(key, data, indexes, error if error is not None else task.result())
+
+    async def _save(self, key: str, data: SaveInternetDocumentRequest) -> SaveInternetDocumentResponse:
+        if self.saver is not None:
+            return await self.saver.save_internet_document(data, key)
+        return await self.api.internet_document.save_internet_document(data)
+
+    async def _drain(self, pending: dict) -> List[BulkResult]:
+        finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        results = []
+        for task in finished:
+            key, data, indexes = pending.pop(task)
+            error = task.exception()
+            results.extend(self._finish(key, data, indexes, error if error is not None else task.result()))
+        return results
@@ -0,0 +1,219 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Tuple
+
+from .retry import READ_METHOD_PREFIXES
+
+if TYPE_CHECKING:
+    import sqlite3
+
+MISSING = object()
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# Довідники, що змінюються рідко (раз на дні-місяці)
+DEFAULT_TTLS: Dict[str, float] = {
+    "Common/getCargoTypes": DAY,
+    "Common/getPalletsList": DAY,
+    "Common/getPackList": DAY,
+    "Common/getServiceTypes": DAY,
+    "Common/getOwnershipFormsList": DAY,
+    "Common/getTiresWheelsList": DAY,
+    "Common/getTypesOfPayersForRedelivery": DAY,
+    "Common/getCargoDescriptionList": DAY,
+    "Address/getAreas": DAY,
+    "Address/getCities": DAY,
+    "Address/getWarehouses": DAY,
+}
+
+
+def cache_key(model: str, method: str, properties: Optional[dict]) -> str:
+    """
+    Канонічний ключ запиту: `modelName/calledMethod` та `methodProperties`, серіалізовані у JSON
+    з відсортованими ключами, тож порядок полів у запиті не впливає на ключ.
+    """
+    canonical = json.dumps(properties or {}, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return f"{model}/{method}:{canonical}"
+
+
+class MemoryCache:
+    """
+    Потокобезпечний кеш у пам'яті процесу з TTL та витісненням за LRU.
+
+    Значення зберігаються як є (без копіювання), тож повторні звернення повертають той самий об'єкт.
+
+    :param maxsize: Максимальна кількість записів.
+    :param clock: Джерело часу (для тестів).
+    """
+
+    def __init__(self, maxsize: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """
+        Значення за ключем або `MISSING`, якщо запису немає чи його TTL минув.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._data[key] = (self._clock() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """
+    Кеш на диску в базі SQLite, що переживає перезапуск процесу.
+
+    Значення серіалізуються в JSON і стискаються `zlib`. База працює в режимі WAL, тож кілька процесів
+    можуть одночасно читати кеш, поки інший процес записує. Кожен потік (і кожен процес після `fork`)
+    використовує власне з'єднання.
+
+    :param path: Шлях до файлу бази даних.
+    :param timeout: Скільки секунд чекати на блокування бази іншим процесом.
+    :param clock: Джерело часу; має бути спільним для всіх процесів (за замовчуванням `time.time`).
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.timeout = timeout
+        self._clock = clock
+        self._local = threading.local()
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value BLOB NOT NULL)"
+        )
+
+    def _connection(self) -> "sqlite3.Connection":
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            import sqlite3  # sqlite3 і zlib імпортуються лише для SQLiteCache, а не з кожним клієнтом
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str) -> Any:
+        """
+        Значення за ключем або `MISSING`, якщо запису немає чи його TTL минув.
+        """
+        row = self._connection().execute(
+            "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (key, self._clock())
+        ).fetchone()
+        if row is None:
+            return MISSING
+        import zlib
+        return json.loads(zlib.decompress(row[0]))
+
+    def set(self, key: str, value: Any, ttl: float):
+        import zlib
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode())
+        self._connection().execute(
+            "INSERT OR REPLACE INTO responses (key, expires_at, value) VALUES (?, ?, ?)",
+            (key, self._clock() + ttl, blob)
+        )
+
+    def delete(self, key: str):
+        self._connection().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        self._connection().execute("DELETE FROM responses")
+
+    def purge_expired(self) -> int:
+        """
+        Видалення записів із минулим TTL.
+
+        :return: Кількість видалених записів.
+        """
+        cursor = self._connection().execute("DELETE FROM responses WHERE expires_at <= ?", (self._clock(),))
+        return cursor.rowcount
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            connection.close()
+        self._local.connection = None
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    Кеш відповідей API для `send_request`.
+
+    Кешуються лише методи, для яких задано TTL; решта запитів завжди йде в мережу. Ключ кешу —
+    `cache_key(modelName, calledMethod, methodProperties)`, значення — поле `data` відповіді API.
+
+    :param backend: Сховище з методами `get(key)`, `set(key, value, ttl)`, `delete(key)`, `clear()`;
+        за замовчуванням `MemoryCache`, для збереження між перезапусками — `SQLiteCache`.
+    :param ttls: TTL у секундах за `modelName/calledMethod`; за замовчуванням `DEFAULT_TTLS`
+        (довідники адаптера `Common`, області, міста та відділення).
+    :param default_ttl: TTL для методів читання (`get*`, `search*`), яких немає в `ttls` (`None` — не кешувати).
+        Методи зміни даних (`save`, `update`, `delete` тощо) кешуються лише за явним записом у `ttls`.
+    """
+
+    def __init__(self, backend=None, ttls: Optional[Mapping[str, float]] = None, default_ttl: Optional[float] = None):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, model: str, method: str) -> Optional[float]:
+        ttl = self.ttls.get(f"{model}/{method}")
+        if ttl is None and method.startswith(READ_METHOD_PREFIXES):
+            return self.default_ttl
+        return ttl
+
+    def get(self, key: str) -> Any:
+        value = self.backend.get(key)
+        with self._lock:
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        self.backend.set(key, value, ttl)
+
+    def invalidate(self, model: str, method: str, properties: Optional[dict] = None):
+        """
+        Видалення збереженої відповіді для конкретного запиту.
+        """
+        self.backend.delete(cache_key(model, method, properties))
+
+    def clear(self):
+        self.backend.clear()
@@ -0,0 +1,211 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from ..models.address import City, SearchSettlementsItem
+from .warehouses import WarehouseDirectory
+
+CityLike = Union[City, SearchSettlementsItem]
+
+# Літери, що часто плутають або пишуть по-різному в українській і російській
+_NORMALIZE = str.maketrans({
+    "і": "и", "ї": "и", "ы": "и", "й": "и",
+    "є": "е", "э": "е", "ё": "е",
+    "ґ": "г",
+    "ь": None, "ъ": None,
+    "'": None, "’": None, "ʼ": None, "`": None, "ʻ": None,
+})
+
+# Латиниця -> кирилиця: спершу багатолітерні сполучення (офіційна транслітерація 2010 року та поширені варіанти)
+_TRANSLIT = (
+    ("shch", "щ"), ("zgh", "зг"),
+    ("zh", "ж"), ("kh", "х"), ("ts", "ц"), ("ch", "ч"), ("sh", "ш"),
+    ("yu", "ю"), ("iu", "ю"), ("ya", "я"), ("ia", "я"), ("ye", "є"), ("yi", "ї"),
+    ("a", "а"), ("b", "б"), ("c", "ц"), ("d", "д"), ("e", "е"), ("f", "ф"), ("g", "г"), ("h", "г"),
+    ("i", "і"), ("j", "й"), ("k", "к"), ("l", "л"), ("m", "м"), ("n", "н"), ("o", "о"), ("p", "п"),
+    ("q", "к"), ("r", "р"), ("s", "с"), ("t", "т"), ("u", "у"), ("v", "в"), ("w", "в"), ("x", "кс"),
+    ("y", "и"), ("z", "з"),
+)
+_TRANSLIT_RE = re.compile("|".join(latin for latin, _ in _TRANSLIT))
+_TRANSLIT_MAP = dict(_TRANSLIT)
+_SEPARATORS_RE = re.compile(r"[\s\-.,()]+")
+_REPEATS_RE = re.compile(r"(.)\1+")
+
+PREFIX_INDEX_LENGTH = 3
+
+
+def transliterate(text: str) -> str:
+    """
+    Перетворення латинського запису назви на кирилицю (`Kyiv` -> `Київ`, `Zaporizhzhia` -> `Запоріжжя`).
+    """
+    return _TRANSLIT_RE.sub(lambda match: _TRANSLIT_MAP[match.group(0)], text.lower())
+
+
+def normalize(text: str) -> str:
+    """
+    Нормалізація назви для пошуку: нижній регістр, транслітерація латиниці, злиття і/и/ї/й/ы та є/е/э,
+    видалення апострофів і м'якого знака, згортання подвоєних літер (`Одесса`, `Київ` -> `кив`),
+    один пробіл між словами.
+    """
+    text = transliterate(text).translate(_NORMALIZE)
+    return _SEPARATORS_RE.sub(" ", _REPEATS_RE.sub(r"\1", text)).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Триграми нормалізованого рядка; два пробіли на початку посилюють збіг за префіксом.
+    """
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CityAutocomplete:
+    """
+    Локальне автодоповнення назв міст і населених пунктів, стійке до помилок.
+
+    Назви (`Description`, `DescriptionRu` для `City` або `MainDescription` для `SearchSettlementsItem`)
+    нормалізуються функцією `normalize`, тож запити `Kyiv`, `Київ`, `Киев` і `киів` знаходять одне місто.
+    Запит спершу шукається за префіксом (відсортований список назв і готові топи для коротких префіксів),
+    а якщо збігів менше за `limit` — у триграмному індексі. Результати ранжуються за кількістю відділень.
+
+    Приклад::
+
+        autocomplete = CityAutocomplete.from_directories(api.address.get_cities(GetCitiesRequest()),
+                                                         WarehouseDirectory.load("warehouses.json.gz"))
+        autocomplete.complete("kharkiv")
+
+    :param cities: Міста (`City`) або населені пункти (`SearchSettlementsItem`).
+    :param warehouse_counts: Кількість відділень за `Ref` міста; для `SearchSettlementsItem`, якщо ключа
+        немає, використовується поле `Warehouses`.
+    """
+
+    def __init__(self, cities: Iterable[CityLike], warehouse_counts: Optional[Mapping[str, int]] = None):
+        warehouse_counts = warehouse_counts or {}
+        entries = list(cities)
+        counts = [self._warehouse_count(entry, warehouse_counts) for entry in entries]
+        names = [self._names(entry) for entry in entries]
+
+        # Порядок ранжування: більше відділень -> вище, далі за назвою
+        order = sorted(range(len(entries)), key=lambda i: (-counts[i], names[i][0] if names[i] else ""))
+        self._entries: Tuple[CityLike, ...] = tuple(entries[i] for i in order)
+        self._counts: Tuple[int, ...] = tuple(counts[i] for i in order)
+        names = [names[i] for i in order]
+
+        sorted_names: List[Tuple[str, int]] = []
+        prefixes: Dict[str, List[int]] = defaultdict(list)
+        grams: Dict[str, List[int]] = defaultdict(list)
+        self._grams_count: List[int] = []
+        for rank, entry_names in enumerate(names):
+            entry_grams: Set[str] = set()
+            entry_prefixes: Set[str] = set()
+            for name in entry_names:
+                sorted_names.append((name, rank))
+                entry_grams |= trigrams(name)
+                entry_prefixes.update(name[:length] for length in range(1, min(len(name), PREFIX_INDEX_LENGTH) + 1))
+            for gram in entry_grams:
+                grams[gram].append(rank)
+            for prefix in entry_prefixes:
+                prefixes[prefix].append(rank)
+            self._grams_count.append(len(entry_grams))
+
+        sorted_names.sort()
+        self._sorted_names = sorted_names
+        self._sorted_keys = [name for name, _ in sorted_names]
+        self._prefixes = {prefix: tuple(ranks) for prefix, ranks in prefixes.items()}
+        self._grams = {gram: tuple(ranks) for gram, ranks in grams.items()}
+
+    @staticmethod
+    def _names(entry: CityLike) -> List[str]:
+        if isinstance(entry, SearchSettlementsItem):
+            raw = [entry.MainDescription]
+        else:
+            raw = [entry.Description, entry.DescriptionRu]
+        names: List[str] = []
+        for value in raw:
+            name = normalize(value) if value else ""
+            if name and name not in names:
+                names.append(name)
+        return names
+
+    @staticmethod
+    def _warehouse_count(entry: CityLike, warehouse_counts: Mapping[str, int]) -> int:
+        if entry.Ref in warehouse_counts:
+            return warehouse_counts[entry.Ref]
+        if isinstance(entry, SearchSettlementsItem):
+            if entry.DeliveryCity in warehouse_counts:
+                return warehouse_counts[entry.DeliveryCity]
+            try:
+                return int(entry.Warehouses)
+            except ValueError:
+                return 0
+        return 0
+
+    @classmethod
+    def from_directories(cls, cities: Iterable[CityLike],
+                         warehouses: Optional[WarehouseDirectory] = None) -> "CityAutocomplete":
+        """
+        Побудова індексу з довідника міст; кількість відділень береться з `WarehouseDirectory`.
+
+        :param cities: Міста (`City`) або населені пункти (`SearchSettlementsItem`).
+        :param warehouses: Локальний довідник відділень (необов'язково).
+        """
+        counts: Dict[str, int] = defaultdict(int)
+        for warehouse in warehouses or ():
+            counts[warehouse.CityRef] += 1
+        return cls(cities, counts)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _prefix_ranks(self, query: str, limit: int) -> List[int]:
+        if len(query) <= PREFIX_INDEX_LENGTH:
+            return list(self._prefixes.get(query, ())[:limit])
+        start = bisect_left(self._sorted_keys, query)
+        ranks: Set[int] = set()
+        for name, rank in islice(self._sorted_names, start, None):
+            if not name.startswith(query):
+                break
+            ranks.add(rank)
+        return sorted(ranks)[:limit]
+
+    def _fuzzy_ranks(self, query: str, min_similarity: float) -> List[int]:
+        query_grams = trigrams(query)
+        common: Dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for rank in self._grams.get(gram, ()):
+                common[rank] += 1
+        scored = []
+        for rank, shared in common.items():
+            if shared / len(query_grams) < min_similarity:
+                continue
+            # Коефіцієнт Дайса, округлений до десятих, щоб серед близьких збігів вище були більші міста
+            similarity = 2 * shared / (len(query_grams) + self._grams_count[rank])
+            scored.append((-round(similarity, 1), rank))
+        scored.sort()
+        return [rank for _, rank in scored]
+
+    def complete(self, query: str, limit: int = 10, min_similarity: float = 0.5) -> List[CityLike]:
+        """
+        Міста, що відповідають введеному тексту.
+
+        :param query: Введений користувачем текст (кирилиця або латиниця, можливо з помилками).
+        :param limit: Максимальна кількість результатів.
+        :param min_similarity: Мінімальна частка триграм запиту, що мають збігтися для нечіткого збігу.
+        :return: Список `City` / `SearchSettlementsItem`: спершу збіги за префіксом, далі нечіткі;
+            в межах групи — за кількістю відділень.
+        """
+        query = normalize(query)
+        if not query or limit <= 0:
+            return []
+        ranks = self._prefix_ranks(query, limit)
+        if len(ranks) < limit and len(query) >= PREFIX_INDEX_LENGTH:
+            seen = set(ranks)
+            for rank in self._fuzzy_ranks(query, min_similarity):
+                if rank not in seen:
+                    ranks.append(rank)
+                    seen.add(rank)
+                    if len(ranks) == limit:
+                        break
+        return [self._entries[rank] for rank in ranks]
@@ -0,0 +1,175 @@
+import heapq
+import math
+from array import array
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..models.address import Warehouse
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+WarehouseFilter = Callable[[Warehouse], bool]
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Відстань між двома точками по поверхні Землі, км.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def accepts_weight(weight: float) -> WarehouseFilter:
+    """
+    Фільтр відділень, що приймають місце вагою `weight` кг (0 або відсутнє значення — без обмежень).
+    """
+    def predicate(warehouse: Warehouse) -> bool:
+        limit = warehouse.PlaceMaxWeightAllowed or warehouse.TotalMaxWeightAllowed
+        return not limit or limit >= weight
+    return predicate
+
+
+class WarehouseGeoIndex:
+    """
+    Просторовий індекс відділень на рівномірній сітці широта/довгота.
+
+    Координати зберігаються в компактних масивах `array('d')`, а відділення розкладаються по клітинках
+    розміром `cell_size` градусів. Пошук найближчих розширює кільця клітинок навколо точки, доки
+    найменша можлива відстань до наступного кільця не перевищить `k`-й знайдений результат, тож
+    перевіряються лише сусідні клітинки, а не весь довідник. Відділення без координат не індексуються.
+
+    :param warehouses: Відділення (`Warehouse`) з полями `Latitude` / `Longitude`.
+    :param cell_size: Розмір клітинки сітки в градусах (0.05° ≈ 5.5 км по широті).
+    """
+
+    def __init__(self, warehouses: Iterable[Warehouse], cell_size: float = 0.05):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be > 0")
+        self.cell_size = cell_size
+        located = [wh for wh in warehouses if wh.Latitude is not None and wh.Longitude is not None]
+        self._warehouses: Tuple[Warehouse, ...] = tuple(located)
+        self._lat = array("d", (wh.Latitude for wh in located))
+        self._lon = array("d", (wh.Longitude for wh in located))
+
+        cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for index in range(len(located)):
+            cells[self._cell(self._lat[index], self._lon[index])].append(index)
+        self._cells = {cell: tuple(indexes) for cell, indexes in cells.items()}
+        if cells:
+            rows = [row for row, _ in cells]
+            columns = [column for _, column in cells]
+            self._bounds = (min(rows), max(rows), min(columns), max(columns))
+        else:
+            self._bounds = (0, -1, 0, -1)
+
+    def __len__(self) -> int:
+        return len(self._warehouses)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_size), math.floor(lon / self.cell_size)
+
+    def _ring(self, row: int, column: int, radius: int) -> Iterable[Tuple[int, int]]:
+        if radius == 0:
+            yield row, column
+            return
+        for r in range(row - radius, row + radius + 1):
+            if r in (row - radius, row + radius):
+                for c in range(column - radius, column + radius + 1):
+                    yield r, c
+            else:
+                yield r, column - radius
+                yield r, column + radius
+
+    @staticmethod
+    def _build_filter(type_of_warehouse: Optional[str], max_weight: Optional[float],
+                      predicate: Optional[WarehouseFilter]) -> WarehouseFilter:
+        checks: List[WarehouseFilter] = []
+        if type_of_warehouse is not None:
+            checks.append(lambda warehouse: warehouse.TypeOfWarehouse == type_of_warehouse)
+        if max_weight is not None:
+            checks.append(accepts_weight(max_weight))
+        if predicate is not None:
+            checks.append(predicate)
+        return lambda warehouse: all(check(warehouse) for check in checks)
+
+    def nearest(self, lat: float, lon: float, k: int = 5, type_of_warehouse: Optional[str] = None,
+                max_weight: Optional[float] = None,
+                predicate: Optional[WarehouseFilter] = None) -> List[Tuple[Warehouse, float]]:
+        """
+        `k` найближчих до точки відділень.
+
+        :param lat: Широта точки.
+        :param lon: Довгота точки.
+        :param k: Кількість результатів.
+        :param type_of_warehouse: Лише відділення цього типу (`TypeOfWarehouse`).
+        :param max_weight: Лише відділення, що приймають місце такої ваги, кг.
+        :param predicate: Довільний додатковий фільтр `Warehouse -> bool`.
+        :return: Пари (відділення, відстань у км), від найближчого.
+        """
+        if k <= 0 or not self._warehouses:
+            return []
+        matches = self._build_filter(type_of_warehouse, max_weight, predicate)
+        row, column = self._cell(lat, lon)
+        min_row, max_row, min_column, max_column = self._bounds
+        max_radius = max(row - min_row, max_row - row, column - min_column, max_column - column, 0)
+
+        best: List[Tuple[float, int]] = []  # max-heap за відстанню: (-відстань, індекс)
+        for radius in range(max_radius + 1):
+            for cell in self._ring(row, column, radius):
+                for index in self._cells.get(cell, ()):
+                    distance = haversine_km(lat, lon, self._lat[index], self._lon[index])
+                    if len(best) == k and distance >= -best[0][0]:
+                        continue
+                    if not matches(self._warehouses[index]):
+                        continue
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, index))
+                    else:
+                        heapq.heapreplace(best, (-distance, index))
+            if len(best) == k and -best[0][0] <= self._ring_min_distance(lat, radius):
+                break
+        return [(self._warehouses[index], -distance) for distance, index in sorted(best, reverse=True)]
+
+    def _ring_min_distance(self, lat: float, radius: int) -> float:
+        # Нижня межа відстані до будь-якої точки поза кільцями 0..radius: клітинка по довготі найвужча
+        # на найбільшій широті, якої може сягати наступне кільце.
+        edge_lat = min(abs(lat) + (radius + 1) * self.cell_size, 90.0)
+        return radius * self.cell_size * KM_PER_DEGREE * math.cos(math.radians(edge_lat))
+
+    def within(self, lat: float, lon: float, radius_km: float, type_of_warehouse: Optional[str] = None,
+               max_weight: Optional[float] = None,
+               predicate: Optional[WarehouseFilter] = None) -> List[Tuple[Warehouse, float]]:
+        """
+        Відділення в радіусі `radius_km` від точки.
+
+        :param lat: Широта точки.
+        :param lon: Довгота точки.
+        :param radius_km: Радіус пошуку, км.
+        :param type_of_warehouse: Лише відділення цього типу (`TypeOfWarehouse`).
+        :param max_weight: Лише відділення, що приймають місце такої ваги, кг.
+        :param predicate: Довільний додатковий фільтр `Warehouse -> bool`.
+        :return: Пари (відділення, відстань у км), від найближчого.
+        """
+        matches = self._build_filter(type_of_warehouse, max_weight, predicate)
+        d_lat = radius_km / KM_PER_DEGREE
+        cos_lat = math.cos(math.radians(min(abs(lat) + d_lat, 89.9)))
+        d_lon = min(d_lat / cos_lat, 180.0)
+        min_row, min_column = self._cell(lat - d_lat, lon - d_lon)
+        max_row, max_column = self._cell(lat + d_lat, lon + d_lon)
+        # Клітинки поза межами даних завідомо порожні
+        min_row, max_row = max(min_row, self._bounds[0]), min(max_row, self._bounds[1])
+        min_column, max_column = max(min_column, self._bounds[2]), min(max_column, self._bounds[3])
+
+        found: List[Tuple[float, int]] = []
+        for row in range(min_row, max_row + 1):
+            for column in range(min_column, max_column + 1):
+                for index in self._cells.get((row, column), ()):
+                    distance = haversine_km(lat, lon, self._lat[index], self._lon[index])
+                    if distance <= radius_km and matches(self._warehouses[index]):
+                        found.append((distance, index))
+        found.sort()
+        return [(self._warehouses[index], distance) for distance, index in found]
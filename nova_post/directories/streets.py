@@ -0,0 +1,206 @@
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, Generic, Iterable, List, Set, Tuple, TypeVar, Union
+
+from ..models.address import SearchSettlementStreetsItem, SearchSettlementStreetsRequest, Street
+from .cities import normalize
+
+S = TypeVar("S", Street, SearchSettlementStreetsItem)
+
+
+def _street_ref(street: Union[Street, SearchSettlementStreetsItem]) -> str:
+    return street.Ref if isinstance(street, Street) else street.SettlementStreetRef
+
+
+def _street_name(street: Union[Street, SearchSettlementStreetsItem]) -> str:
+    return street.Description if isinstance(street, Street) else street.SettlementStreetDescription
+
+
+class StreetIndex(Generic[S]):
+    """
+    Вулиці одного міста у відсортованому масиві для пошуку за префіксом.
+
+    Ключі — нормалізовані (див. `cities.normalize`) початки кожного слова назви, тож запит `шевч` знаходить
+    і `Шевченка`, і `Тараса Шевченка`. Пошук — `bisect` по масиву ключів, без звернення до API.
+    """
+
+    def __init__(self, streets: Iterable[S] = ()):
+        self._keys: List[Tuple[str, int]] = []
+        self._streets: List[S] = []
+        self._refs: Dict[str, int] = {}
+        self.add(streets)
+
+    def __len__(self) -> int:
+        return len(self._streets)
+
+    def add(self, streets: Iterable[S]):
+        """
+        Додавання вулиць; вулиці з уже відомим ідентифікатором пропускаються.
+        """
+        keys: List[Tuple[str, int]] = []
+        for street in streets:
+            ref = _street_ref(street)
+            if ref in self._refs:
+                continue
+            position = self._refs[ref] = len(self._streets)
+            self._streets.append(street)
+            words = normalize(_street_name(street)).split(" ")
+            keys.extend((" ".join(words[start:]), position) for start in range(len(words)))
+        if keys:
+            # Новий масив замість сортування на місці: паралельний `search` бачить або старий, або новий
+            self._keys = sorted(self._keys + keys)
+
+    def search(self, query: str, limit: int = 20) -> List[S]:
+        """
+        Вулиці, назва яких (або одне з її слів) починається з `query`, в алфавітному порядку збігу.
+        """
+        prefix = normalize(query)
+        keys = self._keys
+        found: List[int] = []
+        seen: Set[int] = set()
+        for index in range(bisect_left(keys, (prefix, -1)), len(keys)):
+            key, position = keys[index]
+            if not key.startswith(prefix) or len(found) == limit:
+                break
+            if position not in seen:
+                seen.add(position)
+                found.append(position)
+        return [self._streets[position] for position in found]
+
+
+class StreetCache:
+    """
+    Кеш вулиць за містами для автодоповнення адрес кур'єрської доставки.
+
+    Для `CityRef` перший пошук завантажує всі вулиці міста (`Address.get_all_streets`), а наступні
+    обслуговуються локально через `StreetIndex`. Для `SettlementRef` API не віддає повний перелік вулиць,
+    тому кешуються результати `searchSettlementStreets`: якщо відповідь на запит була повною
+    (`TotalCount` не більший за кількість отриманих вулиць), то всі уточнення цього запиту (довші префікси)
+    обслуговуються локально.
+
+    Міста витісняються за LRU, коли загальна кількість вулиць у кеші перевищує `max_streets`
+    (щойно завантажене місто не витісняється).
+
+    :param api: Клієнт `NovaPostApi`.
+    :param max_streets: Межа кількості вулиць у пам'яті для всіх міст разом.
+    :param page_size: Кількість вулиць на сторінці при завантаженні міста.
+    :param max_workers: Кількість сторінок, що завантажуються одночасно.
+    :param settlement_limit: `Limit` для запитів `searchSettlementStreets`.
+    """
+
+    def __init__(self, api, max_streets: int = 200_000, page_size: int = 500, max_workers: int = 4,
+                 settlement_limit: int = 500):
+        self.api = api
+        self.max_streets = max_streets
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.settlement_limit = settlement_limit
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, StreetIndex]" = OrderedDict()
+        self._covered: Dict[str, Set[str]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, ref: str) -> bool:
+        return ref in self._entries
+
+    def search(self, city_ref: str, query: str, limit: int = 20) -> List[Street]:
+        """
+        Вулиці міста, назва яких починається з `query`.
+
+        :param city_ref: Ідентифікатор міста (`CityRef`).
+        :param query: Введений користувачем текст.
+        :param limit: Максимальна кількість результатів.
+        :return: Список об'єктів `Street`.
+        """
+        with self._lock:
+            index = self._touch(city_ref)
+            if index is not None:
+                self.hits += 1
+        if index is None:
+            fetched = StreetIndex(self.api.address.get_all_streets(city_ref, self.page_size, self.max_workers))
+            with self._lock:
+                self.misses += 1
+                # Місто могло бути завантажене паралельним запитом, поки ми чекали на API
+                index = self._touch(city_ref)
+                if index is None:
+                    index = fetched
+                    self._store(city_ref, index, len(index))
+        return index.search(query, limit)
+
+    def search_settlement(self, settlement_ref: str, query: str,
+                          limit: int = 20) -> List[SearchSettlementStreetsItem]:
+        """
+        Вулиці населеного пункту, назва яких починається з `query`.
+
+        :param settlement_ref: Ідентифікатор населеного пункту (`SettlementRef`).
+        :param query: Введений користувачем текст.
+        :param limit: Максимальна кількість результатів.
+        :return: Список об'єктів `SearchSettlementStreetsItem`.
+        """
+        prefix = normalize(query)
+        with self._lock:
+            index = self._touch(settlement_ref)
+            covered = index is not None and any(prefix.startswith(known) for known in self._covered[settlement_ref])
+            if covered:
+                self.hits += 1
+        if covered:
+            return index.search(query, limit)
+
+        request = SearchSettlementStreetsRequest(SettlementRef=settlement_ref, StreetName=query,
+                                                 Limit=self.settlement_limit)
+        response = self.api.address.search_settlement_streets(request)
+        complete = int(response.TotalCount or 0) <= len(response.Addresses)
+        with self._lock:
+            self.misses += 1
+            index = self._entries.get(settlement_ref)
+            if index is None:
+                index = StreetIndex()
+                self._covered[settlement_ref] = set()
+                self._store(settlement_ref, index, 0)
+            before = len(index)
+            index.add(response.Addresses)
+            if complete:
+                self._covered[settlement_ref].add(prefix)
+            self._store(settlement_ref, index, len(index) - before)
+        if not complete:
+            # Неповна відповідь: локальний індекс може не містити частини вулиць, тож повертаємо відповідь API
+            return response.Addresses[:limit]
+        return index.search(query, limit)
+
+    def invalidate(self, ref: str):
+        """
+        Видалення вулиць міста чи населеного пункту з кешу.
+        """
+        with self._lock:
+            index = self._entries.pop(ref, None)
+            self._covered.pop(ref, None)
+            if index is not None:
+                self._size -= len(index)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._covered.clear()
+            self._size = 0
+
+    def _touch(self, ref: str):
+        index = self._entries.get(ref)
+        if index is not None:
+            self._entries.move_to_end(ref)
+        return index
+
+    def _store(self, ref: str, index: StreetIndex, added: int):
+        if ref not in self._entries:
+            self._entries[ref] = index
+        self._entries.move_to_end(ref)
+        self._size += added
+        while self._size > self.max_streets and len(self._entries) > 1:
+            evicted_ref, evicted = self._entries.popitem(last=False)
+            self._covered.pop(evicted_ref, None)
+            self._size -= len(evicted)
@@ -0,0 +1,304 @@
+import hashlib
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Literal, Optional
+
+from pydantic import BaseModel
+
+from ..cache import cache_key
+from ..logger import logger
+from ..models.address import GetCitiesRequest, GetWarehousesRequest, Warehouse
+from .warehouses import WarehouseDirectory
+
+
+def record_hash(record: dict) -> str:
+    """
+    Хеш вмісту запису: SHA-1 від канонічного JSON (ключі відсортовано).
+    """
+    canonical = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+
+class DirectoryChange(BaseModel):
+    """
+    Зміна запису довідника.
+
+    Атрибути:
+    - `Action` (str): Тип зміни: `insert`, `update` або `delete`.
+    - `Ref` (str): Ідентифікатор запису.
+    - `Record` (Optional[dict]): Новий вміст запису (для `delete` — останній відомий вміст).
+    - `ChangedAt` (float): Час застосування зміни (Unix time).
+    """
+    Action: Literal["insert", "update", "delete"]
+    Ref: str
+    Record: Optional[dict] = None
+    ChangedAt: float
+
+
+class SyncResult(BaseModel):
+    """
+    Результат оновлення довідника.
+
+    Атрибути:
+    - `Directory` (str): Ідентифікатор довідника (`modelName/calledMethod` з фільтрами).
+    - `Pages` (int): Кількість завантажених сторінок за цей запуск.
+    - `Resumed` (bool): Чи продовжено перерваний запуск з контрольної точки.
+    - `Total` (int): Кількість записів у довіднику після оновлення.
+    - `Changes` (List[DirectoryChange]): Застосовані зміни.
+    """
+    Directory: str
+    Pages: int
+    Resumed: bool = False
+    Total: int
+    Changes: List[DirectoryChange] = []
+
+    @property
+    def inserted(self) -> int:
+        return sum(1 for change in self.Changes if change.Action == "insert")
+
+    @property
+    def updated(self) -> int:
+        return sum(1 for change in self.Changes if change.Action == "update")
+
+    @property
+    def deleted(self) -> int:
+        return sum(1 for change in self.Changes if change.Action == "delete")
+
+
+class DirectoryStore:
+    """
+    Локальне сховище довідників у SQLite: знімок записів із хешами вмісту, журнал змін
+    та контрольні точки незавершених завантажень.
+
+    :param path: Шлях до файлу бази даних.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                directory TEXT NOT NULL, ref TEXT NOT NULL, hash TEXT NOT NULL, data TEXT NOT NULL,
+                PRIMARY KEY (directory, ref)
+            );
+            CREATE TABLE IF NOT EXISTS staging (
+                directory TEXT NOT NULL, ref TEXT NOT NULL, hash TEXT NOT NULL, data TEXT NOT NULL,
+                PRIMARY KEY (directory, ref)
+            );
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                directory TEXT PRIMARY KEY, page INTEGER NOT NULL, started_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS changes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, directory TEXT NOT NULL, action TEXT NOT NULL,
+                ref TEXT NOT NULL, data TEXT, changed_at REAL NOT NULL
+            );
+        """)
+
+    def records(self, directory: str) -> Iterator[dict]:
+        """
+        Записи довідника з останнього завершеного оновлення.
+        """
+        for (data,) in self._connection.execute("SELECT data FROM records WHERE directory = ?", (directory,)):
+            yield json.loads(data)
+
+    def count(self, directory: str) -> int:
+        row = self._connection.execute("SELECT COUNT(*) FROM records WHERE directory = ?", (directory,)).fetchone()
+        return row[0]
+
+    def changes(self, directory: str, since: Optional[float] = None) -> List[DirectoryChange]:
+        """
+        Журнал змін довідника, за потреби — лише зміни, застосовані після `since`.
+        """
+        rows = self._connection.execute(
+            "SELECT action, ref, data, changed_at FROM changes WHERE directory = ? AND changed_at > ? ORDER BY id",
+            (directory, since if since is not None else float("-inf"))
+        )
+        return [
+            DirectoryChange(Action=action, Ref=ref, Record=json.loads(data) if data else None, ChangedAt=changed_at)
+            for action, ref, data, changed_at in rows
+        ]
+
+    def checkpoint(self, directory: str) -> Optional[tuple]:
+        """
+        Контрольна точка незавершеного завантаження: `(остання сторінка, час початку)` або `None`.
+        """
+        return self._connection.execute(
+            "SELECT page, started_at FROM checkpoints WHERE directory = ?", (directory,)
+        ).fetchone()
+
+    def reset_checkpoint(self, directory: str):
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.execute("DELETE FROM staging WHERE directory = ?", (directory,))
+            self._connection.execute("DELETE FROM checkpoints WHERE directory = ?", (directory,))
+
+    def stage_pages(self, directory: str, records: List[dict], page: int, started_at: float, key: str):
+        """
+        Збереження завантажених сторінок і контрольної точки в одній транзакції.
+        """
+        rows = [(directory, str(record[key]), record_hash(record), _dump(record)) for record in records]
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO staging (directory, ref, hash, data) VALUES (?, ?, ?, ?)", rows
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (directory, page, started_at) VALUES (?, ?, ?)",
+                (directory, page, started_at)
+            )
+
+    def apply_staging(self, directory: str) -> List[DirectoryChange]:
+        """
+        Порівняння завантаженого знімка з поточним і застосування лише змінених записів.
+        """
+        now = time.time()
+        connection = self._connection
+        with connection:
+            connection.execute("BEGIN")
+            current: Dict[str, tuple] = {
+                ref: (hash_, data) for ref, hash_, data in connection.execute(
+                    "SELECT ref, hash, data FROM records WHERE directory = ?", (directory,)
+                )
+            }
+            changes: List[tuple] = []
+            upserts: List[tuple] = []
+            seen = set()
+            for ref, hash_, data in connection.execute(
+                    "SELECT ref, hash, data FROM staging WHERE directory = ?", (directory,)):
+                seen.add(ref)
+                previous = current.get(ref)
+                if previous is None:
+                    changes.append(("insert", ref, data))
+                elif previous[0] != hash_:
+                    changes.append(("update", ref, data))
+                else:
+                    continue
+                upserts.append((directory, ref, hash_, data))
+            deletes = [(ref, current[ref][1]) for ref in current if ref not in seen]
+            changes.extend(("delete", ref, data) for ref, data in deletes)
+
+            connection.executemany(
+                "INSERT OR REPLACE INTO records (directory, ref, hash, data) VALUES (?, ?, ?, ?)", upserts
+            )
+            connection.executemany(
+                "DELETE FROM records WHERE directory = ? AND ref = ?", [(directory, ref) for ref, _ in deletes]
+            )
+            connection.executemany(
+                "INSERT INTO changes (directory, action, ref, data, changed_at) VALUES (?, ?, ?, ?, ?)",
+                [(directory, action, ref, data, now) for action, ref, data in changes]
+            )
+            connection.execute("DELETE FROM staging WHERE directory = ?", (directory,))
+            connection.execute("DELETE FROM checkpoints WHERE directory = ?", (directory,))
+
+        return [
+            DirectoryChange(Action=action, Ref=ref, Record=json.loads(data), ChangedAt=now)
+            for action, ref, data in changes
+        ]
+
+    def close(self):
+        self._connection.close()
+
+
+def _dump(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+class DirectorySync:
+    """
+    Інкрементальне оновлення локальних довідників відділень і міст.
+
+    Кожен запуск посторінково завантажує свіжий знімок (`getWarehouses` / `getCities`) хвилями по
+    `max_workers` сторінок, після кожної хвилі фіксує контрольну точку, а наприкінці порівнює хеші записів
+    зі збереженим знімком і застосовує лише вставки, оновлення та видалення. Якщо попередній запуск
+    перервався, наступний продовжить завантаження зі сторінки після контрольної точки.
+
+    :param api: Клієнт `NovaPostApi`.
+    :param store: Сховище `DirectoryStore`.
+    :param page_size: Кількість записів на сторінці.
+    :param max_workers: Кількість сторінок, що завантажуються одночасно.
+    :param checkpoint_ttl: Через скільки секунд контрольна точка вважається застарілою і завантаження
+        починається спочатку.
+    """
+
+    def __init__(self, api, store: DirectoryStore, page_size: int = 500, max_workers: int = 4,
+                 checkpoint_ttl: float = 24 * 60 * 60):
+        self.api = api
+        self.store = store
+        self.page_size = page_size
+        self.max_workers = max(1, max_workers)
+        self.checkpoint_ttl = checkpoint_ttl
+
+    @staticmethod
+    def directory_id(model: str, method: str, filters: Optional[dict] = None) -> str:
+        return cache_key(model, method, filters)
+
+    def refresh_warehouses(self, data: Optional[GetWarehousesRequest] = None) -> SyncResult:
+        """
+        Оновлення довідника відділень (`Address/getWarehouses`).
+
+        :param data: Фільтри `GetWarehousesRequest` (необов'язково); `Page` і `Limit` ігноруються.
+        """
+        return self._refresh("Address", "getWarehouses", data)
+
+    def refresh_cities(self, data: Optional[GetCitiesRequest] = None) -> SyncResult:
+        """
+        Оновлення довідника міст (`Address/getCities`).
+
+        :param data: Фільтри `GetCitiesRequest` (необов'язково); `Page` і `Limit` ігноруються.
+        """
+        return self._refresh("Address", "getCities", data)
+
+    def warehouses(self, data: Optional[GetWarehousesRequest] = None) -> Iterator[dict]:
+        return self.store.records(self.directory_id("Address", "getWarehouses", self._filters(data)))
+
+    def cities(self, data: Optional[GetCitiesRequest] = None) -> Iterator[dict]:
+        return self.store.records(self.directory_id("Address", "getCities", self._filters(data)))
+
+    def warehouse_directory(self, data: Optional[GetWarehousesRequest] = None) -> WarehouseDirectory:
+        """
+        `WarehouseDirectory` з локального знімка відділень, без звернення до API.
+        """
+        return WarehouseDirectory(Warehouse.model_validate(record) for record in self.warehouses(data))
+
+    @staticmethod
+    def _filters(data: Optional[BaseModel]) -> dict:
+        return data.model_dump(exclude_unset=True, exclude={"Page", "Limit"}) if data is not None else {}
+
+    def _refresh(self, model: str, method: str, data: Optional[BaseModel]) -> SyncResult:
+        filters = self._filters(data)
+        directory = self.directory_id(model, method, filters)
+
+        page, started_at, resumed = 0, time.time(), False
+        checkpoint = self.store.checkpoint(directory)
+        if checkpoint is not None:
+            if time.time() - checkpoint[1] < self.checkpoint_ttl:
+                page, started_at, resumed = checkpoint[0], checkpoint[1], True
+                logger.info("Продолжение синхронизации %s со страницы %d", directory, page + 1)
+            else:
+                self.store.reset_checkpoint(directory)
+
+        def fetch_page(number: int) -> list:
+            # Кеш відповідей оминається: інакше повторна синхронізація в межах TTL отримала б ті самі сторінки
+            return self.api.send_request(model, method, dict(filters, Page=number, Limit=self.page_size),
+                                         use_cache=False)
+
+        pages = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            finished = False
+            while not finished:
+                numbers = range(page + 1, page + 1 + self.max_workers)
+                records: List[dict] = []
+                for number, result in zip(numbers, executor.map(fetch_page, numbers)):
+                    records.extend(result)
+                    page, pages = number, pages + 1
+                    if len(result) < self.page_size:
+                        finished = True
+                        break
+                self.store.stage_pages(directory, records, page, started_at, key="Ref")
+
+        changes = self.store.apply_staging(directory)
+        return SyncResult(Directory=directory, Pages=pages, Resumed=resumed, Total=self.store.count(directory),
+                          Changes=changes)
@@ -0,0 +1,139 @@
+import gzip
+import json
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..models.address import GetWarehousesRequest, Warehouse
+from .geo import WarehouseGeoIndex
+
+
+class WarehouseDirectory:
+    """
+    Локальний довідник відділень з індексами для миттєвого пошуку без звернення до API.
+
+    Відділення зберігаються в кортежі, індекси посилаються на ті самі об'єкти:
+    - за `SiteKey`;
+    - за `CityRef`;
+    - за парою (`CityRef`, `Number`);
+    - за `TypeOfWarehouse`.
+
+    Приклад::
+
+        directory = WarehouseDirectory.download(api)
+        directory.save("warehouses.json.gz")
+        ...
+        directory = WarehouseDirectory.load("warehouses.json.gz")
+        warehouse = directory.find(city_ref, 12)
+    """
+
+    def __init__(self, warehouses: Iterable[Warehouse] = ()):
+        self._warehouses: Tuple[Warehouse, ...] = tuple(warehouses)
+        self._geo_indexes: Dict[float, WarehouseGeoIndex] = {}
+        self._build_indexes()
+
+    def _build_indexes(self):
+        by_site_key: Dict[int, Warehouse] = {}
+        by_city: Dict[str, List[Warehouse]] = defaultdict(list)
+        by_city_number: Dict[Tuple[str, str], Warehouse] = {}
+        by_type: Dict[str, List[Warehouse]] = defaultdict(list)
+
+        for warehouse in self._warehouses:
+            by_site_key[warehouse.SiteKey] = warehouse
+            by_city[warehouse.CityRef].append(warehouse)
+            by_city_number[(warehouse.CityRef, warehouse.Number)] = warehouse
+            if warehouse.TypeOfWarehouse:
+                by_type[warehouse.TypeOfWarehouse].append(warehouse)
+
+        self._by_site_key = by_site_key
+        self._by_city = {key: tuple(value) for key, value in by_city.items()}
+        self._by_city_number = by_city_number
+        self._by_type = {key: tuple(value) for key, value in by_type.items()}
+
+    @classmethod
+    def download(cls, api, data: Optional[GetWarehousesRequest] = None, page_size: int = 500,
+                 max_workers: int = 4) -> "WarehouseDirectory":
+        """
+        Завантаження повного довідника відділень з API.
+
+        :param api: Клієнт `NovaPostApi`.
+        :param data: Фільтри `GetWarehousesRequest` (необов'язково), наприклад, лише одне місто.
+        :param page_size: Кількість відділень на сторінці.
+        :param max_workers: Кількість сторінок, що завантажуються одночасно.
+        :return: Новий об'єкт `WarehouseDirectory`.
+        """
+        return cls(api.address.get_all_warehouses(data, page_size=page_size, max_workers=max_workers))
+
+    def __len__(self) -> int:
+        return len(self._warehouses)
+
+    def __iter__(self) -> Iterator[Warehouse]:
+        return iter(self._warehouses)
+
+    def by_site_key(self, site_key: int) -> Optional[Warehouse]:
+        """
+        Відділення за унікальним ключем `SiteKey`.
+        """
+        return self._by_site_key.get(site_key)
+
+    def in_city(self, city_ref: str) -> Tuple[Warehouse, ...]:
+        """
+        Усі відділення міста.
+        """
+        return self._by_city.get(city_ref, ())
+
+    def find(self, city_ref: str, number: Union[int, str]) -> Optional[Warehouse]:
+        """
+        Відділення з номером `number` у місті `city_ref`.
+        """
+        return self._by_city_number.get((city_ref, str(number)))
+
+    def of_type(self, type_of_warehouse: str) -> Tuple[Warehouse, ...]:
+        """
+        Усі відділення заданого типу (`TypeOfWarehouse`).
+        """
+        return self._by_type.get(type_of_warehouse, ())
+
+    def filter(self, city_ref: Optional[str] = None, type_of_warehouse: Optional[str] = None) -> List[Warehouse]:
+        """
+        Відділення, що відповідають усім заданим умовам.
+
+        :param city_ref: Ідентифікатор міста (необов'язково).
+        :param type_of_warehouse: Тип відділення (необов'язково).
+        :return: Список відділень.
+        """
+        if city_ref is not None:
+            candidates: Iterable[Warehouse] = self.in_city(city_ref)
+        elif type_of_warehouse is not None:
+            candidates = self.of_type(type_of_warehouse)
+        else:
+            candidates = self._warehouses
+        if type_of_warehouse is not None:
+            candidates = (wh for wh in candidates if wh.TypeOfWarehouse == type_of_warehouse)
+        return list(candidates)
+
+    def geo_index(self, cell_size: float = 0.05) -> WarehouseGeoIndex:
+        """
+        Просторовий індекс відділень для пошуку найближчих і в радіусі; будується при першому виклику.
+
+        :param cell_size: Розмір клітинки сітки в градусах.
+        """
+        index = self._geo_indexes.get(cell_size)
+        if index is None:
+            index = self._geo_indexes[cell_size] = WarehouseGeoIndex(self._warehouses, cell_size)
+        return index
+
+    def save(self, path: str):
+        """
+        Збереження довідника у стиснутий JSON-файл.
+        """
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump([wh.model_dump(exclude_none=True) for wh in self._warehouses], file, ensure_ascii=False,
+                      separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "WarehouseDirectory":
+        """
+        Завантаження довідника, збереженого методом `save`.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return cls(Warehouse.model_validate(item) for item in json.load(file))
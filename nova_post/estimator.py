@@ -0,0 +1,218 @@
+import asyncio
+import statistics
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Literal, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .cache import cache_key
+from .logger import logger
+from .models.internet_document import DocumentPriceRequest, DocumentPriceResponse
+from .quotes import QuotePolicy
+
+
+def zone_of(response: DocumentPriceResponse) -> Optional[str]:
+    """
+    Ідентифікатор тарифної зони з `TZoneInfo` відповіді (`TzoneID`, інакше `TzoneName`).
+    """
+    info = response.TZoneInfo or {}
+    zone = info.get("TzoneID") or info.get("TzoneName")
+    return str(zone) if zone else None
+
+
+class PriceEstimate(BaseModel):
+    """
+    Орієнтовна вартість доставки з локальних тарифних таблиць.
+
+    Атрибути:
+    - `Cost` (int): Орієнтовна вартість доставки.
+    - `Confidence` (str): Ступінь довіри: `high` — ціну вже бачили для цієї пари міст і вагового порогу,
+      `medium` — для іншої пари міст тієї ж тарифної зони, `low` — для сусіднього вагового порогу зони.
+    - `Zone` (Optional[str]): Тарифна зона пари міст, якщо відома.
+    - `Samples` (int): Кількість відповідей API, з яких отримано оцінку.
+    """
+    Cost: int
+    Confidence: Literal["high", "medium", "low"]
+    Zone: Optional[str] = None
+    Samples: int
+
+
+class PriceEstimator:
+    """
+    Офлайн-оцінка вартості доставки за відповідями `getDocumentPrice`, що вже надійшли.
+
+    Кожна відповідь потрапляє у дві таблиці: для пари міст і для тарифної зони з `TZoneInfo`. Ключ таблиці
+    включає тип послуги, тип вантажу, кількість місць і ваговий поріг `QuotePolicy`. Оцінка — медіана
+    останніх `window` спостережень. Пара міст запам'ятовує свою зону, тож нова пара стає відомою
+    після першої ж відповіді, а ціни решти порогів беруться з таблиці зони.
+
+    :param policy: Політика округлення ваги до тарифних порогів.
+    :param window: Скільки останніх спостережень зберігати для кожного ключа.
+    """
+
+    def __init__(self, policy: Optional[QuotePolicy] = None, window: int = 16):
+        self.policy = policy if policy is not None else QuotePolicy()
+        self.window = window
+        self._lock = threading.Lock()
+        self._zones: Dict[Tuple[str, str], str] = {}
+        self._routes: Dict[tuple, Deque[int]] = {}
+        self._tariffs: Dict[tuple, Deque[int]] = {}
+
+    def _tariff(self, data: DocumentPriceRequest) -> tuple:
+        return data.ServiceType, data.CargoType, data.SeatsAmount
+
+    def observe(self, data: DocumentPriceRequest, response: DocumentPriceResponse):
+        """
+        Додавання відповіді API до тарифних таблиць.
+        """
+        route = (data.CitySender, data.CityRecipient)
+        weight = self.policy.round_weight(data.Weight)
+        zone = zone_of(response)
+        with self._lock:
+            self._sample(self._routes, route + self._tariff(data) + (weight,), response.Cost)
+            if zone is not None:
+                self._zones[route] = zone
+                self._sample(self._tariffs, (zone,) + self._tariff(data) + (weight,), response.Cost)
+
+    def _sample(self, table: Dict[tuple, Deque[int]], key: tuple, cost: int):
+        samples = table.get(key)
+        if samples is None:
+            samples = table[key] = deque(maxlen=self.window)
+        samples.append(cost)
+
+    def estimate(self, data: DocumentPriceRequest) -> Optional[PriceEstimate]:
+        """
+        Миттєва оцінка вартості без звернення до API.
+
+        :param data: Параметри відправлення.
+        :return: `PriceEstimate` або `None`, якщо для пари міст ще немає жодного спостереження.
+        """
+        route = (data.CitySender, data.CityRecipient)
+        weight = self.policy.round_weight(data.Weight)
+        with self._lock:
+            zone = self._zones.get(route)
+            samples = self._routes.get(route + self._tariff(data) + (weight,))
+            if samples:
+                return self._make(samples, "high", zone)
+            if zone is None:
+                return None
+            samples = self._tariffs.get((zone,) + self._tariff(data) + (weight,))
+            if samples:
+                return self._make(samples, "medium", zone)
+            samples = self._neighbour(zone, data, weight)
+            return self._make(samples, "low", zone) if samples else None
+
+    def _neighbour(self, zone: str, data: DocumentPriceRequest, weight: float) -> Optional[Deque[int]]:
+        # Найближчий важчий поріг (оцінка не занижує ціну), інакше — найближчий легший
+        prefix = (zone,) + self._tariff(data)
+        known = sorted(key[-1] for key in self._tariffs if key[:-1] == prefix)
+        heavier = [step for step in known if step > weight]
+        if heavier:
+            return self._tariffs[prefix + (heavier[0],)]
+        return self._tariffs[prefix + (known[-1],)] if known else None
+
+    @staticmethod
+    def _make(samples: Deque[int], confidence: str, zone: Optional[str]) -> PriceEstimate:
+        return PriceEstimate(Cost=round(statistics.median(samples)), Confidence=confidence, Zone=zone,
+                             Samples=len(samples))
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+
+class PriceQuoter:
+    """
+    Неблокуюче котирування: миттєва оцінка `PriceEstimator` і фонове уточнення точної ціни через API.
+
+    `quote` повертає оцінку (або `None` для зовсім нових пар міст) та `Future` з точною відповіддю
+    `get_document_price`; отримана відповідь одразу навчає оцінювач. Однакові уточнення, що ще
+    виконуються, не дублюються.
+
+    :param api: Синхронний клієнт `NovaPostApi` (бажано з `quote_cache`).
+    :param estimator: Оцінювач; за замовчуванням новий `PriceEstimator`.
+    :param max_workers: Кількість потоків для фонових запитів.
+    """
+
+    def __init__(self, api, estimator: Optional[PriceEstimator] = None, max_workers: int = 2):
+        self.api = api
+        self.estimator = estimator if estimator is not None else PriceEstimator()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+
+    def quote(self, data: DocumentPriceRequest) -> Tuple[Optional[PriceEstimate], Future]:
+        """
+        Оцінка вартості та фонове уточнення.
+
+        :param data: Параметри відправлення.
+        :return: `(PriceEstimate або None, Future[DocumentPriceResponse])`.
+        """
+        return self.estimator.estimate(data), self.refresh(data)
+
+    def refresh(self, data: DocumentPriceRequest) -> Future:
+        """
+        Запуск (або приєднання до вже запущеного) фонового запиту точної ціни.
+        """
+        key = cache_key("InternetDocument", "getDocumentPrice", data.model_dump(exclude_unset=True))
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = self._executor.submit(self._fetch, key, data)
+        return future
+
+    def _fetch(self, key: str, data: DocumentPriceRequest) -> DocumentPriceResponse:
+        try:
+            response = self.api.internet_document.get_document_price(data)
+            self.estimator.observe(data, response)
+            return response
+        except Exception as error:
+            logger.warning("Не удалось уточнить стоимость доставки: %s", error)
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+
+class AsyncPriceQuoter:
+    """
+    Асинхронний варіант `PriceQuoter` для `AsyncNovaPostApi`: уточнення виконується завданням `asyncio`.
+    """
+
+    def __init__(self, api, estimator: Optional[PriceEstimator] = None):
+        self.api = api
+        self.estimator = estimator if estimator is not None else PriceEstimator()
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    def quote(self, data: DocumentPriceRequest) -> Tuple[Optional[PriceEstimate], asyncio.Task]:
+        """
+        Оцінка вартості та фонове уточнення; викликається всередині запущеного циклу подій.
+        """
+        return self.estimator.estimate(data), self.refresh(data)
+
+    def refresh(self, data: DocumentPriceRequest) -> asyncio.Task:
+        key = cache_key("InternetDocument", "getDocumentPrice", data.model_dump(exclude_unset=True))
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(self._fetch(data))
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return task
+
+    def _forget(self, key: str, task: asyncio.Task):
+        self._pending.pop(key, None)
+        if not task.cancelled():
+            # Помилку вже записано в лог; завдання, на яке ніхто не чекав, не повинне скаржитися на неї
+            task.exception()
+
+    async def _fetch(self, data: DocumentPriceRequest) -> DocumentPriceResponse:
+        try:
+            response = await self.api.internet_document.get_document_price(data)
+        except Exception as error:
+            logger.warning("Не удалось уточнить стоимость доставки: %s", error)
+            raise
+        self.estimator.observe(data, response)
+        return response
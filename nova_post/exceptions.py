@@ -1,3 +1,38 @@
+from typing import Dict
+
+
 class NovaPostApiError(Exception):
     """Исключение для ошибок API Новой Почты"""
     pass
+
+
+class NovaPostTimeoutError(NovaPostApiError):
+    """Запрос к API не завершился за отведённое время"""
+    pass
+
+
+class NovaPostConnectionError(NovaPostApiError):
+    """Не удалось установить соединение с API"""
+    pass
+
+
+class NovaPostHttpError(NovaPostApiError):
+    """API ответило HTTP-статусом, указывающим на временную ошибку сервера (429, 5xx)"""
+
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        super().__init__(f"HTTP ошибка API: {status_code}")
+
+
+class NovaPostBatchError(NovaPostApiError):
+    """
+    Часть фрагментов пакетного запроса завершилась ошибкой.
+
+    `results` содержит ответы успешных фрагментов, `failed` — ссылки из неудачных фрагментов и текст ошибки,
+    чтобы повторить только их.
+    """
+
+    def __init__(self, results: list, failed: Dict[str, str]):
+        self.results = results
+        self.failed = failed
+        super().__init__(f"Не удалось обработать {len(failed)} накладных из {len(results) + len(failed)}")
@@ -0,0 +1,339 @@
+import csv
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Iterator, List, Literal, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from .directories.sync import record_hash
+from .logger import logger
+from .models.internet_document import DocumentListRequest, DocumentListResponse
+from .paging import iter_pages, page_filters
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - залежить від оточення
+    pyarrow = None
+
+DATE_FORMAT = "%d.%m.%Y"
+DATETIME_FORMAT = "%d.%m.%Y %H:%M:%S"
+DEFAULT_COLUMNS = tuple(DocumentListResponse.model_fields)
+
+Shard = Tuple[str, str, str]
+
+
+def date_shards(date_from: str, date_to: str, shard: Literal["day", "hour"] = "day") -> List[Shard]:
+    """
+    Розбиття періоду `date_from..date_to` (включно, формат `дд.мм.рррр`) на добові або погодинні відрізки.
+
+    :return: Список `(мітка, DateTimeFrom, DateTimeTo)`; мітка — `рррр-мм-дд` або `рррр-мм-ддTгг`.
+    """
+    start = datetime.strptime(date_from, DATE_FORMAT)
+    end = datetime.strptime(date_to, DATE_FORMAT) + timedelta(days=1)
+    shards: List[Shard] = []
+    if shard == "day":
+        while start < end:
+            day = start.strftime(DATE_FORMAT)
+            shards.append((start.strftime("%Y-%m-%d"), day, day))
+            start += timedelta(days=1)
+        return shards
+    while start < end:
+        last = start + timedelta(hours=1) - timedelta(seconds=1)
+        shards.append((start.strftime("%Y-%m-%dT%H"), start.strftime(DATETIME_FORMAT), last.strftime(DATETIME_FORMAT)))
+        start += timedelta(hours=1)
+    return shards
+
+
+class ExportResult(BaseModel):
+    """
+    Підсумок вивантаження.
+
+    Атрибути:
+    - `Shards` (int): Кількість відрізків у періоді.
+    - `Resumed` (int): Відрізки, пропущені як завершені в попередньому запуску.
+    - `Rows` (int): Записано рядків.
+    - `Duplicates` (int): Відкинуто повторів за `Ref`.
+    - `Failed` (List[str]): Мітки відрізків, завантаження яких завершилося помилкою.
+    """
+    Shards: int
+    Resumed: int = 0
+    Rows: int = 0
+    Duplicates: int = 0
+    Failed: List[str] = []
+
+
+class ExportCheckpoint:
+    """
+    Контрольні точки вивантаження в SQLite: завершені відрізки та вже записані `Ref`.
+
+    Набір `Ref` зберігається на диску, а не в пам'яті, тож дедуплікація не залежить від обсягу вивантаження
+    і діє між перезапусками.
+
+    :param path: Шлях до файлу бази даних.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS shards (
+                export TEXT NOT NULL, shard TEXT NOT NULL, rows INTEGER NOT NULL, finished_at REAL NOT NULL,
+                PRIMARY KEY (export, shard)
+            );
+            CREATE TABLE IF NOT EXISTS refs (
+                export TEXT NOT NULL, ref TEXT NOT NULL, shard TEXT NOT NULL, PRIMARY KEY (export, ref)
+            );
+        """)
+
+    def finished(self, export: str) -> set:
+        rows = self._connection.execute("SELECT shard FROM shards WHERE export = ?", (export,))
+        return {shard for (shard,) in rows}
+
+    def fresh(self, export: str, rows: List[dict]) -> List[dict]:
+        """
+        Відбір рядків із `Ref`, які ще не записувалися (повтори всередині `rows` теж відкидаються).
+
+        Нічого не позначає: відібрані `Ref` записуються через `record` лише після успішного запису в приймач,
+        тож помилка приймача не призводить до втрати рядків під час відновлення.
+        """
+        fresh, seen = [], set()
+        for row in rows:
+            ref = row.get("Ref")
+            if ref in seen:
+                continue
+            seen.add(ref)
+            if self._connection.execute("SELECT 1 FROM refs WHERE export = ? AND ref = ?", (export, ref)).fetchone():
+                continue
+            fresh.append(row)
+        return fresh
+
+    def record(self, export: str, shard: str, rows: List[dict]):
+        """
+        Позначення `Ref` записаних рядків однією транзакцією.
+        """
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany("INSERT OR IGNORE INTO refs (export, ref, shard) VALUES (?, ?, ?)",
+                                         [(export, row.get("Ref"), shard) for row in rows])
+
+    def release(self, export: str, shard: str):
+        """
+        Скасування позначок `Ref` незавершеного відрізка (для приймачів, що перезаписують відрізок з початку).
+        """
+        self._connection.execute("DELETE FROM refs WHERE export = ? AND shard = ?", (export, shard))
+
+    def finish(self, export: str, shard: str, rows: int):
+        self._connection.execute("INSERT OR REPLACE INTO shards (export, shard, rows, finished_at) VALUES (?, ?, ?, ?)",
+                                 (export, shard, rows, time.time()))
+
+    def close(self):
+        self._connection.close()
+
+
+class CsvSink:
+    """
+    Запис рядків у CSV-файл; під час відновлення дописує в наявний файл без повторного заголовка.
+
+    :param path: Шлях до файлу.
+    :param columns: Стовпці (поля відповіді `getDocumentList`).
+    """
+    rewrites_shards = False
+
+    def __init__(self, path: str, columns: Sequence[str] = DEFAULT_COLUMNS):
+        self.columns = list(columns)
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+        if not exists:
+            self._writer.writeheader()
+
+    def write(self, shard: str, rows: List[dict]):
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def finish_shard(self, shard: str):
+        pass
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetSink:
+    """
+    Стовпчиковий запис у Parquet (потрібен `pyarrow`: `pip install nova-post[parquet]`).
+
+    Кожен відрізок записується в окремий файл `<directory>/<мітка>.parquet` групами рядків по `row_group_size`,
+    тож у пам'яті одночасно не більше однієї групи на відрізок. Незавершений файл відрізка перезаписується
+    під час відновлення.
+
+    :param directory: Каталог для файлів відрізків.
+    :param columns: Стовпці; значення зберігаються як рядки.
+    :param row_group_size: Кількість рядків у групі.
+    """
+    rewrites_shards = True
+
+    def __init__(self, directory: str, columns: Sequence[str] = DEFAULT_COLUMNS, row_group_size: int = 10_000):
+        if pyarrow is None:
+            raise ImportError("Для ParquetSink потрібен pyarrow: pip install nova-post[parquet]")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.columns = list(columns)
+        self.row_group_size = row_group_size
+        self._schema = pyarrow.schema([(column, pyarrow.string()) for column in self.columns])
+        self._writers = {}
+        self._buffers = {}
+
+    def write(self, shard: str, rows: List[dict]):
+        buffer = self._buffers.setdefault(shard, [])
+        buffer.extend(rows)
+        if len(buffer) >= self.row_group_size:
+            self._flush(shard)
+
+    def _flush(self, shard: str):
+        rows = self._buffers.pop(shard, [])
+        if not rows:
+            return
+        writer = self._writers.get(shard)
+        if writer is None:
+            path = os.path.join(self.directory, f"{shard}.parquet")
+            writer = self._writers[shard] = pyarrow.parquet.ParquetWriter(path, self._schema)
+        columns = {column: [None if row.get(column) is None else str(row[column]) for row in rows]
+                   for column in self.columns}
+        writer.write_table(pyarrow.table(columns, schema=self._schema))
+
+    def finish_shard(self, shard: str):
+        self._flush(shard)
+        writer = self._writers.pop(shard, None)
+        if writer is not None:
+            writer.close()
+
+    def close(self):
+        for shard in list(self._writers):
+            self.finish_shard(shard)
+
+
+class DocumentExporter:
+    """
+    Вивантаження `getDocumentList` за довгий період, розбитий на добові або погодинні відрізки.
+
+    Відрізки завантажуються паралельно (не більше `max_workers` одночасно), кожен — посторінково. Сторінки
+    передаються в запис через обмежену чергу, тож у пам'яті одночасно не більше `max_workers * 2` сторінок
+    незалежно від довжини періоду. Рядки з уже записаним `Ref` відкидаються. Після запису всіх рядків
+    відрізок позначається завершеним у `ExportCheckpoint`, і повторний запуск того самого вивантаження
+    продовжує з незавершених відрізків. `Ref` позначаються записаними лише після успішного `sink.write`;
+    якщо запис не вдався, вивантаження зупиняється, не запитуючи нових сторінок, а рядки сторінки
+    записуються під час відновлення.
+
+    :param api: Синхронний клієнт `NovaPostApi`.
+    :param checkpoint: Контрольні точки `ExportCheckpoint`.
+    :param shard: Розмір відрізка: `day` або `hour`.
+    :param max_workers: Кількість відрізків, що завантажуються одночасно.
+    """
+
+    def __init__(self, api, checkpoint: ExportCheckpoint, shard: Literal["day", "hour"] = "day",
+                 max_workers: int = 4):
+        self.api = api
+        self.checkpoint = checkpoint
+        self.shard = shard
+        self.max_workers = max(1, max_workers)
+
+    def export_id(self, data: DocumentListRequest) -> str:
+        """
+        Ідентифікатор вивантаження: хеш фільтрів, періоду та розміру відрізка.
+        """
+        filters, _ = page_filters(data)
+        return record_hash(dict(filters, Shard=self.shard))
+
+    def export(self, data: DocumentListRequest, sink) -> ExportResult:
+        """
+        Вивантаження накладних у `sink` (`CsvSink`, `ParquetSink` або об'єкт із методами `write(shard, rows)`,
+        `finish_shard(shard)`).
+
+        :param data: Pydantic-модель `DocumentListRequest`; `DateTimeFrom`/`DateTimeTo` у форматі `дд.мм.рррр`.
+        :param sink: Приймач рядків.
+        :return: Об'єкт `ExportResult`.
+        """
+        export = self.export_id(data)
+        filters, _ = page_filters(data)
+        shards = date_shards(data.DateTimeFrom, data.DateTimeTo, self.shard)
+        done = self.checkpoint.finished(export)
+        pending = [shard for shard in shards if shard[0] not in done]
+        result = ExportResult(Shards=len(shards), Resumed=len(shards) - len(pending))
+        if not pending:
+            return result
+
+        if getattr(sink, "rewrites_shards", False):
+            for label, _, _ in pending:
+                self.checkpoint.release(export, label)
+
+        pages: "queue.Queue[tuple]" = queue.Queue(maxsize=self.max_workers * 2)
+        stop = threading.Event()
+        written = dict.fromkeys((label for label, _, _ in pending), 0)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+            for shard in pending:
+                executor.submit(self._fetch_shard, filters, shard, pages, stop)
+            try:
+                remaining = len(pending)
+                while remaining:
+                    kind, label, payload = pages.get()
+                    if kind == "page":
+                        rows = self.checkpoint.fresh(export, payload)
+                        result.Duplicates += len(payload) - len(rows)
+                        if rows:
+                            sink.write(label, rows)
+                            self.checkpoint.record(export, label, rows)
+                            written[label] += len(rows)
+                            result.Rows += len(rows)
+                        continue
+                    remaining -= 1
+                    if kind == "error":
+                        logger.error("Не удалось выгрузить отрезок %s: %s", label, payload)
+                        result.Failed.append(label)
+                        continue
+                    sink.finish_shard(label)
+                    self.checkpoint.finish(export, label, written[label])
+            finally:
+                # Відрізки, що ще не почалися, скасовуються; запущені завершуються на найближчій сторінці
+                stop.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+        return result
+
+    def _fetch_shard(self, filters: dict, shard: Shard, pages: queue.Queue, stop: threading.Event):
+        label, date_from, date_to = shard
+        if stop.is_set():
+            return
+        try:
+            for rows in self._shard_pages(filters, date_from, date_to):
+                if not self._put(pages, ("page", label, rows), stop) or stop.is_set():
+                    return
+        except Exception as error:
+            self._put(pages, ("error", label, error), stop)
+            return
+        self._put(pages, ("done", label, None), stop)
+
+    def _shard_pages(self, filters: dict, date_from: str, date_to: str) -> Iterator[List[dict]]:
+        # Сторінки з кешу могли б записати застарілі рядки й позначити їхні `Ref` вивантаженими
+        def fetch_page(page: int) -> list:
+            return self.api.send_request("InternetDocument", "getDocumentList",
+                                         dict(filters, DateTimeFrom=date_from, DateTimeTo=date_to, GetFullList=0,
+                                              Page=page), use_cache=False)
+        return iter_pages(fetch_page, None, prefetch=False)
+
+    @staticmethod
+    def _put(pages: queue.Queue, item: tuple, stop: threading.Event) -> bool:
+        # Черга обмежена: потік чекає, поки запис звільнить місце, або поки вивантаження не зупинять
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
@@ -0,0 +1,135 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, tzinfo
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+
+from .cache import MISSING, MemoryCache
+from .logger import logger
+from .models.internet_document import DocumentDeliveryDateRequest
+from .quotes import KYIV, tariff_day_ttl
+
+
+class DeliveryDateCache:
+    """
+    Кеш прогнозів `getDocumentDeliveryDate` з розбором дати.
+
+    Прогноз залежить лише від пари міст, типу послуги та дати відправки, тож ключ кешу — саме
+    `(CitySender, CityRecipient, ServiceType, DateTime)`. Запит без `DateTime` відправляється сьогодні
+    (за київським часом), і дата підставляється в запит явно. Усі прогнози застарівають опівночі,
+    коли змінюється день відправки. Однакові одночасні запити до API об'єднує сам клієнт.
+
+    :param api: Синхронний клієнт `NovaPostApi`.
+    :param maxsize: Максимальна кількість прогнозів (витіснення за LRU).
+    :param max_workers: Кількість паралельних запитів під час `prefetch`.
+    :param tz: Часовий пояс, у якому змінюється день.
+    :param clock: Джерело Unix-часу (для тестів).
+    """
+
+    def __init__(self, api, maxsize: int = 4096, max_workers: int = 4, tz: tzinfo = KYIV,
+                 clock: Callable[[], float] = time.time):
+        self.api = api
+        self.max_workers = max_workers
+        self.tz = tz
+        self._clock = clock
+        self._forecasts = MemoryCache(maxsize=maxsize, clock=clock)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def today(self) -> date:
+        return datetime.fromtimestamp(self._clock(), self.tz).date()
+
+    def _resolve(self, data: DocumentDeliveryDateRequest) -> DocumentDeliveryDateRequest:
+        if data.DateTime:
+            return data
+        return data.model_copy(update={"DateTime": self.today().strftime("%d.%m.%Y")})
+
+    @staticmethod
+    def _key(data: DocumentDeliveryDateRequest) -> str:
+        return f"{data.CitySender}/{data.CityRecipient}/{data.ServiceType}/{data.DateTime}"
+
+    def get(self, data: DocumentDeliveryDateRequest) -> date:
+        """
+        Орієнтовна дата доставки з кешу або з API.
+
+        :param data: Pydantic-модель `DocumentDeliveryDateRequest`.
+        :return: Дата доставки.
+        """
+        data = self._resolve(data)
+        key = self._key(data)
+        cached = self._forecasts.get(key)
+        with self._lock:
+            if cached is not MISSING:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if cached is not MISSING:
+            return cached
+        return self._fetch(key, data)
+
+    def forecast(self, city_sender: str, city_recipient: str, service_type: str = "WarehouseWarehouse",
+                 ship_date: Optional[date] = None) -> date:
+        """
+        Орієнтовна дата доставки для пари міст.
+
+        :param city_sender: Ідентифікатор міста відправника.
+        :param city_recipient: Ідентифікатор міста отримувача.
+        :param service_type: Тип послуги.
+        :param ship_date: Дата відправки; за замовчуванням сьогодні.
+        :return: Дата доставки.
+        """
+        return self.get(self._request(city_sender, city_recipient, service_type, ship_date))
+
+    def prefetch(self, pairs: Iterable[Tuple[str, str]], service_types: Sequence[str] = ("WarehouseWarehouse",),
+                 ship_date: Optional[date] = None) -> int:
+        """
+        Пакетне завантаження прогнозів для популярних пар міст (наприклад, під час запуску застосунку).
+
+        Відсутні в кеші прогнози запитуються паралельно, не більше `max_workers` одночасно. Помилки окремих
+        пар записуються в лог і не переривають завантаження решти.
+
+        :param pairs: Пари `(CitySender, CityRecipient)`.
+        :param service_types: Типи послуг для кожної пари.
+        :param ship_date: Дата відправки; за замовчуванням сьогодні.
+        :return: Кількість завантажених прогнозів.
+        """
+        pending = {}
+        for city_sender, city_recipient in pairs:
+            for service_type in service_types:
+                data = self._resolve(self._request(city_sender, city_recipient, service_type, ship_date))
+                key = self._key(data)
+                if key not in pending and self._forecasts.get(key) is MISSING:
+                    pending[key] = data
+        if not pending:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(pending)))) as executor:
+            results = list(executor.map(lambda item: self._try_fetch(*item), pending.items()))
+        return sum(results)
+
+    def _try_fetch(self, key: str, data: DocumentDeliveryDateRequest) -> bool:
+        try:
+            self._fetch(key, data)
+        except Exception as error:
+            logger.warning("Не удалось получить прогноз доставки %s: %s", key, error)
+            return False
+        return True
+
+    def _fetch(self, key: str, data: DocumentDeliveryDateRequest) -> date:
+        delivery_date = self.api.internet_document.get_document_delivery_date(data).delivery_date
+        self._forecasts.set(key, delivery_date, tariff_day_ttl(self._clock(), self.tz))
+        return delivery_date
+
+    @staticmethod
+    def _request(city_sender: str, city_recipient: str, service_type: str,
+                 ship_date: Optional[date]) -> DocumentDeliveryDateRequest:
+        return DocumentDeliveryDateRequest(CitySender=city_sender, CityRecipient=city_recipient,
+                                           ServiceType=service_type,
+                                           DateTime=ship_date.strftime("%d.%m.%Y") if ship_date else None)
+
+    def clear(self):
+        self._forecasts.clear()
+
+    def __len__(self) -> int:
+        return len(self._forecasts)
@@ -0,0 +1,443 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .directories.sync import record_hash
+from .exceptions import NovaPostApiError, NovaPostConnectionError, NovaPostHttpError, NovaPostTimeoutError
+from .logger import logger
+from .models.counterparty import CounterpartyRequest, CounterpartyResponse
+from .models.internet_document import SaveInternetDocumentRequest, SaveInternetDocumentResponse
+
+DOCUMENT_SAVE = "InternetDocument/save"
+COUNTERPARTY_SAVE = "Counterparty/save"
+
+# Поля накладної, за якими запис getDocumentList зіставляється із запитом save
+DOCUMENT_MATCH_FIELDS = (
+    "CitySender", "CityRecipient", "Sender", "Recipient", "ContactRecipient", "RecipientsPhone", "Description",
+    "Cost", "Weight", "SeatsAmount", "PayerType", "ServiceType", "CargoType",
+)
+# Поля, які мають збігтися обов'язково; решта `DOCUMENT_MATCH_FIELDS` порівнюється, лише якщо запис їх містить:
+# getDocumentList повертає коротший рядок, ніж запит save
+DOCUMENT_REQUIRED_FIELDS = ("Sender", "Recipient", "Cost", "Weight")
+COUNTERPARTY_MATCH_FIELDS = ("FirstName", "MiddleName", "LastName", "EDRPOU", "CounterpartyType")
+# Поля, які валідатор моделі переписує за поточною датою (`SaveInternetDocumentRequest.set_default_date`)
+VOLATILE_FIELDS = ("DateTime",)
+
+
+def content_key(request: dict) -> str:
+    """
+    Ключ ідемпотентності за замовчуванням: хеш вмісту запиту без `VOLATILE_FIELDS`.
+
+    `DateTime` після валідації дорівнює сьогоднішній даті для порожніх і минулих значень, тож із ним
+    запуск, перезапущений після опівночі, отримав би інші ключі для тих самих замовлень і створив би дублікати.
+    Через це два однакові відправлення на різні дати за замовчуванням мають один ключ — для них потрібні
+    явні ключі (наприклад, номери замовлень).
+    """
+    return record_hash({name: value for name, value in request.items() if name not in VOLATILE_FIELDS})
+
+
+class PendingSave(BaseModel):
+    """
+    Операція збереження, відправлена до API, але не підтверджена відповіддю.
+
+    Атрибути:
+    - `Key` (str): Ключ ідемпотентності.
+    - `Operation` (str): `modelName/calledMethod`.
+    - `ContentHash` (str): Хеш вмісту запиту.
+    - `Request` (dict): Параметри запиту (`methodProperties`).
+    - `StartedAt` (float): Час відправки (Unix time).
+    """
+    Key: str
+    Operation: str
+    ContentHash: str
+    Request: dict
+    StartedAt: float
+
+
+class SaveJournal:
+    """
+    Журнал операцій збереження в SQLite (write-ahead): ключ ідемпотентності, хеш вмісту, запит і відповідь API.
+
+    Перед відправкою операція записується як незавершена (`begin`), після відповіді — як виконана
+    (`complete`). Ключ, для якого вже записано відповідь, вважається виконаним: повторний запуск повертає
+    збережену відповідь замість нового запиту. Незавершені записи, що лишилися після збою, звіряються
+    з API (`JournaledSaver.recover`). Кожен документ (`Ref`) може належати лише одному ключу: це гарантує
+    унікальний індекс, тож запис результату й перевірка, що документ ще вільний, — одна атомарна операція.
+    Журнал можна використовувати з кількох потоків.
+
+    :param path: Шлях до файлу бази даних (`":memory:"` — лише на час роботи процесу).
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS saves (
+                key TEXT PRIMARY KEY, operation TEXT NOT NULL, content_hash TEXT NOT NULL, request TEXT,
+                response TEXT, ref TEXT, started_at REAL NOT NULL, updated_at REAL NOT NULL
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS saves_ref ON saves (ref);
+        """)
+
+    def begin(self, key: str, operation: str, request: dict):
+        """
+        Запис операції як незавершеної безпосередньо перед відправкою запиту.
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO saves (key, operation, content_hash, request, response, ref, started_at, "
+                "updated_at) VALUES (?, ?, ?, ?, NULL, NULL, ?, ?)",
+                (key, operation, record_hash(request), json.dumps(request, ensure_ascii=False, default=str), now, now)
+            )
+
+    def completed(self, key: str) -> Optional[dict]:
+        """
+        Збережена відповідь API для ключа або `None`, якщо операцію ще не виконано.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response FROM saves WHERE key = ? AND response IS NOT NULL", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def is_pending(self, key: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM saves WHERE key = ? AND response IS NULL", (key,)
+            ).fetchone()
+        return row is not None
+
+    def pending(self, operation: Optional[str] = None) -> List[PendingSave]:
+        """
+        Незавершені операції (за потреби — лише вказаного типу) у порядку відправки.
+        """
+        query = "SELECT key, operation, content_hash, request, started_at FROM saves WHERE response IS NULL"
+        params: Tuple = ()
+        if operation is not None:
+            query += " AND operation = ?"
+            params = (operation,)
+        with self._lock:
+            rows = self._connection.execute(query + " ORDER BY started_at", params).fetchall()
+        return [
+            PendingSave(Key=key, Operation=op, ContentHash=content_hash, Request=json.loads(request or "{}"),
+                        StartedAt=started_at)
+            for key, op, content_hash, request, started_at in rows
+        ]
+
+    def complete(self, key: str, operation: str, content_hash: str, response: dict) -> bool:
+        """
+        Запис успішної операції: `operation` — `modelName/calledMethod`, `response` — запис відповіді API.
+
+        :return: `False`, якщо документ `response["Ref"]` уже належить іншому ключу (нічого не записано).
+        """
+        now = time.time()
+        with self._lock:
+            try:
+                self._connection.execute(
+                    "INSERT INTO saves (key, operation, content_hash, response, ref, started_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                    "content_hash = excluded.content_hash, response = excluded.response, ref = excluded.ref, "
+                    "updated_at = excluded.updated_at",
+                    (key, operation, content_hash, json.dumps(response, ensure_ascii=False), response.get("Ref"),
+                     now, now)
+                )
+            except sqlite3.IntegrityError:
+                return False
+        return True
+
+    def abandon(self, key: str):
+        """
+        Видалення незавершеної операції, яку API точно не виконало (наприклад, відхилило запит).
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM saves WHERE key = ? AND response IS NULL", (key,))
+
+    def claimed(self, ref: str) -> bool:
+        """
+        Чи записано документ `ref` як результат іншої операції журналу.
+        """
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM saves WHERE ref = ?", (ref,)).fetchone() is not None
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM saves WHERE response IS NOT NULL").fetchone()[0]
+
+
+def is_ambiguous(error: NovaPostApiError) -> bool:
+    """
+    Чи могла операція виконатися на сервері, попри помилку: таймаут, обрив з'єднання або HTTP 5xx.
+    HTTP 429 та помилки API (`success: false`) означають, що запит не виконано.
+    """
+    if isinstance(error, NovaPostHttpError):
+        return error.status_code != 429
+    return isinstance(error, (NovaPostTimeoutError, NovaPostConnectionError))
+
+
+def _same(expected, actual) -> bool:
+    # Поле, відсутнє лише з одного боку, — розбіжність; порожній рядок вважається відсутнім значенням
+    expected = None if expected == "" else expected
+    actual = None if actual == "" else actual
+    if expected is None or actual is None:
+        return expected is None and actual is None
+    try:
+        return float(expected) == float(actual)
+    except (TypeError, ValueError):
+        return str(expected).strip().lower() == str(actual).strip().lower()
+
+
+def _matches(request: dict, row: dict, fields: Tuple[str, ...], required: Tuple[str, ...]) -> bool:
+    return all(_same(request.get(field), row.get(field)) for field in fields
+               if field in required or row.get(field) not in (None, ""))
+
+
+def _document_response(row: dict) -> dict:
+    return SaveInternetDocumentResponse(
+        Ref=row["Ref"], CostOnSite=int(float(row.get("CostOnSite") or 0)),
+        EstimatedDeliveryDate=str(row.get("ScheduledDeliveryDate") or row.get("EstimatedDeliveryDate") or ""),
+        IntDocNumber=str(row["IntDocNumber"]), TypeDocument=row.get("TypeDocument") or "InternetDocument",
+    ).model_dump()
+
+
+class BaseJournaledSaver:
+    """
+    Спільна частина синхронного та асинхронного ідемпотентного збереження: вибір ключа та зіставлення
+    записів API з незавершеними операціями.
+    """
+
+    def __init__(self, api, journal: SaveJournal, max_attempts: int = 3, reconcile_delay: float = 1.0):
+        self.api = api
+        self.journal = journal
+        self.max_attempts = max(1, max_attempts)
+        self.reconcile_delay = reconcile_delay
+
+    def _claim(self, key: str, operation: str, request: dict, rows: List[dict]) -> Optional[dict]:
+        """
+        Закріплення за ключем першого відповідного документа, який ще не належить іншому ключу.
+
+        Вільність документа перевіряє сам запис у журнал (`complete`), тож два ключі, що звіряються
+        одночасно, не можуть отримати один документ.
+        """
+        if operation == DOCUMENT_SAVE:
+            fields, required = DOCUMENT_MATCH_FIELDS, DOCUMENT_REQUIRED_FIELDS
+        else:
+            fields = required = COUNTERPARTY_MATCH_FIELDS
+        for row in rows:
+            if not row.get("Ref") or not _matches(request, row, fields, required) or self.journal.claimed(row["Ref"]):
+                continue
+            found = _document_response(row) if operation == DOCUMENT_SAVE else \
+                CounterpartyResponse.model_validate(row).model_dump(exclude_none=True)
+            if self.journal.complete(key, operation, record_hash(request), found):
+                logger.info("Операция %s (ключ %s) уже выполнена на сервере: %s", operation, key, found["Ref"])
+                return found
+        return None
+
+    @staticmethod
+    def _log_taken(operation: str, key: str, response: dict):
+        logger.warning("Документ %s из ответа %s (ключ %s) уже закреплён сверкой за другим ключом; повторная сверка",
+                       response.get("Ref"), operation, key)
+
+    @staticmethod
+    def _lookup_request(operation: str, request: dict) -> Tuple[str, str, dict]:
+        """
+        Запит, що повертає кандидатів для звірки: список накладних за день відправки або пошук контрагента.
+        """
+        if operation == DOCUMENT_SAVE:
+            day = request.get("DateTime")
+            return "InternetDocument", "getDocumentList", {"DateTimeFrom": day, "DateTimeTo": day, "GetFullList": 1}
+        return "Counterparty", "getCounterparties", {
+            "CounterpartyProperty": request.get("CounterpartyProperty"),
+            "FindByString": request.get("LastName") or request.get("EDRPOU") or request.get("FirstName"),
+        }
+
+    def _log_ambiguous(self, operation: str, key: str, attempt: int, error: NovaPostApiError):
+        logger.warning("Неоднозначная ошибка %s (ключ %s, попытка %d): %s; сверка с API", operation, key, attempt,
+                       error)
+
+
+class JournaledSaver(BaseJournaledSaver):
+    """
+    Ідемпотентне збереження накладних і контрагентів через журнал `SaveJournal`.
+
+    Перед відправкою операція записується в журнал. Якщо запит закінчився неоднозначно (таймаут, обрив
+    з'єднання, HTTP 5xx), сервер міг уже створити документ, тож спершу виконується звірка: накладна шукається
+    в `getDocumentList` за день відправки, контрагент — у `getCounterparties`, із порівнянням ключових полів.
+    Знайдений документ записується як результат, інакше запит надсилається повторно (до `max_attempts`
+    спроб). Документи, вже записані в журнал для інших ключів, під час звірки не враховуються.
+
+    Повтори `save` політикою `retry_policy` клієнта (`retry_writes=True`) варто вимкнути: повторні спроби
+    тут керуються журналом.
+
+    :param api: Синхронний клієнт `NovaPostApi`.
+    :param journal: Журнал `SaveJournal`.
+    :param max_attempts: Максимальна кількість відправок одного запиту.
+    :param reconcile_delay: Пауза перед звіркою в секундах, поки створений документ з'явиться у списку.
+    :param sleep: Функція очікування (для тестів).
+    """
+
+    def __init__(self, api, journal: SaveJournal, max_attempts: int = 3, reconcile_delay: float = 1.0,
+                 sleep: Callable[[float], None] = time.sleep):
+        super().__init__(api, journal, max_attempts, reconcile_delay)
+        self._sleep = sleep
+
+    def save_internet_document(self, data: SaveInternetDocumentRequest,
+                               key: Optional[str] = None) -> SaveInternetDocumentResponse:
+        """
+        Створення експрес-накладної не більше одного разу для ключа.
+
+        :param data: Pydantic-модель `SaveInternetDocumentRequest`.
+        :param key: Ключ ідемпотентності (наприклад, номер замовлення); за замовчуванням — `content_key`.
+        :return: Об'єкт `SaveInternetDocumentResponse` створеної або знайденої накладної.
+        """
+        result = self._save(DOCUMENT_SAVE, data.model_dump(exclude_unset=True), key)
+        return SaveInternetDocumentResponse.model_validate(result)
+
+    def save_counterparty(self, data: CounterpartyRequest, key: Optional[str] = None) -> CounterpartyResponse:
+        """
+        Створення контрагента не більше одного разу для ключа.
+
+        :param data: Pydantic-модель `CounterpartyRequest`.
+        :param key: Ключ ідемпотентності; за замовчуванням — `content_key`.
+        :return: Об'єкт `CounterpartyResponse` створеного або знайденого контрагента.
+        """
+        result = self._save(COUNTERPARTY_SAVE, data.model_dump(exclude_unset=True), key)
+        return CounterpartyResponse.model_validate(result)
+
+    def recover(self) -> int:
+        """
+        Звірка незавершених операцій, що лишилися після збою процесу.
+
+        Знайдені в API документи записуються як виконані; решта видаляється з журналу, тож наступний
+        запуск відправить їх заново.
+
+        :return: Кількість операцій, для яких документ знайдено.
+        """
+        found = 0
+        for entry in self.journal.pending():
+            if self._reconcile(entry.Key, entry.Operation, entry.Request) is not None:
+                found += 1
+            else:
+                self.journal.abandon(entry.Key)
+        return found
+
+    def _save(self, operation: str, request: dict, key: Optional[str]) -> dict:
+        key = key if key is not None else content_key(request)
+        stored = self.journal.completed(key)
+        if stored is not None:
+            return stored
+        if self.journal.is_pending(key):
+            found = self._reconcile(key, operation, request)
+            if found is not None:
+                return found
+
+        model, method = operation.split("/")
+        for attempt in range(1, self.max_attempts + 1):
+            self.journal.begin(key, operation, request)
+            try:
+                result = self.api.send_request(model, method, request)
+            except NovaPostApiError as error:
+                if not is_ambiguous(error):
+                    self.journal.abandon(key)
+                    raise
+                self._log_ambiguous(operation, key, attempt, error)
+                self._sleep(self.reconcile_delay)
+                found = self._reconcile(key, operation, request)
+                if found is not None:
+                    return found
+                if attempt == self.max_attempts:
+                    # Запис лишається незавершеним: наступний виклик або `recover` звірить його ще раз
+                    raise
+                continue
+            response = result[0] if result else {}
+            if self.journal.complete(key, operation, record_hash(request), response):
+                return response
+            # Створений документ уже забрала звірка іншого ключа з тими самими полями: шукаємо інший вільний
+            # документ або створюємо новий
+            self._log_taken(operation, key, response)
+            found = self._reconcile(key, operation, request)
+            if found is not None:
+                return found
+        raise NovaPostApiError([f"Не удалось закрепить документ за ключом {key} за {self.max_attempts} попыток"])
+
+    def _reconcile(self, key: str, operation: str, request: dict) -> Optional[dict]:
+        model, method, properties = self._lookup_request(operation, request)
+        # Кеш і об'єднання запитів можуть віддати список, отриманий до збереження
+        rows = self.api.send_request(model, method, properties, use_cache=False)
+        return self._claim(key, operation, request, rows or [])
+
+
+class AsyncJournaledSaver(BaseJournaledSaver):
+    """
+    Асинхронний варіант `JournaledSaver` для `AsyncNovaPostApi`.
+    """
+
+    async def save_internet_document(self, data: SaveInternetDocumentRequest,
+                                     key: Optional[str] = None) -> SaveInternetDocumentResponse:
+        result = await self._save(DOCUMENT_SAVE, data.model_dump(exclude_unset=True), key)
+        return SaveInternetDocumentResponse.model_validate(result)
+
+    async def save_counterparty(self, data: CounterpartyRequest, key: Optional[str] = None) -> CounterpartyResponse:
+        result = await self._save(COUNTERPARTY_SAVE, data.model_dump(exclude_unset=True), key)
+        return CounterpartyResponse.model_validate(result)
+
+    async def recover(self) -> int:
+        found = 0
+        for entry in self.journal.pending():
+            if await self._reconcile(entry.Key, entry.Operation, entry.Request) is not None:
+                found += 1
+            else:
+                self.journal.abandon(entry.Key)
+        return found
+
+    async def _save(self, operation: str, request: dict, key: Optional[str]) -> dict:
+        key = key if key is not None else content_key(request)
+        stored = self.journal.completed(key)
+        if stored is not None:
+            return stored
+        if self.journal.is_pending(key):
+            found = await self._reconcile(key, operation, request)
+            if found is not None:
+                return found
+
+        model, method = operation.split("/")
+        for attempt in range(1, self.max_attempts + 1):
+            self.journal.begin(key, operation, request)
+            try:
+                result = await self.api.send_request(model, method, request)
+            except NovaPostApiError as error:
+                if not is_ambiguous(error):
+                    self.journal.abandon(key)
+                    raise
+                self._log_ambiguous(operation, key, attempt, error)
+                await asyncio.sleep(self.reconcile_delay)
+                found = await self._reconcile(key, operation, request)
+                if found is not None:
+                    return found
+                if attempt == self.max_attempts:
+                    raise
+                continue
+            response = result[0] if result else {}
+            if self.journal.complete(key, operation, record_hash(request), response):
+                return response
+            self._log_taken(operation, key, response)
+            found = await self._reconcile(key, operation, request)
+            if found is not None:
+                return found
+        raise NovaPostApiError([f"Не удалось закрепить документ за ключом {key} за {self.max_attempts} попыток"])
+
+    async def _reconcile(self, key: str, operation: str, request: dict) -> Optional[dict]:
+        model, method, properties = self._lookup_request(operation, request)
+        rows = await self.api.send_request(model, method, properties, use_cache=False)
+        return self._claim(key, operation, request, rows or [])
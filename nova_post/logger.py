@@ -1,9 +1,53 @@
+import json
 import logging
+from typing import Optional
 
 logger = logging.getLogger("NovaPostApi")
-logger.setLevel(logging.INFO)
+logger.addHandler(logging.NullHandler())
 
-handler = logging.StreamHandler()
-handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s]: %(message)s"))
+LOG_FORMAT = "%(asctime)s [%(levelname)s]: %(message)s"
 
-logger.addHandler(handler)
+
+def configure_logging(level: int = logging.INFO, handler: Optional[logging.Handler] = None) -> logging.Handler:
+    """
+    Увімкнення виводу логів SDK.
+
+    За замовчуванням бібліотека не додає жодних обробників і не змінює рівень логера, тому вартість
+    виводу контролює застосунок. Ця функція повертає попередню поведінку: вивід у stderr у форматі `LOG_FORMAT`.
+
+    :param level: Рівень логера `NovaPostApi`.
+    :param handler: Власний обробник (за замовчуванням `logging.StreamHandler`).
+    :return: Доданий обробник.
+    """
+    if handler is None:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.setLevel(level)
+    logger.addHandler(handler)
+    return handler
+
+
+def mask_api_key(api_key: Optional[str]) -> str:
+    """
+    Маскування API-ключа для логів: залишаються лише останні 4 символи.
+    """
+    if not api_key:
+        return ""
+    return "***" + api_key[-4:] if len(api_key) > 8 else "***"
+
+
+class RedactedPayload:
+    """
+    Обгортка над тілом запиту, що серіалізується лише під час запису в лог.
+
+    `logging` викликає `str()` тільки для записів, що пройшли фільтр рівня, тому для відфільтрованих
+    повідомлень тіло запиту не форматується взагалі. Значення `apiKey` маскується.
+    """
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: dict):
+        self.payload = payload
+
+    def __str__(self) -> str:
+        redacted = dict(self.payload, apiKey=mask_api_key(self.payload.get("apiKey")))
+        return json.dumps(redacted, ensure_ascii=False, default=str)
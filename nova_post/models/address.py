@@ -1,6 +1,6 @@
 from typing import Optional, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 class City(BaseModel):
@@ -30,6 +30,43 @@ class Warehouse(BaseModel):
     - `Number` (str): Номер відділення.
     - `CityRef` (str): Ідентифікатор міста, в якому знаходиться відділення.
     - `TypeOfWarehouse` (Optional[str]): Тип відділення (необов'язковий).
+    - `Ref` (Optional[str]): Ідентифікатор відділення (необов'язковий).
+    - `ShortAddress` (Optional[str]): Коротка адреса українською мовою (необов'язковий).
+    - `ShortAddressRu` (Optional[str]): Коротка адреса російською мовою (необов'язковий).
+    - `Phone` (Optional[str]): Телефон відділення (необов'язковий).
+    - `CityDescription` (Optional[str]): Назва міста українською мовою (необов'язковий).
+    - `CityDescriptionRu` (Optional[str]): Назва міста російською мовою (необов'язковий).
+    - `SettlementRef` (Optional[str]): Ідентифікатор населеного пункту (необов'язковий).
+    - `SettlementDescription` (Optional[str]): Назва населеного пункту (необов'язковий).
+    - `SettlementAreaDescription` (Optional[str]): Область населеного пункту (необов'язковий).
+    - `SettlementRegionsDescription` (Optional[str]): Район населеного пункту (необов'язковий).
+    - `SettlementTypeDescription` (Optional[str]): Тип населеного пункту (необов'язковий).
+    - `Latitude` (Optional[float]): Широта (необов'язковий).
+    - `Longitude` (Optional[float]): Довгота (необов'язковий).
+    - `PostFinance` (Optional[str]): Наявність каси NovaPay, "1" або "0" (необов'язковий).
+    - `BicycleParking` (Optional[str]): Наявність велопарковки, "1" або "0" (необов'язковий).
+    - `PaymentAccess` (Optional[str]): Можливість оплати на відділенні, "1" або "0" (необов'язковий).
+    - `POSTerminal` (Optional[str]): Наявність POS-терміналу, "1" або "0" (необов'язковий).
+    - `InternationalShipping` (Optional[str]): Міжнародні відправлення, "1" або "0" (необов'язковий).
+    - `SelfServiceWorkplacesCount` (Optional[str]): Наявність терміналу самообслуговування (необов'язковий).
+    - `TotalMaxWeightAllowed` (Optional[float]): Максимальна вага відправлення, кг; 0 — без обмежень
+      (необов'язковий).
+    - `PlaceMaxWeightAllowed` (Optional[float]): Максимальна вага одного місця, кг; 0 — без обмежень
+      (необов'язковий).
+    - `SendingLimitationsOnDimensions` (Optional[dict]): Обмеження габаритів для відправлення (необов'язковий).
+    - `ReceivingLimitationsOnDimensions` (Optional[dict]): Обмеження габаритів для отримання (необов'язковий).
+    - `Reception` (Optional[dict]): Графік приймання відправлень за днями тижня (необов'язковий).
+    - `Delivery` (Optional[dict]): Графік видачі відправлень за днями тижня (необов'язковий).
+    - `Schedule` (Optional[dict]): Графік роботи за днями тижня (необов'язковий).
+    - `DistrictCode` (Optional[str]): Код району (необов'язковий).
+    - `WarehouseStatus` (Optional[str]): Статус відділення, наприклад "Working" (необов'язковий).
+    - `WarehouseStatusDate` (Optional[str]): Дата зміни статусу (необов'язковий).
+    - `CategoryOfWarehouse` (Optional[str]): Категорія відділення: "Branch", "Postomat" тощо (необов'язковий).
+    - `PostalCodeUA` (Optional[str]): Поштовий індекс (необов'язковий).
+    - `WarehouseIndex` (Optional[str]): Цифрова адреса відділення (необов'язковий).
+    - `PostMachineType` (Optional[str]): Тип поштомата (необов'язковий).
+    - `DenyToSelect` (Optional[str]): Заборона вибору відділення, "1" або "0" (необов'язковий).
+    - `OnlyReceivingParcel` (Optional[str]): Відділення лише для отримання, "1" або "0" (необов'язковий).
     """
     SiteKey: int
     Description: str
@@ -37,6 +74,46 @@ class Warehouse(BaseModel):
     Number: str
     CityRef: str
     TypeOfWarehouse: Optional[str] = None
+    Ref: Optional[str] = None
+    ShortAddress: Optional[str] = None
+    ShortAddressRu: Optional[str] = None
+    Phone: Optional[str] = None
+    CityDescription: Optional[str] = None
+    CityDescriptionRu: Optional[str] = None
+    SettlementRef: Optional[str] = None
+    SettlementDescription: Optional[str] = None
+    SettlementAreaDescription: Optional[str] = None
+    SettlementRegionsDescription: Optional[str] = None
+    SettlementTypeDescription: Optional[str] = None
+    Latitude: Optional[float] = None
+    Longitude: Optional[float] = None
+    PostFinance: Optional[str] = None
+    BicycleParking: Optional[str] = None
+    PaymentAccess: Optional[str] = None
+    POSTerminal: Optional[str] = None
+    InternationalShipping: Optional[str] = None
+    SelfServiceWorkplacesCount: Optional[str] = None
+    TotalMaxWeightAllowed: Optional[float] = None
+    PlaceMaxWeightAllowed: Optional[float] = None
+    SendingLimitationsOnDimensions: Optional[dict] = None
+    ReceivingLimitationsOnDimensions: Optional[dict] = None
+    Reception: Optional[dict] = None
+    Delivery: Optional[dict] = None
+    Schedule: Optional[dict] = None
+    DistrictCode: Optional[str] = None
+    WarehouseStatus: Optional[str] = None
+    WarehouseStatusDate: Optional[str] = None
+    CategoryOfWarehouse: Optional[str] = None
+    PostalCodeUA: Optional[str] = None
+    WarehouseIndex: Optional[str] = None
+    PostMachineType: Optional[str] = None
+    DenyToSelect: Optional[str] = None
+    OnlyReceivingParcel: Optional[str] = None
+
+    @field_validator("Latitude", "Longitude", "TotalMaxWeightAllowed", "PlaceMaxWeightAllowed", mode="before")
+    def empty_string_to_none(cls, value):
+        # API повертає числа рядками, а відсутні значення — порожнім рядком
+        return None if value == "" else value
 
 
 class Street(BaseModel):
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class TimeIntervalRequest(BaseModel):
@@ -49,6 +49,8 @@ class CargoTypeResponse(BaseModel):
     - `Ref` (str): Ідентифікатор типу вантажу.
     - `Description` (str): Опис типу вантажу.
     """
+    model_config = ConfigDict(frozen=True)
+
     Ref: str
     Description: str
 
@@ -63,6 +65,8 @@ class PalletResponse(BaseModel):
     - `DescriptionRu` (Optional[str]): Опис палети російською мовою (необов'язковий).
     - `Weight` (str): Вага палети.
     """
+    model_config = ConfigDict(frozen=True)
+
     Ref: str
     Description: str
     DescriptionRu: Optional[str] = None
@@ -77,6 +81,8 @@ class PayerForRedeliveryResponse(BaseModel):
     - `Ref` (str): Ідентифікатор платника.
     - `Description` (str): Опис платника.
     """
+    model_config = ConfigDict(frozen=True)
+
     Ref: str
     Description: str
 
@@ -95,6 +101,8 @@ class PackListResponse(BaseModel):
     - `VolumetricWeight` (str): Об'ємна вага упаковки.
     - `TypeOfPacking` (Optional[str]): Тип упаковки (необов'язковий).
     """
+    model_config = ConfigDict(frozen=True)
+
     Ref: str
     Description: str
     DescriptionRu: Optional[str] = None
@@ -116,6 +124,8 @@ class TiresWheelsResponse(BaseModel):
     - `Weight` (str): Вага товару.
     - `DescriptionType` (str): Тип позиції (Tires або Wheels).
     """
+    model_config = ConfigDict(frozen=True)
+
     Ref: str
     Description: str
     DescriptionRu: Optional[str] = None
@@ -132,6 +142,8 @@ class CargoDescriptionResponse(BaseModel):
     - `Description` (str): Опис вантажу українською мовою.
     - `DescriptionRu` (Optional[str]): Опис вантажу російською мовою (необов'язковий).
     """
+    model_config = ConfigDict(frozen=True)
+
     Ref: str
     Description: str
     DescriptionRu: Optional[str] = None
@@ -145,6 +157,8 @@ class ServiceTypeResponse(BaseModel):
     - `Ref` (str): Ідентифікатор технології доставки.
     - `Description` (str): Опис технології доставки.
     """
+    model_config = ConfigDict(frozen=True)
+
     Ref: str
     Description: str
 
@@ -157,5 +171,7 @@ class OwnershipFormResponse(BaseModel):
     - `Ref` (str): Ідентифікатор форми власності.
     - `Description` (str): Назва форми власності.
     """
+    model_config = ConfigDict(frozen=True)
+
     Ref: str
     Description: str
@@ -1,8 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Optional, Literal
 
 from pydantic import BaseModel, field_validator
 
+from ..utils import parse_date
+
 
 class DocumentPriceRequest(BaseModel):
     """
@@ -81,6 +83,13 @@ class DocumentDeliveryDateResponse(BaseModel):
     """
     DeliveryDate: dict
 
+    @property
+    def delivery_date(self) -> date:
+        """
+        Орієнтовна дата доставки як `datetime.date`.
+        """
+        return parse_date(self.DeliveryDate)
+
 
 class SaveInternetDocumentRequest(BaseModel):
     """
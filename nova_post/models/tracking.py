@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -37,3 +37,17 @@ class TrackingResponse(BaseModel):
     CitySender: Optional[str] = None
     RecipientDateTime: Optional[str] = None
     Phone: Optional[str] = None
+
+
+class TrackingBulkResponse(BaseModel):
+    """
+    Результат пакетного відстеження посилок.
+
+    Атрибути:
+    - `Documents` (Dict[str, TrackingResponse]): Відповіді API, згруповані за номером експрес-накладної.
+    - `Missing` (List[str]): Номери накладних, для яких API не повернуло жодного запису.
+    - `Failed` (Dict[str, str]): Номери накладних із фрагментів, запит яких завершився помилкою, і текст помилки.
+    """
+    Documents: Dict[str, TrackingResponse] = {}
+    Missing: List[str] = []
+    Failed: Dict[str, str] = {}
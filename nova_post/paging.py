@@ -0,0 +1,196 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def page_count(total_count: int, page_size: int) -> int:
+    """
+    Кількість сторінок для `total_count` записів при розмірі сторінки `page_size`.
+    """
+    return max(0, -(-total_count // page_size))
+
+
+def fan_out_pages(fetch_page: Callable[[int], List[T]], page_size: Optional[int], max_workers: int = 4,
+                  first_page: int = 1, last_page: Optional[int] = None) -> Iterator[List[T]]:
+    """
+    Паралельне завантаження сторінок із видачею результатів у порядку сторінок.
+
+    Одночасно виконується не більше `max_workers` запитів: щойно споживач забирає найстаршу сторінку,
+    запитується наступна (ковзне вікно). Якщо кількість сторінок відома (`last_page`), запитуються
+    рівно сторінки `first_page..last_page`. Інакше сторінки запитуються наперед, доки не трапиться
+    сторінка, коротша за `page_size` (або порожня, якщо розмір невідомий); зайві запити, що ще
+    не почалися, скасовуються.
+
+    :param fetch_page: Функція, що повертає записи сторінки за її номером.
+    :param page_size: Розмір сторінки (`Limit`) або `None`, якщо API не приймає `Limit`.
+    :param max_workers: Кількість сторінок, що завантажуються одночасно.
+    :param first_page: Номер першої сторінки.
+    :param last_page: Номер останньої сторінки, якщо він відомий (наприклад, з `TotalCount`).
+    :return: Ітератор непорожніх сторінок у порядку номерів.
+    """
+    if last_page is not None and last_page < first_page:
+        return
+    max_workers = max(1, max_workers)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    window: Deque[Future] = deque()
+    next_page = first_page
+
+    def submit():
+        nonlocal next_page
+        while len(window) < max_workers and (last_page is None or next_page <= last_page):
+            window.append(executor.submit(fetch_page, next_page))
+            next_page += 1
+
+    try:
+        submit()
+        while window:
+            result = window.popleft().result()
+            if last_page is None and _is_last_page(result, page_size):
+                if result:
+                    yield result
+                return
+            submit()
+            if result:
+                yield result
+    finally:
+        for future in window:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def afan_out_pages(fetch_page: Callable[[int], Awaitable[List[T]]], page_size: Optional[int],
+                         max_workers: int = 4, first_page: int = 1,
+                         last_page: Optional[int] = None) -> AsyncIterator[List[T]]:
+    """
+    Асинхронний варіант `fan_out_pages`: не більше `max_workers` завдань `asyncio` одночасно,
+    результати — у порядку сторінок.
+    """
+    if last_page is not None and last_page < first_page:
+        return
+    max_workers = max(1, max_workers)
+    window: Deque[asyncio.Future] = deque()
+    next_page = first_page
+
+    def submit():
+        nonlocal next_page
+        while len(window) < max_workers and (last_page is None or next_page <= last_page):
+            window.append(asyncio.ensure_future(fetch_page(next_page)))
+            next_page += 1
+
+    try:
+        submit()
+        while window:
+            result = await window.popleft()
+            if last_page is None and _is_last_page(result, page_size):
+                if result:
+                    yield result
+                return
+            submit()
+            if result:
+                yield result
+    finally:
+        for task in window:
+            task.cancel()
+
+
+def fetch_all_pages(fetch_page: Callable[[int], List[T]], page_size: int, max_workers: int = 4,
+                    first_page: int = 1) -> List[T]:
+    """
+    Завантаження всіх сторінок посторінкового методу API.
+
+    Сторінки запитуються паралельно (не більше `max_workers` одночасно, див. `fan_out_pages`), доки
+    не трапиться сторінка, коротша за `page_size` (остання). Результати об'єднуються в порядку сторінок.
+
+    :param fetch_page: Функція, що повертає записи сторінки за її номером.
+    :param page_size: Розмір сторінки (`Limit`), з яким викликається `fetch_page`.
+    :param max_workers: Кількість сторінок, що завантажуються одночасно.
+    :param first_page: Номер першої сторінки.
+    :return: Записи всіх сторінок.
+    """
+    items: List[T] = []
+    for result in fan_out_pages(fetch_page, page_size, max_workers, first_page):
+        items.extend(result)
+    return items
+
+
+async def afetch_all_pages(fetch_page: Callable[[int], Awaitable[List[T]]], page_size: int, max_workers: int = 4,
+                           first_page: int = 1) -> List[T]:
+    """
+    Асинхронний варіант `fetch_all_pages`: сторінки запитуються конкурентно, не більше `max_workers` одночасно.
+    """
+    items: List[T] = []
+    async for result in afan_out_pages(fetch_page, page_size, max_workers, first_page):
+        items.extend(result)
+    return items
+
+
+def page_filters(data: Optional[Any]) -> Tuple[dict, int]:
+    """
+    Фільтри запиту без `Page` і `Limit` та номер першої сторінки (`Page` з запиту або 1).
+    """
+    if data is None:
+        return {}, 1
+    return data.model_dump(exclude_unset=True, exclude={"Page", "Limit"}), getattr(data, "Page", None) or 1
+
+
+def _is_last_page(result: list, page_size: Optional[int]) -> bool:
+    return not result or (page_size is not None and len(result) < page_size)
+
+
+def iter_pages(fetch_page: Callable[[int], List[T]], page_size: Optional[int], first_page: int = 1,
+               prefetch: bool = True) -> Iterator[List[T]]:
+    """
+    Ліниве посторінкове читання: сторінки віддаються по одній, тож у пам'яті одночасно не більше двох.
+
+    Поки споживач обробляє поточну сторінку, наступна вже завантажується у фоновому потоці. Читання
+    закінчується на сторінці, коротшій за `page_size`, або на порожній, якщо розмір сторінки невідомий
+    (методи без параметра `Limit`).
+
+    :param fetch_page: Функція, що повертає записи сторінки за її номером.
+    :param page_size: Розмір сторінки (`Limit`) або `None`, якщо API не приймає `Limit`.
+    :param first_page: Номер першої сторінки.
+    :param prefetch: Завантажувати наступну сторінку у фоні.
+    :return: Ітератор непорожніх сторінок.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    page = first_page
+    pending: Optional[Future] = executor.submit(fetch_page, page) if executor is not None else None
+    try:
+        while True:
+            result = pending.result() if pending is not None else fetch_page(page)
+            last = _is_last_page(result, page_size)
+            pending = executor.submit(fetch_page, page + 1) if executor is not None and not last else None
+            if result:
+                yield result
+            if last:
+                return
+            page += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(fetch_page: Callable[[int], Awaitable[List[T]]], page_size: Optional[int],
+                      first_page: int = 1, prefetch: bool = True) -> AsyncIterator[List[T]]:
+    """
+    Асинхронний варіант `iter_pages`: наступна сторінка запитується окремим завданням `asyncio`,
+    поки споживач обробляє поточну.
+    """
+    page = first_page
+    pending: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page(page)) if prefetch else None
+    try:
+        while True:
+            result = await pending if pending is not None else await fetch_page(page)
+            last = _is_last_page(result, page_size)
+            pending = asyncio.ensure_future(fetch_page(page + 1)) if prefetch and not last else None
+            if result:
+                yield result
+            if last:
+                return
+            page += 1
+    finally:
+        if pending is not None:
+            pending.cancel()
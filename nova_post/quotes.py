@@ -0,0 +1,143 @@
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Callable, Optional, Sequence
+
+from .cache import MISSING, MemoryCache, cache_key
+from .models.internet_document import DocumentPriceRequest
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    try:
+        KYIV = ZoneInfo("Europe/Kyiv")
+    except ZoneInfoNotFoundError:  # pragma: no cover - Windows без пакета tzdata
+        KYIV = timezone(timedelta(hours=2))
+except ImportError:  # pragma: no cover - залежить від оточення
+    KYIV = timezone(timedelta(hours=2))
+
+# Вагові пороги тарифної сітки, кг; понад останній поріг вага округлюється до цілого кілограма
+DEFAULT_WEIGHT_STEPS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0)
+
+
+def tariff_day_ttl(now: float, tz: tzinfo = KYIV) -> float:
+    """
+    Кількість секунд від `now` (Unix-час) до початку наступного тарифного дня — опівночі за часом `tz`.
+    """
+    local = datetime.fromtimestamp(now, tz)
+    midnight = (local + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return max(midnight.timestamp() - now, 1.0)
+
+
+class QuotePolicy:
+    """
+    Нормалізація запиту `getDocumentPrice` перед пошуком у кеші котирувань.
+
+    Вага округлюється вгору до найближчого тарифного порогу `weight_steps`, а понад останній поріг — вгору
+    до кратного `weight_increment`. Оголошена вартість за заданого `cost_step` округлюється вгору до кратного
+    йому значення. Нормалізований запит і надсилається в API, тож котирування, збережене для кошика,
+    дійсне для всіх кошиків із тієї ж групи і не буває нижчим за точну ціну.
+
+    :param weight_steps: Вагові пороги тарифу в кілограмах (за зростанням); порожній — без порогів.
+    :param weight_increment: Крок округлення ваги понад останній поріг (`None` — не округлювати).
+    :param cost_step: Ширина діапазону оголошеної вартості в гривнях (`None` — точна вартість).
+    """
+
+    def __init__(self, weight_steps: Sequence[float] = DEFAULT_WEIGHT_STEPS, weight_increment: Optional[float] = 1.0,
+                 cost_step: Optional[int] = None):
+        self.weight_steps = tuple(sorted(weight_steps))
+        self.weight_increment = weight_increment
+        self.cost_step = cost_step
+
+    def round_weight(self, weight: float) -> float:
+        for step in self.weight_steps:
+            if weight <= step:
+                return step
+        if not self.weight_increment:
+            return weight
+        return math.ceil(weight / self.weight_increment) * self.weight_increment
+
+    def round_cost(self, cost: int) -> int:
+        if not self.cost_step:
+            return cost
+        return math.ceil(cost / self.cost_step) * self.cost_step
+
+    def normalize(self, data: DocumentPriceRequest) -> dict:
+        """
+        Параметри запиту (`methodProperties`) з округленими вагою та вартістю.
+        """
+        properties = data.model_dump(exclude_unset=True)
+        properties["Weight"] = self.round_weight(data.Weight)
+        if "Cost" in properties and properties["Cost"] is not None:
+            properties["Cost"] = self.round_cost(properties["Cost"])
+        return properties
+
+
+class QuoteCache:
+    """
+    Кеш котирувань `get_document_price` у пам'яті з витісненням за LRU.
+
+    Ключ — канонічні параметри нормалізованого запиту (міста, вага з точністю до тарифного порогу,
+    тип послуги й вантажу, кількість місць, діапазон вартості та решта заданих полів). Котирування
+    зберігається до кінця тарифного дня (опівночі за київським часом), але не довше за `max_ttl`.
+    Кеш підключається до клієнта параметром `quote_cache` і використовується адаптерами
+    `internet_document` синхронного й асинхронного клієнтів.
+
+    :param policy: Політика нормалізації `QuotePolicy`.
+    :param maxsize: Максимальна кількість котирувань.
+    :param max_ttl: Верхня межа часу життя котирування в секундах (`None` — до кінця тарифного дня).
+    :param tz: Часовий пояс, у якому змінюється тарифний день.
+    :param clock: Джерело Unix-часу (для тестів).
+    """
+
+    def __init__(self, policy: Optional[QuotePolicy] = None, maxsize: int = 4096, max_ttl: Optional[float] = None,
+                 tz: tzinfo = KYIV, clock: Callable[[], float] = time.time):
+        self.policy = policy if policy is not None else QuotePolicy()
+        self.max_ttl = max_ttl
+        self.tz = tz
+        self._clock = clock
+        self._quotes = MemoryCache(maxsize=maxsize, clock=clock)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, data: DocumentPriceRequest):
+        """
+        Пошук котирування: повертає `(ключ, параметри нормалізованого запиту, відповідь)`;
+        відповідь — `MISSING`, якщо котирування немає.
+        """
+        properties = self.policy.normalize(data)
+        key = cache_key("InternetDocument", "getDocumentPrice", properties)
+        quote = self._quotes.get(key)
+        with self._lock:
+            if quote is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return key, properties, quote
+
+    def store(self, key: str, quote: dict):
+        ttl = tariff_day_ttl(self._clock(), self.tz)
+        if self.max_ttl is not None:
+            ttl = min(ttl, self.max_ttl)
+        self._quotes.set(key, quote, ttl)
+
+    def stats(self) -> dict:
+        """
+        Статистика кешу: попадання (зекономлені запити), промахи, частка попадань і кількість котирувань.
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+            "size": len(self._quotes),
+        }
+
+    def clear(self):
+        self._quotes.clear()
+
+    def __len__(self) -> int:
+        return len(self._quotes)
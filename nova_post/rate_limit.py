@@ -0,0 +1,244 @@
+import hashlib
+import os
+import stat
+import struct
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+class TokenBucket:
+    """
+    Потокобезпечне відро токенів у межах одного процесу.
+
+    Працює за принципом резервування: `reserve()` одразу списує токен (рівень може стати від'ємним)
+    і повертає час, який потрібно зачекати, перш ніж виконати запит. Це дозволяє чекати як через
+    `time.sleep`, так і через `asyncio.sleep`.
+
+    :param rate: Швидкість поповнення, токенів за секунду.
+    :param capacity: Місткість відра (максимальний сплеск запитів).
+    :param clock: Джерело часу (для тестів).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Резервування `tokens` токенів.
+
+        :return: Кількість секунд, яку потрібно зачекати перед запитом (0, якщо токени вже є).
+        """
+        with self._lock:
+            now = self._clock()
+            self._level, delay = _take(self._level, self._updated, now, self.rate, self.capacity, tokens)
+            self._updated = now
+            return delay
+
+
+class FileTokenBucket:
+    """
+    Відро токенів, спільне для кількох процесів на одному хості.
+
+    Стан (рівень і час оновлення) зберігається у файлі розміром 16 байт, доступ до якого серіалізується
+    ексклюзивним блокуванням файлу (`fcntl.flock` на POSIX, `msvcrt.locking` на Windows). Файловий
+    дескриптор відкривається заново після `fork`, тож блокування коректно працює між воркерами gunicorn.
+
+    :param path: Шлях до файлу стану.
+    :param rate: Швидкість поповнення, токенів за секунду.
+    :param capacity: Місткість відра (максимальний сплеск запитів).
+    :param clock: Джерело часу; має бути спільним для всіх процесів (за замовчуванням `time.time`).
+    """
+
+    _STATE = struct.Struct("<dd")
+
+    def __init__(self, path: str, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.time):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.path = path
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+
+    def _descriptor(self) -> int:
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0), 0o600)
+            self._pid = os.getpid()
+        return self._fd
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Резервування `tokens` токенів.
+
+        :return: Кількість секунд, яку потрібно зачекати перед запитом (0, якщо токени вже є).
+        """
+        with self._lock:
+            fd = self._descriptor()
+            _lock_file(fd)
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                data = os.read(fd, self._STATE.size)
+                now = self._clock()
+                if len(data) == self._STATE.size:
+                    level, updated = self._STATE.unpack(data)
+                else:
+                    level, updated = self.capacity, now
+                level, delay = _take(level, updated, now, self.rate, self.capacity, tokens)
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, self._STATE.pack(level, now))
+                return delay
+            finally:
+                _unlock_file(fd)
+
+    def close(self):
+        if self._fd is not None and self._pid == os.getpid():
+            os.close(self._fd)
+        self._fd = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except OSError:
+            pass
+
+
+def default_directory() -> str:
+    """
+    Каталог файлів стану за замовчуванням, доступний лише поточному користувачу.
+
+    На POSIX — `$XDG_RUNTIME_DIR/nova_post` або `<tmp>/nova_post-<uid>` з правами `0700`; каталог, що
+    належить іншому користувачу або доступний на запис іншим, відхиляється, щоб сторонній процес не міг
+    підкласти чи заблокувати файл відра. На Windows системний тимчасовий каталог і так належить користувачу.
+
+    :return: Шлях до каталогу (створюється за потреби).
+    """
+    if not hasattr(os, "getuid"):  # pragma: no cover - Windows
+        directory = os.path.join(tempfile.gettempdir(), "nova_post")
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        directory = os.path.join(runtime, "nova_post")
+    else:
+        directory = os.path.join(tempfile.gettempdir(), f"nova_post-{os.getuid()}")
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"Каталог {directory} небезопасен для файлов ограничителя: "
+                              f"он должен принадлежать текущему пользователю и иметь права 0700")
+    return directory
+
+
+def _take(level: float, updated: float, now: float, rate: float, capacity: float,
+          tokens: float) -> Tuple[float, float]:
+    level = min(capacity, level + max(now - updated, 0) * rate) - tokens
+    return level, (-level / rate if level < 0 else 0.0)
+
+
+def _lock_file(fd: int):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(fd: int):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+Limit = Union[float, Tuple[float, float]]
+
+
+class RateLimiter:
+    """
+    Клієнтський обмежувач частоти запитів до API.
+
+    Для кожного API-ключа ведеться окреме відро токенів. Додатково можна задати ліміти для окремих
+    методів у форматі `modelName/calledMethod`: такий запит має отримати токен і із загального відра ключа,
+    і з відра методу.
+
+    :param rate: Загальний ліміт на ключ, запитів за секунду (`None` — без загального ліміту).
+    :param capacity: Місткість загального відра (сплеск); за замовчуванням дорівнює `rate`.
+    :param per_method: Ліміти для окремих методів: `{"Address/getWarehouses": 2}` або
+        `{"Address/getWarehouses": (rate, capacity)}`.
+    :param backend: `"thread"` — потокобезпечні відра в пам'яті процесу; `"file"` — відра у файлах,
+        спільні для всіх процесів хоста.
+    :param directory: Каталог для файлів стану при `backend="file"`; за замовчуванням — приватний каталог
+        користувача (`default_directory`).
+    """
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None,
+                 per_method: Optional[Mapping[str, Limit]] = None, backend: str = "thread",
+                 directory: Optional[str] = None):
+        if backend not in ("thread", "file"):
+            raise ValueError("backend must be 'thread' or 'file'")
+        self.rate = rate
+        self.capacity = capacity
+        self.per_method: Dict[str, Tuple[float, Optional[float]]] = {
+            key: (limit if isinstance(limit, tuple) else (limit, None)) for key, limit in (per_method or {}).items()
+        }
+        self.backend = backend
+        # Резервування у файловому відрі блокується на flock, тож асинхронний клієнт виконує його поза циклом подій
+        self.blocking = backend == "file"
+        self.directory = directory
+        self._buckets: Dict[Tuple[str, str], Union[TokenBucket, FileTokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, api_key: str, scope: str, rate: float, capacity: Optional[float]):
+        cache_key = (api_key, scope)
+        bucket = self._buckets.get(cache_key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(cache_key)
+                if bucket is None:
+                    if self.backend == "file":
+                        if self.directory is None:
+                            self.directory = default_directory()
+                        key_hash = hashlib.sha1(api_key.encode()).hexdigest()[:16]
+                        filename = f"nova_post_{key_hash}_{scope.replace('/', '_')}.bucket"
+                        bucket = FileTokenBucket(os.path.join(self.directory, filename), rate, capacity)
+                    else:
+                        bucket = TokenBucket(rate, capacity)
+                    self._buckets[cache_key] = bucket
+        return bucket
+
+    def reserve(self, api_key: str, model: str, method: str) -> float:
+        """
+        Резервування дозволу на один запит `model/method`.
+
+        :return: Кількість секунд, яку потрібно зачекати перед відправкою.
+        """
+        delay = 0.0
+        if self.rate is not None:
+            delay = self._bucket(api_key, "all", self.rate, self.capacity).reserve()
+        limit = self.per_method.get(f"{model}/{method}")
+        if limit is not None:
+            delay = max(delay, self._bucket(api_key, f"{model}/{method}", *limit).reserve())
+        return delay
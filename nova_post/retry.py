@@ -0,0 +1,90 @@
+import random
+from typing import Callable, Collection, Optional, Tuple, Type
+
+from .exceptions import NovaPostApiError, NovaPostTimeoutError, NovaPostConnectionError, NovaPostHttpError
+
+READ_METHOD_PREFIXES = ("get", "search")
+RETRYABLE_ERRORS: Tuple[Type[NovaPostApiError], ...] = (
+    NovaPostTimeoutError, NovaPostConnectionError, NovaPostHttpError
+)
+
+
+class RetryPolicy:
+    """
+    Політика повторних спроб для `send_request` з експоненційною затримкою та повним джитером.
+
+    Затримка перед спробою `n` (починаючи з 1) обирається випадково з проміжку
+    `[0, min(backoff_cap, backoff_base * 2 ** (n - 1))]`, тож клієнти, що впали одночасно,
+    не повторюють запити в один і той самий момент.
+
+    За замовчуванням повторюються лише методи читання (`getCities`, `getWarehouses`,
+    `getStatusDocuments`, `searchSettlements` тощо — назви, що починаються з `get` або `search`).
+    Методи запису (`save`, `update`, `delete` ...) повторюються лише при `retry_writes=True`
+    або якщо їх явно перелічено в `methods`.
+
+    :param max_attempts: Максимальна кількість спроб, включно з першою.
+    :param backoff_base: Базова затримка в секундах.
+    :param backoff_cap: Максимальна затримка між спробами в секундах.
+    :param deadline: Загальний бюджет часу на всі спроби в секундах (`None` — без обмеження).
+    :param methods: Явний перелік `calledMethod` або `modelName/calledMethod`, які можна повторювати,
+        на додачу до методів читання.
+    :param retry_writes: Повторювати будь-які методи, включно зі збереженням документів.
+    :param retryable_errors: Типи помилок, після яких запит повторюється (таймаут, помилка з'єднання,
+        HTTP 429/5xx).
+    :param retry_if: Додаткова умова для помилок API (`success: false`), наприклад, перевірка тексту помилки
+        про перевищення ліміту запитів.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff_base: float = 0.5, backoff_cap: float = 10.0,
+                 deadline: Optional[float] = 30.0, methods: Collection[str] = (), retry_writes: bool = False,
+                 retryable_errors: Tuple[Type[NovaPostApiError], ...] = RETRYABLE_ERRORS,
+                 retry_if: Optional[Callable[[NovaPostApiError], bool]] = None):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.deadline = deadline
+        self.methods = frozenset(methods)
+        self.retry_writes = retry_writes
+        self.retryable_errors = retryable_errors
+        self.retry_if = retry_if
+
+    def applies_to(self, model: str, method: str) -> bool:
+        """
+        Чи можна повторювати виклик `model/method`.
+        """
+        if self.max_attempts <= 1:
+            return False
+        if self.retry_writes or method.startswith(READ_METHOD_PREFIXES):
+            return True
+        return method in self.methods or f"{model}/{method}" in self.methods
+
+    def is_retryable(self, error: NovaPostApiError) -> bool:
+        """
+        Чи є помилка тимчасовою.
+        """
+        if isinstance(error, self.retryable_errors):
+            return True
+        return self.retry_if is not None and self.retry_if(error)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Затримка перед повтором після невдалої спроби номер `attempt` (повний джитер).
+        """
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
+
+    def next_delay(self, attempt: int, error: NovaPostApiError, remaining: Optional[float]) -> Optional[float]:
+        """
+        Затримка перед наступною спробою або `None`, якщо повторювати не слід.
+
+        :param attempt: Номер спроби, що щойно завершилась помилкою.
+        :param error: Помилка цієї спроби.
+        :param remaining: Залишок бюджету часу в секундах (`None` — без обмеження).
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        delay = self.backoff(attempt)
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
@@ -0,0 +1,54 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict
+
+
+class SingleFlight:
+    """
+    Об'єднання однакових одночасних викликів між потоками.
+
+    Перший потік, що викликав `do` з певним ключем, виконує функцію сам; потоки, що прийшли з тим самим
+    ключем, поки виклик ще триває, чекають на його завершення й отримують той самий результат
+    (або ту саму помилку). Після завершення ключ звільняється, тож наступний виклик виконується заново.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self.shared = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Виконує `fn` або приєднується до вже запущеного виклику з тим самим ключем.
+
+        :param key: Ключ виклику (наприклад, `cache_key` запиту).
+        :param fn: Функція без аргументів, що виконує запит.
+        :return: Результат `fn`, спільний для всіх учасників.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as error:
+            self._forget(key)
+            future.set_exception(error)
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: str):
+        with self._lock:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
@@ -0,0 +1,86 @@
+import threading
+from typing import Dict
+
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE, DEFAULT_POOLBLOCK
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionStats:
+    """
+    Потокобезпечні лічильники використання пулу з'єднань.
+
+    Атрибути:
+    - `requests` (int): Кількість надісланих HTTP-запитів.
+    - `created` (int): Кількість нових TCP/TLS-з'єднань.
+    - `discarded` (int): Кількість з'єднань, закритих через переповнений пул.
+    - `reused` (int): Кількість запитів, що пішли через вже відкрите з'єднання.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.created = 0
+        self.discarded = 0
+
+    def _increment(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.created, 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "created": self.created,
+                "reused": max(self.requests - self.created, 0),
+                "discarded": self.discarded,
+            }
+
+    def reset(self):
+        with self._lock:
+            self.requests = self.created = self.discarded = 0
+
+
+def _counting_pool_class(base: type, stats: ConnectionStats) -> type:
+    class CountingConnectionPool(base):
+        def _new_conn(self):
+            stats._increment("created")
+            return super()._new_conn()
+
+        def _put_conn(self, conn):
+            if conn is not None and self.pool is not None and self.pool.full():
+                stats._increment("discarded")
+            return super()._put_conn(conn)
+
+    CountingConnectionPool.__name__ = f"Counting{base.__name__}"
+    return CountingConnectionPool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    `HTTPAdapter`, що веде статистику створених і повторно використаних з'єднань.
+
+    :param pool_connections: Кількість пулів (хостів), що зберігаються в кеші.
+    :param pool_maxsize: Максимальна кількість з'єднань з одним хостом, що зберігаються в пулі.
+    :param pool_block: Чекати на вільне з'єднання замість відкриття додаткового понад `pool_maxsize`.
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOLSIZE, pool_maxsize: int = DEFAULT_POOLSIZE,
+                 pool_block: bool = DEFAULT_POOLBLOCK, **kwargs):
+        self.stats = ConnectionStats()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block,
+                         **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.stats),
+        }
+
+    def send(self, request, *args, **kwargs):
+        self.stats._increment("requests")
+        return super().send(request, *args, **kwargs)
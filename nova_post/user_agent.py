@@ -0,0 +1,73 @@
+import random
+import threading
+from typing import Callable, List, Optional, Sequence, Union
+
+DEFAULT_USER_AGENT = "nova-post-python (+https://github.com/TrippyFrenemy/nova_post)"
+
+
+class StaticUserAgent:
+    """
+    Політика з незмінним заголовком User-Agent (використовується за замовчуванням).
+
+    :param value: Значення заголовка.
+    """
+
+    def __init__(self, value: str = DEFAULT_USER_AGENT):
+        self.value = value
+
+    def __call__(self) -> str:
+        return self.value
+
+
+class RotatingUserAgent:
+    """
+    Політика, що обирає випадковий User-Agent браузера з пулу.
+
+    Пул будується ліниво при першому запиті: `fake_useragent` імпортується лише тоді, коли ротацію
+    справді увімкнено, і одразу генерує `pool_size` значень, щоб не звертатися до бази браузерів
+    на кожен запит.
+
+    :param pool_size: Кількість заголовків у пулі.
+    :param agents: Готовий список заголовків; якщо задано, `fake_useragent` не використовується.
+    :param browsers: Перелік браузерів для `fake_useragent.UserAgent` (необов'язково).
+    """
+
+    def __init__(self, pool_size: int = 50, agents: Optional[Sequence[str]] = None,
+                 browsers: Optional[List[str]] = None):
+        self.pool_size = pool_size
+        self.browsers = browsers
+        self._pool: Optional[List[str]] = list(agents) if agents else None
+        self._lock = threading.Lock()
+
+    def _build_pool(self) -> List[str]:
+        try:
+            from fake_useragent import UserAgent
+        except ImportError as e:
+            raise ImportError("Для ротації User-Agent потрібен fake-useragent: pip install nova-post[rotate]") from e
+
+        ua = UserAgent(browsers=self.browsers) if self.browsers else UserAgent()
+        return list({ua.random for _ in range(self.pool_size)})
+
+    def __call__(self) -> str:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = self._build_pool()
+        return random.choice(self._pool)
+
+
+UserAgentPolicy = Union[str, Callable[[], str]]
+
+
+def resolve_user_agent(policy: Optional[UserAgentPolicy]) -> Callable[[], str]:
+    """
+    Перетворення налаштування User-Agent на функцію без аргументів.
+
+    :param policy: `None` (стандартний заголовок SDK), рядок або об'єкт, що повертає заголовок при виклику.
+    :return: Функція, що повертає значення заголовка для чергового запиту.
+    """
+    if policy is None:
+        return StaticUserAgent()
+    if isinstance(policy, str):
+        return StaticUserAgent(policy)
+    return policy
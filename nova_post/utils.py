@@ -0,0 +1,43 @@
+from datetime import date, datetime
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar, Union
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Розбиття послідовності на списки довжиною не більше `size` елементів.
+
+    :param items: Довільна ітерована послідовність.
+    :param size: Максимальний розмір одного фрагмента.
+    :return: Ітератор по фрагментах.
+    """
+    if size < 1:
+        raise ValueError("size must be >= 1")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_date(value: Union[dict, str, date]) -> date:
+    """
+    Розбір дати з відповіді API: рядка `дд.мм.рррр` або `рррр-мм-дд[ гг:хх:сс...]`, а також об'єкта
+    `{"date": "2025-03-20 00:00:00.000000", "timezone_type": 3, "timezone": "Europe/Kyiv"}`.
+
+    :param value: Значення поля дати з відповіді.
+    :return: Дата без часу.
+    """
+    if isinstance(value, dict):
+        value = value.get("date", "")
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = value.strip()
+    if "." in text[:3]:
+        return datetime.strptime(text[:10], "%d.%m.%Y").date()
+    return date.fromisoformat(text[:10])
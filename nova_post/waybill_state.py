@@ -0,0 +1,226 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Union
+
+from pydantic import BaseModel
+
+from .directories.sync import record_hash
+from .models.internet_document import DocumentListRequest, DocumentListResponse
+from .utils import chunked
+
+Row = Union[DocumentListResponse, dict]
+
+
+class StateTransition(BaseModel):
+    """
+    Зміна статусу експрес-накладної.
+
+    Атрибути:
+    - `Ref` (str): Ідентифікатор експрес-накладної.
+    - `IntDocNumber` (str): Номер експрес-накладної.
+    - `PreviousStateId` (Optional[int]): Попередній статус (`None` — накладна побачена вперше).
+    - `PreviousStateName` (Optional[str]): Опис попереднього статусу.
+    - `StateId` (int): Новий статус.
+    - `StateName` (str): Опис нового статусу.
+    - `ChangedAt` (float): Час виявлення зміни (Unix time).
+    """
+    Ref: str
+    IntDocNumber: str
+    PreviousStateId: Optional[int] = None
+    PreviousStateName: Optional[str] = None
+    StateId: int
+    StateName: str
+    ChangedAt: float
+
+
+class WaybillStateStore:
+    """
+    Локальне сховище експрес-накладних у SQLite з історією статусів.
+
+    Рядки `getDocumentList` додаються або оновлюються за `Ref`; сховище повертає лише зміни `StateId`,
+    тож повторне вивантаження того самого списку нічого не повертає. Рядок без змін не перезаписується.
+    Кожна зміна зберігається в історії накладної. Сховище можна використовувати з кількох потоків.
+
+    :param path: Шлях до файлу бази даних (`":memory:"` — лише на час роботи процесу).
+    :param on_transition: Функція, що викликається для кожної зміни до фіксації транзакції; виняток у ній
+        скасовує весь пакет, і ті самі зміни буде повернуто під час наступного оновлення.
+    :param emit_new: Повертати накладні, побачені вперше (з `PreviousStateId=None`).
+    :param clock: Джерело часу (Unix time).
+    """
+
+    def __init__(self, path: str = ":memory:", on_transition: Optional[Callable[[StateTransition], None]] = None,
+                 emit_new: bool = True, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.on_transition = on_transition
+        self.emit_new = emit_new
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                ref TEXT PRIMARY KEY, int_doc_number TEXT NOT NULL, state_id INTEGER NOT NULL,
+                state_name TEXT NOT NULL, data TEXT NOT NULL, data_hash TEXT NOT NULL, updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS documents_number ON documents (int_doc_number);
+            CREATE TABLE IF NOT EXISTS history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, ref TEXT NOT NULL, int_doc_number TEXT NOT NULL,
+                previous_state_id INTEGER, previous_state_name TEXT, state_id INTEGER NOT NULL,
+                state_name TEXT NOT NULL, changed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS history_ref ON history (ref);
+        """)
+
+    def apply(self, rows: Iterable[Row]) -> List[StateTransition]:
+        """
+        Додавання або оновлення пакета накладних однією транзакцією.
+
+        :param rows: Об'єкти `DocumentListResponse` або словники з відповіді `getDocumentList`.
+        :return: Зміни статусів у порядку рядків.
+        """
+        return self._apply(_dump(rows), self.clock(), commit=True)
+
+    def _apply(self, rows: List[dict], now: float, commit: bool) -> List[StateTransition]:
+        # Без commit пакет лише обчислюється: транзакція відкочується, `on_transition` не викликається
+        transitions = []
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                for row in rows:
+                    transition = self._upsert(row, now)
+                    if transition is not None:
+                        transitions.append(transition)
+                if commit and self.on_transition is not None:
+                    for transition in transitions:
+                        self.on_transition(transition)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT" if commit else "ROLLBACK")
+        return transitions
+
+    def changes(self, rows: Iterable[Row], chunk_size: int = 500) -> Iterator[StateTransition]:
+        """
+        Потокова обробка: рядки зберігаються пакетами по `chunk_size`. Підходить для `iter_document_list`,
+        щоб не тримати весь список у пам'яті.
+
+        Пакет фіксується лише після того, як споживач забрав усі його зміни (запросив наступний елемент
+        після останньої зміни пакета). Якщо споживач перервав ітерацію або впав посеред пакета, пакет
+        не зберігається, і ті самі зміни буде повернуто під час наступного оновлення (доставка
+        щонайменше один раз). Пакет обчислюється двічі — до віддачі змін і під час фіксації; якщо між ними
+        ті самі накладні оновив інший потік, в історію потрапляють зміни, обчислені під час фіксації.
+
+        :param rows: Ітерована послідовність рядків `getDocumentList`.
+        :param chunk_size: Розмір пакета.
+        :return: Ітератор змін статусів.
+        """
+        for chunk in chunked(rows, chunk_size):
+            chunk, now = _dump(chunk), self.clock()
+            yield from self._apply(chunk, now, commit=False)
+            self._apply(chunk, now, commit=True)
+
+    async def achanges(self, rows: AsyncIterable[Row], chunk_size: int = 500) -> AsyncIterator[StateTransition]:
+        """
+        Асинхронний варіант `changes` для `AsyncNovaPostApi.internet_document.iter_document_list`; робота
+        з SQLite виконується в окремому потоці, не блокуючи цикл подій.
+        """
+        chunk = []
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                async for transition in self._achunk(chunk):
+                    yield transition
+                chunk = []
+        if chunk:
+            async for transition in self._achunk(chunk):
+                yield transition
+
+    async def _achunk(self, rows: List[Row]) -> AsyncIterator[StateTransition]:
+        rows, now = _dump(rows), self.clock()
+        for transition in await asyncio.to_thread(self._apply, rows, now, False):
+            yield transition
+        await asyncio.to_thread(self._apply, rows, now, True)
+
+    def pull(self, api, data: DocumentListRequest, chunk_size: int = 500) -> Iterator[StateTransition]:
+        """
+        Вивантаження накладних за фільтрами `data` з поверненням лише змін статусів; пакети фіксуються
+        так само, як у `changes`.
+
+        :param api: Синхронний клієнт `NovaPostApi`.
+        :param data: Pydantic-модель `DocumentListRequest`.
+        :param chunk_size: Розмір пакета.
+        :return: Ітератор змін статусів.
+        """
+        # Кешований список повторював би попередній стан, і зміни не виявлялися б до кінця TTL
+        return self.changes(api.internet_document.iter_document_list(data, use_cache=False), chunk_size)
+
+    def get(self, key: str) -> Optional[DocumentListResponse]:
+        """
+        Останній збережений рядок накладної за `Ref` або `IntDocNumber`.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM documents WHERE ref = ? OR int_doc_number = ? LIMIT 1",
+                                           (key, key)).fetchone()
+        return DocumentListResponse.model_validate(json.loads(row[0])) if row is not None else None
+
+    def history(self, key: str) -> List[StateTransition]:
+        """
+        Історія статусів накладної за `Ref` або `IntDocNumber` від найдавнішого.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT ref, int_doc_number, previous_state_id, previous_state_name, state_id, state_name, changed_at "
+                "FROM history WHERE ref = ? OR int_doc_number = ? ORDER BY id", (key, key)
+            ).fetchall()
+        return [self._transition(*row) for row in rows]
+
+    def _upsert(self, row: dict, now: float) -> Optional[StateTransition]:
+        ref, number = row["Ref"], str(row["IntDocNumber"])
+        state_id, state_name = int(row["StateId"]), row["StateName"]
+        data, data_hash = json.dumps(row, ensure_ascii=False, default=str), record_hash(row)
+        current = self._connection.execute("SELECT state_id, state_name, data_hash FROM documents WHERE ref = ?",
+                                           (ref,)).fetchone()
+        if current is None:
+            self._connection.execute(
+                "INSERT INTO documents (ref, int_doc_number, state_id, state_name, data, data_hash, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", (ref, number, state_id, state_name, data, data_hash, now)
+            )
+            transition = self._record(ref, number, None, None, state_id, state_name, now)
+            return transition if self.emit_new else None
+        previous_id, previous_name, previous_hash = current
+        if previous_hash != data_hash:
+            self._connection.execute(
+                "UPDATE documents SET int_doc_number = ?, state_id = ?, state_name = ?, data = ?, data_hash = ?, "
+                "updated_at = ? WHERE ref = ?", (number, state_id, state_name, data, data_hash, now, ref)
+            )
+        if previous_id == state_id:
+            return None
+        return self._record(ref, number, previous_id, previous_name, state_id, state_name, now)
+
+    def _record(self, *values) -> StateTransition:
+        self._connection.execute(
+            "INSERT INTO history (ref, int_doc_number, previous_state_id, previous_state_name, state_id, state_name, "
+            "changed_at) VALUES (?, ?, ?, ?, ?, ?, ?)", values
+        )
+        return self._transition(*values)
+
+    @staticmethod
+    def _transition(ref, number, previous_id, previous_name, state_id, state_name, changed_at) -> StateTransition:
+        return StateTransition(Ref=ref, IntDocNumber=number, PreviousStateId=previous_id,
+                               PreviousStateName=previous_name, StateId=state_id, StateName=state_name,
+                               ChangedAt=changed_at)
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+
+def _dump(rows: Iterable[Row]) -> List[dict]:
+    return [row if isinstance(row, dict) else row.model_dump() for row in rows]
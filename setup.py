@@ -17,9 +17,13 @@ setup(
         "Operating System :: OS Independent",
     ],
     install_requires=[
-        "fake-useragent>=2.1.0",
         "pydantic>=2.10.6",
         "requests>=2.32.3",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9"],
+        "rotate": ["fake-useragent>=2.1.0"],
+        "parquet": ["pyarrow>=14"],
+    },
     python_requires=">=3.9",
 )
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nova_post.async_api import AsyncNovaPostApi
+from nova_post.exceptions import NovaPostApiError
+from nova_post.models.address import GetCitiesRequest
+from nova_post.models.tracking import TrackingRequest
+from nova_post.rate_limit import RateLimiter
+
+
+class FakeResponse:
+    def __init__(self, payload, status=200):
+        self.payload = payload
+        self.status = status
+
+    async def json(self, content_type=None):
+        if isinstance(self.payload, Exception):
+            raise self.payload
+        return self.payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+@pytest.fixture
+def api():
+    return AsyncNovaPostApi(api_key="test-key", session=MagicMock(closed=False))
+
+
+def test_send_request_returns_data(api):
+    api.session.post.return_value = FakeResponse({"success": True, "data": [{"Ref": "city1"}]})
+
+    result = asyncio.run(api.send_request("Address", "getCities", {}))
+
+    assert result == [{"Ref": "city1"}]
+    payload = api.session.post.call_args.kwargs["json"]
+    assert payload["modelName"] == "Address"
+    assert payload["calledMethod"] == "getCities"
+
+
+def test_send_request_api_error(api):
+    api.session.post.return_value = FakeResponse({"success": False, "errors": ["Bad key"]})
+
+    with pytest.raises(NovaPostApiError, match="Bad key"):
+        asyncio.run(api.send_request("Address", "getCities", {}))
+
+
+def test_send_request_timeout(api):
+    api.session.post.side_effect = asyncio.TimeoutError()
+
+    with pytest.raises(NovaPostApiError, match="Таймаут запроса"):
+        asyncio.run(api.send_request("Address", "getCities", {}))
+
+
+def test_adapters_are_awaitable_and_cached(api):
+    api.send_request = AsyncMock(return_value=[
+        {"Ref": "city1", "Description": "Київ"},
+        {"Ref": "city2", "Description": "Львів"},
+    ])
+
+    cities = asyncio.run(api.address.get_cities(GetCitiesRequest(FindByString="Київ")))
+
+    assert [city.Ref for city in cities] == ["city1", "city2"]
+    assert api.address is api.address
+    api.send_request.assert_awaited_once_with("Address", "getCities", {"FindByString": "Київ"})
+
+
+def test_concurrent_tracking(api):
+    async def fake_send_request(model, method, properties):
+        await asyncio.sleep(0)
+        number = properties["Documents"][0]["DocumentNumber"]
+        return [{"Number": number, "Status": "Відправлення отримано"}]
+
+    api.send_request = fake_send_request
+
+    async def track_all():
+        requests = [TrackingRequest(DocumentNumber=str(n)) for n in range(20)]
+        return await asyncio.gather(*(api.tracking.track_parcel(r) for r in requests))
+
+    results = asyncio.run(track_all())
+    assert [r.Number for r in results] == [str(n) for n in range(20)]
+
+
+def test_unknown_adapter(api):
+    with pytest.raises(AttributeError):
+        api.unknown_adapter
+
+
+def test_track_parcels(api):
+    async def fake_send_request(model, method, properties):
+        return [{"Number": doc["DocumentNumber"], "Status": "Відправлення отримано"}
+                for doc in properties["Documents"][1:]]
+
+    api.send_request = fake_send_request
+    requests = [TrackingRequest(DocumentNumber=str(n)) for n in range(150)]
+
+    result = asyncio.run(api.tracking.track_parcels(requests))
+
+    assert len(result.Documents) == 148
+    assert result.Missing == ["0", "100"]
+
+
+def test_file_rate_limiter_runs_off_event_loop(tmp_path):
+    limiter = RateLimiter(rate=100, backend="file", directory=str(tmp_path))
+    threads = []
+    reserve = limiter.reserve
+
+    def record_thread(*args):
+        threads.append(threading.get_ident())
+        return reserve(*args)
+
+    limiter.reserve = record_thread
+    api = AsyncNovaPostApi(api_key="test-key", session=MagicMock(closed=False), rate_limiter=limiter)
+    api.session.post.return_value = FakeResponse({"success": True, "data": []})
+
+    async def run():
+        await api.send_request("Address", "getCities", {})
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+
+    # Блокувальний flock виконується в окремому потоці, а не в потоці циклу подій
+    assert len(threads) == 1 and threads[0] != loop_thread
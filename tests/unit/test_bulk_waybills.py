@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from pydantic import ValidationError
+
+from nova_post.api import NovaPostApi
+from nova_post.async_api import AsyncNovaPostApi
+from nova_post.bulk import AsyncBulkWaybillCreator, BulkWaybillCreator
+from nova_post.exceptions import NovaPostApiError
+from nova_post.journal import SaveJournal
+from nova_post.models import internet_document
+from nova_post.models.internet_document import SaveInternetDocumentResponse
+
+CITY = "8d5a980d-391c-11dd-90d9-001a92567626"
+
+
+def waybill(n, **fields):
+    data = {
+        "PayerType": "Sender", "PaymentMethod": "Cash", "DateTime": "", "CargoType": "Parcel", "Weight": 1.0,
+        "ServiceType": "WarehouseWarehouse", "SeatsAmount": 1, "Description": f"Замовлення {n}", "Cost": 500,
+        "CitySender": CITY, "Sender": "sender", "SenderAddress": "address", "ContactSender": "contact",
+        "SendersPhone": "380501112233", "CityRecipient": CITY, "Recipient": f"recipient-{n}",
+        "RecipientAddress": "address", "ContactRecipient": "contact", "RecipientsPhone": "380671112233",
+    }
+    data.update(fields)
+    return data
+
+
+def fake_save(model, method, properties):
+    n = int(properties["Description"].split()[-1])
+    if n == 13:
+        raise NovaPostApiError(["Recipient not found"])
+    return [{"Ref": f"ref-{n}", "CostOnSite": 70, "EstimatedDeliveryDate": "01.01.2025",
+             "IntDocNumber": str(20400000000000 + n), "TypeDocument": "InternetDocument"}]
+
+
+def make_api(side_effect=fake_save):
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=side_effect)
+    return api
+
+
+def test_results_stream_back_with_input_indexes():
+    api = make_api()
+    creator = BulkWaybillCreator(api, max_workers=4)
+
+    results = dict(creator.create([waybill(n) for n in range(20)] + [waybill(20, Weight="важкий")]))
+
+    assert sorted(results) == list(range(21))
+    assert isinstance(results[20], ValidationError)
+    assert isinstance(results[13], NovaPostApiError)
+    assert results[7].IntDocNumber == "20400000000007"
+    assert api.send_request.call_count == 20
+    assert (creator.created, creator.failed, creator.skipped) == (19, 2, 0)
+
+
+def test_validation_happens_before_first_request():
+    api = make_api()
+    results = BulkWaybillCreator(api).create([waybill(0), {"PayerType": "Sender"}])
+
+    index, error = next(results)
+
+    assert (index, type(error)) == (1, ValidationError)
+    assert api.send_request.call_count == 0
+    results.close()
+
+
+def test_concurrency_is_bounded():
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def slow_save(model, method, properties):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return fake_save(model, method, properties)
+
+    results = list(BulkWaybillCreator(make_api(slow_save), max_workers=3).create([waybill(n) for n in range(12)]))
+
+    assert len(results) == 12
+    assert 1 < peak <= 3
+
+
+def test_idempotency_keys_prevent_duplicates_on_restart(tmp_path):
+    path = str(tmp_path / "journal.db")
+    orders = [waybill(n) for n in range(6)]
+    keys = [f"order-{n}" for n in range(6)]
+
+    first_api = make_api()
+    first = BulkWaybillCreator(first_api, journal=SaveJournal(path), max_workers=1).create(orders, keys=keys)
+    # Запуск перервано після трьох накладних
+    for _ in range(3):
+        next(first)
+    first.close()
+    sent = first_api.send_request.call_count
+
+    second_api = make_api()
+    creator = BulkWaybillCreator(second_api, journal=SaveJournal(path))
+    results = dict(creator.create(orders + [waybill(0)], keys=keys + ["order-0"]))
+
+    assert sent + second_api.send_request.call_count == 6
+    assert creator.skipped == sent + 1
+    assert all(isinstance(results[n], SaveInternetDocumentResponse) for n in range(7))
+    assert results[6].Ref == results[0].Ref == "ref-0"
+
+
+def test_default_keys_survive_restart_after_midnight(tmp_path, monkeypatch):
+    class Clock(datetime):
+        today = datetime(2025, 3, 1, 23, 50)
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.today
+
+    monkeypatch.setattr(internet_document, "datetime", Clock)
+    path = str(tmp_path / "journal.db")
+    orders = [waybill(n, DateTime="01.03.2025") for n in range(4)]
+
+    first_api = make_api()
+    first = BulkWaybillCreator(first_api, journal=SaveJournal(path), max_workers=1).create(orders)
+    next(first)
+    next(first)
+    first.close()
+    sent = first_api.send_request.call_count
+
+    # Після опівночі валідатор переписує DateTime на 02.03.2025, але ключі за замовчуванням не змінюються
+    Clock.today = datetime(2025, 3, 2, 0, 10)
+    second_api = make_api()
+    creator = BulkWaybillCreator(second_api, journal=SaveJournal(path))
+    results = dict(creator.create(orders))
+
+    assert creator.skipped == sent and sent + second_api.send_request.call_count == 4
+    assert {call.args[2]["DateTime"] for call in second_api.send_request.call_args_list} == {"02.03.2025"}
+    assert sorted(result.Ref for result in results.values()) == [f"ref-{n}" for n in range(4)]
+
+
+def test_async_bulk_create():
+    async def run():
+        async with AsyncNovaPostApi(api_key="test-key") as api:
+            api.send_request = AsyncMock(side_effect=fake_save)
+            creator = AsyncBulkWaybillCreator(api, max_workers=4)
+            return {index: result async for index, result in creator.create([waybill(n) for n in range(15)])}
+
+    results = asyncio.run(run())
+
+    assert sorted(results) == list(range(15))
+    assert isinstance(results[13], NovaPostApiError)
+    assert results[14].Ref == "ref-14"
@@ -0,0 +1,144 @@
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+import pydantic
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.cache import MISSING, MemoryCache, ResponseCache, SQLiteCache, cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_key_is_canonical():
+    assert cache_key("Address", "getCities", {"Page": 1, "Limit": 5}) == \
+        cache_key("Address", "getCities", {"Limit": 5, "Page": 1})
+    assert cache_key("Address", "getCities", None) == cache_key("Address", "getCities", {})
+    assert cache_key("Address", "getCities", {}) != cache_key("Address", "getAreas", {})
+
+
+def test_memory_cache_ttl_and_lru():
+    clock = FakeClock()
+    cache = MemoryCache(maxsize=2, clock=clock)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3, ttl=10)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+
+    clock.now = 11
+    assert cache.get("a") is MISSING
+    assert len(cache) == 1
+
+
+@pytest.fixture
+def api():
+    api = NovaPostApi(api_key="test-key", cache=ResponseCache())
+    api._send_with_retry = MagicMock(side_effect=lambda payload, timeout: [
+        {"Ref": "Cargo", "Description": "Вантаж"},
+        {"Ref": "Documents", "Description": "Документи"},
+    ])
+    return api
+
+
+def test_common_reference_lists_are_cached(api):
+    first = api.common.get_cargo_types()
+    second = api.common.get_cargo_types()
+
+    assert api._send_with_retry.call_count == 1
+    # Моделі спільні для всіх викликів, а список у кожного викликача власний
+    assert isinstance(first, list) and second is not first
+    assert all(a is b for a, b in zip(first, second))
+    assert [item.Ref for item in first] == ["Cargo", "Documents"]
+    first.append(None)
+    assert len(api.common.get_cargo_types()) == 2
+    assert api.cache.hits == 2 and api.cache.misses == 1
+
+
+def test_cached_models_are_immutable(api):
+    cargo_types = api.common.get_cargo_types()
+    with pytest.raises(pydantic.ValidationError):
+        cargo_types[0].Description = "changed"
+
+
+def test_methods_without_ttl_are_not_cached(api):
+    api.send_request("Counterparty", "getCounterparties", {})
+    api.send_request("Counterparty", "getCounterparties", {})
+    assert api._send_with_retry.call_count == 2
+
+
+def test_default_ttl_applies_only_to_read_methods(api):
+    api.cache = ResponseCache(default_ttl=60)
+    assert api.cache.ttl_for("InternetDocument", "save") is None
+    assert api.cache.ttl_for("Counterparty", "getCounterparties") == 60
+
+    api.send_request("Counterparty", "getCounterparties", {})
+    api.send_request("Counterparty", "getCounterparties", {})
+    # Повторне однакове видалення має дійти до API, а не повернути збережену відповідь
+    api.send_request("InternetDocument", "delete", {"DocumentRefs": ["ref-1"]})
+    api.send_request("InternetDocument", "delete", {"DocumentRefs": ["ref-1"]})
+    assert api._send_with_retry.call_count == 3
+
+
+def test_per_method_ttl_and_invalidate(api):
+    api.cache = ResponseCache(ttls={"Address/getAreas": 60})
+    api.send_request("Address", "getAreas", {})
+    api.send_request("Address", "getAreas", {})
+    assert api._send_with_retry.call_count == 1
+
+    api.cache.invalidate("Address", "getAreas")
+    api.send_request("Address", "getAreas", {})
+    assert api._send_with_retry.call_count == 2
+
+
+def test_without_cache_every_call_hits_network():
+    api = NovaPostApi(api_key="test-key")
+    api._send_with_retry = MagicMock(return_value=[{"Ref": "r", "Description": "d"}])
+    api.common.get_service_types()
+    api.common.get_service_types()
+    assert api._send_with_retry.call_count == 2
+
+
+def test_import_does_not_load_sqlite3():
+    """Тест: sqlite3 завантажується лише разом із SQLiteCache"""
+    code = "import sys, nova_post.api; print('sqlite3' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "False"
+
+
+def test_sqlite_cache_roundtrip_and_ttl(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteCache(str(tmp_path / "cache.db"), clock=clock)
+    value = [{"Ref": "city1", "Description": "Київ"}]
+
+    cache.set("k", value, ttl=60)
+    assert cache.get("k") == value
+    assert cache.get("other") is MISSING
+
+    clock.now = 61
+    assert cache.get("k") is MISSING
+    assert cache.purge_expired() == 1
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    api = NovaPostApi(api_key="test-key", cache=ResponseCache(backend=SQLiteCache(path)))
+    api._send_with_retry = MagicMock(return_value=[{"Ref": "area1", "Description": "Київська"}])
+    api.address.get_areas()
+
+    restarted = NovaPostApi(api_key="test-key", cache=ResponseCache(backend=SQLiteCache(path)))
+    restarted._send_with_retry = MagicMock()
+    areas = restarted.address.get_areas()
+
+    restarted._send_with_retry.assert_not_called()
+    assert areas[0].Description == "Київська"
@@ -0,0 +1,85 @@
+import pytest
+
+from nova_post.directories.cities import CityAutocomplete, normalize, transliterate
+from nova_post.directories.warehouses import WarehouseDirectory
+from nova_post.models.address import City, SearchSettlementsItem, Warehouse
+
+KYIV = City(Ref="kyiv", Description="Київ", DescriptionRu="Киев")
+KYIVETS = City(Ref="kyivets", Description="Київець", DescriptionRu="Киевец")
+KIVERTSI = City(Ref="kivertsi", Description="Ківерці", DescriptionRu="Киверцы")
+LVIV = City(Ref="lviv", Description="Львів", DescriptionRu="Львов")
+KAMIANETS = City(Ref="kamianets", Description="Кам'янець-Подільський", DescriptionRu="Каменец-Подольский")
+KHARKIV = City(Ref="kharkiv", Description="Харків", DescriptionRu="Харьков")
+ZAPORIZHZHIA = City(Ref="zaporizhzhia", Description="Запоріжжя", DescriptionRu="Запорожье")
+
+CITIES = [KYIVETS, KIVERTSI, KYIV, LVIV, KAMIANETS, KHARKIV, ZAPORIZHZHIA]
+COUNTS = {"kyiv": 900, "kyivets": 1, "kivertsi": 3, "lviv": 300, "kamianets": 20, "kharkiv": 400,
+          "zaporizhzhia": 200}
+
+
+@pytest.fixture
+def autocomplete():
+    return CityAutocomplete(CITIES, COUNTS)
+
+
+@pytest.mark.parametrize("latin, cyrillic", [
+    ("Kyiv", "Київ"),
+    ("Lviv", "Львів"),
+    ("Kharkiv", "Харків"),
+    ("Zaporizhzhia", "Запоріжжя"),
+    ("Kamianets-Podilskyi", "Кам'янець-Подільський"),
+])
+def test_transliteration_matches_cyrillic_name(latin, cyrillic):
+    assert normalize(latin) == normalize(cyrillic)
+
+
+def test_normalize_merges_ukrainian_and_russian_spelling():
+    assert normalize("Кам’янець") == normalize("Кам'янець") == normalize("камянец")
+    assert normalize("Одесса") == normalize("Одеса")
+    assert normalize("  Біла   Церква ") == "била церква"
+    assert transliterate("Shchastia") == "щастя"
+
+
+def test_prefix_results_ranked_by_warehouse_count(autocomplete):
+    assert autocomplete.complete("к") == [KYIV, KAMIANETS, KIVERTSI, KYIVETS]
+    assert autocomplete.complete("Київ")[:3] == [KYIV, KIVERTSI, KYIVETS]
+
+
+def test_latin_and_russian_input(autocomplete):
+    assert autocomplete.complete("kyiv")[0] is KYIV
+    assert autocomplete.complete("Kiev")[0] is KYIV
+    assert autocomplete.complete("Харьков") == [KHARKIV]
+    assert autocomplete.complete("kamianets")[0] is KAMIANETS
+
+
+def test_typos_fall_back_to_trigram_match(autocomplete):
+    assert autocomplete.complete("Харкав")[0] is KHARKIV
+    assert autocomplete.complete("Запорижжа")[0] is ZAPORIZHZHIA
+    assert autocomplete.complete("Львив", limit=1) == [LVIV]
+
+
+def test_no_match_and_limit(autocomplete):
+    assert autocomplete.complete("Ужгород") == []
+    assert autocomplete.complete("") == []
+    assert len(autocomplete.complete("к", limit=2)) == 2
+
+
+def test_settlements_use_warehouses_field():
+    big = SearchSettlementsItem(Present="м. Біла Церква", Warehouses="40", MainDescription="Біла Церква",
+                                Area="Київська", Region="", SettlementTypeCode="м.", Ref="s1", DeliveryCity="d1")
+    small = SearchSettlementsItem(Present="с. Білогородка", Warehouses="2", MainDescription="Білогородка",
+                                  Area="Київська", Region="", SettlementTypeCode="с.", Ref="s2", DeliveryCity="d2")
+    autocomplete = CityAutocomplete([small, big])
+
+    assert autocomplete.complete("bila") == [big, small]
+    assert autocomplete.complete("Bila Tserkva") == [big]
+
+
+def test_from_directories_counts_warehouses():
+    warehouses = WarehouseDirectory(
+        Warehouse(SiteKey=n, Description=f"Відділення №{n}", Number=str(n), CityRef="kivertsi") for n in range(5)
+    )
+    autocomplete = CityAutocomplete.from_directories([KYIV, KIVERTSI], warehouses)
+
+    assert autocomplete.complete("ки") == [KIVERTSI, KYIV]
+    assert len(autocomplete) == 2
@@ -0,0 +1,85 @@
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+from nova_post.api import NovaPostApi
+from nova_post.exceptions import NovaPostApiError
+from nova_post.forecast import DeliveryDateCache
+from nova_post.models.internet_document import DocumentDeliveryDateRequest, DocumentDeliveryDateResponse
+from nova_post.quotes import KYIV
+from nova_post.utils import parse_date
+
+KYIV_CITY = "8d5a980d-391c-11dd-90d9-001a92567626"
+LVIV_CITY = "db5c88f5-391c-11dd-90d9-001a92567626"
+ODESA_CITY = "db5c88d0-391c-11dd-90d9-001a92567626"
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def fake_delivery_date(model, method, properties):
+    if properties["CityRecipient"] == ODESA_CITY:
+        raise NovaPostApiError(["City not found"])
+    shipped = datetime.strptime(properties["DateTime"], "%d.%m.%Y")
+    days = 1 if properties["ServiceType"] == "WarehouseWarehouse" else 2
+    delivered = shipped + timedelta(days=days)
+    return [{"DeliveryDate": {"date": delivered.strftime("%Y-%m-%d 00:00:00.000000"), "timezone_type": 3,
+                              "timezone": "Europe/Kyiv"}}]
+
+
+def make_cache(now):
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=fake_delivery_date)
+    clock = FakeClock(datetime(*now, tzinfo=KYIV).timestamp())
+    return DeliveryDateCache(api, clock=clock), api, clock
+
+
+def test_parse_date_formats():
+    assert parse_date({"date": "2025-03-20 00:00:00.000000", "timezone_type": 3}) == date(2025, 3, 20)
+    assert parse_date("20.03.2025") == parse_date("2025-03-20") == date(2025, 3, 20)
+    assert DocumentDeliveryDateResponse(DeliveryDate={"date": "2025-03-21 00:00:00"}).delivery_date == date(2025, 3, 21)
+
+
+def test_forecast_is_cached_per_ship_day():
+    cache, api, clock = make_cache((2025, 3, 10, 12, 0))
+
+    assert cache.forecast(KYIV_CITY, LVIV_CITY) == date(2025, 3, 11)
+    assert cache.get(DocumentDeliveryDateRequest(CitySender=KYIV_CITY, CityRecipient=LVIV_CITY,
+                                                 ServiceType="WarehouseWarehouse")) == date(2025, 3, 11)
+    assert api.send_request.call_count == 1
+    assert api.send_request.call_args.args[2]["DateTime"] == "10.03.2025"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Після опівночі за Києвом змінюється дата відправки, і прогноз запитується заново
+    clock.now = datetime(2025, 3, 11, 0, 5, tzinfo=KYIV).timestamp()
+    assert cache.forecast(KYIV_CITY, LVIV_CITY) == date(2025, 3, 12)
+    assert api.send_request.call_count == 2
+
+
+def test_explicit_ship_date_and_service_type_are_part_of_key():
+    cache, api, _ = make_cache((2025, 3, 10, 12, 0))
+
+    assert cache.forecast(KYIV_CITY, LVIV_CITY, "WarehouseDoors", ship_date=date(2025, 3, 14)) == date(2025, 3, 16)
+    assert cache.forecast(KYIV_CITY, LVIV_CITY, ship_date=date(2025, 3, 14)) == date(2025, 3, 15)
+    assert api.send_request.call_count == 2
+
+
+def test_prefetch_popular_pairs():
+    cache, api, _ = make_cache((2025, 3, 10, 12, 0))
+    cache.forecast(KYIV_CITY, LVIV_CITY)
+
+    loaded = cache.prefetch([(KYIV_CITY, LVIV_CITY), (LVIV_CITY, KYIV_CITY), (KYIV_CITY, ODESA_CITY)],
+                            service_types=("WarehouseWarehouse", "WarehouseDoors"))
+
+    # Вже кешований прогноз не запитується; помилка для Одеси не зупиняє решту
+    assert loaded == 3
+    assert api.send_request.call_count == 6
+    assert len(cache) == 4
+
+    calls = api.send_request.call_count
+    assert cache.forecast(LVIV_CITY, KYIV_CITY, "WarehouseDoors") == date(2025, 3, 12)
+    assert api.send_request.call_count == calls
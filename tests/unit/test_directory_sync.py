@@ -0,0 +1,159 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.cache import ResponseCache
+from nova_post.directories.sync import DirectoryStore, DirectorySync, record_hash
+from nova_post.models.address import GetWarehousesRequest
+
+CITY = "8d5a980d-391c-11dd-90d9-001a92567626"
+
+
+def warehouse(n, description=None):
+    return {
+        "Ref": f"ref-{n}",
+        "SiteKey": 1000 + n,
+        "Description": description or f"Відділення №{n}",
+        "Number": str(n),
+        "CityRef": CITY,
+    }
+
+
+class FakeApi:
+    """Віддає записи сторінками; може «впасти» на заданій сторінці."""
+
+    def __init__(self, records, fail_on_page=None):
+        self.records = records
+        self.fail_on_page = fail_on_page
+        self.pages = []
+
+    def send_request(self, model, method, properties, use_cache=True):
+        page, limit = properties["Page"], properties["Limit"]
+        self.pages.append(page)
+        if page == self.fail_on_page:
+            raise RuntimeError("обрив з'єднання")
+        return self.records[(page - 1) * limit:page * limit]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DirectoryStore(str(tmp_path / "directories.sqlite"))
+    yield store
+    store.close()
+
+
+def test_record_hash_ignores_key_order():
+    assert record_hash({"a": 1, "b": 2}) == record_hash({"b": 2, "a": 1})
+    assert record_hash({"a": 1}) != record_hash({"a": 2})
+
+
+def test_first_refresh_inserts_everything(store):
+    api = FakeApi([warehouse(n) for n in range(25)])
+    result = DirectorySync(api, store, page_size=10, max_workers=2).refresh_warehouses()
+
+    assert result.Total == 25
+    assert result.inserted == 25
+    assert result.updated == result.deleted == 0
+    assert sorted(api.pages) == [1, 2, 3, 4]
+
+
+def test_second_refresh_applies_only_delta(store):
+    records = [warehouse(n) for n in range(25)]
+    DirectorySync(FakeApi(records), store, page_size=10).refresh_warehouses()
+
+    records = [r for r in records if r["Ref"] != "ref-3"]
+    records[0] = warehouse(0, "Відділення №0 (переїхало)")
+    records.append(warehouse(99))
+    sync = DirectorySync(FakeApi(records), store, page_size=10)
+    result = sync.refresh_warehouses()
+
+    changes = {(change.Action, change.Ref) for change in result.Changes}
+    assert changes == {("update", "ref-0"), ("delete", "ref-3"), ("insert", "ref-99")}
+    assert result.Total == 25
+    assert store.changes(result.Directory)[-3:] == result.Changes
+
+    directory = sync.warehouse_directory()
+    assert directory.by_site_key(1000).Description == "Відділення №0 (переїхало)"
+    assert directory.by_site_key(1003) is None
+
+
+def test_refresh_bypasses_response_cache(store):
+    records = [warehouse(n) for n in range(15)]
+    api = NovaPostApi(api_key="test-key", cache=ResponseCache())
+    api._send_with_retry = MagicMock(side_effect=lambda payload, timeout: FakeApi(records).send_request(
+        payload["modelName"], payload["calledMethod"], payload["methodProperties"]))
+    sync = DirectorySync(api, store, page_size=10)
+    sync.refresh_warehouses()
+    first_calls = api._send_with_retry.call_count
+
+    # Дані на сервері змінилися в межах добового TTL кешу getWarehouses
+    records[0] = warehouse(0, "Відділення №0 (переїхало)")
+    result = sync.refresh_warehouses()
+
+    assert [(change.Action, change.Ref) for change in result.Changes] == [("update", "ref-0")]
+    assert api._send_with_retry.call_count == 2 * first_calls and len(api.cache.backend) == 0
+
+
+def test_unchanged_snapshot_produces_no_changes(store):
+    records = [warehouse(n) for n in range(5)]
+    DirectorySync(FakeApi(records), store, page_size=10).refresh_warehouses()
+    result = DirectorySync(FakeApi(records), store, page_size=10).refresh_warehouses()
+
+    assert result.Changes == []
+    assert result.Total == 5
+
+
+def test_interrupted_refresh_resumes_from_checkpoint(store):
+    records = [warehouse(n) for n in range(45)]
+    api = FakeApi(records, fail_on_page=4)
+    sync = DirectorySync(api, store, page_size=10, max_workers=1)
+
+    with pytest.raises(RuntimeError):
+        sync.refresh_warehouses()
+    directory = sync.directory_id("Address", "getWarehouses", {})
+    assert store.checkpoint(directory)[0] == 3
+    assert store.count(directory) == 0
+
+    api.fail_on_page = None
+    api.pages.clear()
+    result = sync.refresh_warehouses()
+
+    assert result.Resumed
+    assert api.pages == [4, 5]
+    assert result.inserted == 45
+    assert store.checkpoint(directory) is None
+
+
+def test_stale_checkpoint_starts_over(store):
+    api = FakeApi([warehouse(n) for n in range(30)], fail_on_page=2)
+    sync = DirectorySync(api, store, page_size=10, max_workers=1, checkpoint_ttl=0)
+    with pytest.raises(RuntimeError):
+        sync.refresh_warehouses()
+
+    api.fail_on_page = None
+    api.pages.clear()
+    result = sync.refresh_warehouses()
+
+    assert not result.Resumed
+    assert api.pages == [1, 2, 3, 4]
+    assert result.Total == 30
+
+
+def test_filtered_directories_are_independent(store):
+    api = FakeApi([warehouse(n) for n in range(3)])
+    sync = DirectorySync(api, store, page_size=10)
+    sync.refresh_warehouses()
+    sync.refresh_warehouses(GetWarehousesRequest(CityRef=CITY, Page=7))
+
+    assert len(list(sync.warehouses())) == 3
+    assert len(list(sync.warehouses(GetWarehousesRequest(CityRef=CITY)))) == 3
+    assert all(page != 7 for page in api.pages)
+
+
+def test_refresh_cities(store):
+    cities = [{"Ref": f"city-{n}", "Description": f"Місто {n}"} for n in range(4)]
+    result = DirectorySync(FakeApi(cities), store, page_size=3).refresh_cities()
+
+    assert result.inserted == 4
+    assert {city["Ref"] for city in DirectorySync(None, store).cities()} == {f"city-{n}" for n in range(4)}
@@ -0,0 +1,101 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.async_api import AsyncNovaPostApi
+from nova_post.exceptions import NovaPostApiError, NovaPostBatchError
+from nova_post.models.internet_document import DeleteInternetDocumentRequest, GenerateReportRequest
+
+REFS = [f"ref-{n}" for n in range(250)]
+
+
+def fake_send_request(model, method, properties):
+    if method == "delete":
+        return [{"Ref": ref} for ref in properties["DocumentRefs"]]
+    return [{"Ref": ref, "DateTime": properties["DateTime"], "Weight": "1", "CostOnSite": "70", "PayerType": "Sender",
+             "PaymentMethod": "Cash", "IntDocNumber": ref.replace("ref-", "204")} for ref in properties["DocumentRefs"]]
+
+
+def test_delete_internet_documents_chunks_and_merges():
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=fake_send_request)
+
+    deleted = api.internet_document.delete_internet_documents(
+        DeleteInternetDocumentRequest(DocumentRefs=REFS + REFS[:10]), max_workers=3
+    )
+
+    assert [item.Ref for item in deleted] == REFS
+    assert sorted(len(call.args[2]["DocumentRefs"]) for call in api.send_request.call_args_list) == [50, 100, 100]
+
+
+def test_generate_reports_repeats_report_options_in_every_chunk():
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=fake_send_request)
+
+    reports = api.internet_document.generate_reports(
+        GenerateReportRequest(DocumentRefs=REFS, Type="csv", DateTime="01.03.2025"), chunk_size=40
+    )
+
+    assert len(reports) == 250 and reports[-1].IntDocNumber == "204249"
+    assert api.send_request.call_count == 7
+    assert all(call.args[1] == "generateReport" and call.args[2]["Type"] == "csv"
+               for call in api.send_request.call_args_list)
+
+
+def test_empty_refs_send_nothing():
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=fake_send_request)
+
+    assert api.internet_document.delete_internet_documents(DeleteInternetDocumentRequest(DocumentRefs=[])) == []
+    assert api.send_request.call_count == 0
+
+
+def test_async_batches():
+    async def run():
+        async with AsyncNovaPostApi(api_key="test-key") as api:
+            api.send_request = AsyncMock(side_effect=fake_send_request)
+            deleted = await api.internet_document.delete_internet_documents(DeleteInternetDocumentRequest(
+                DocumentRefs=REFS))
+            reports = await api.internet_document.generate_reports(GenerateReportRequest(
+                DocumentRefs=REFS[:120], Type="xls", DateTime="01.03.2025"))
+            return deleted, reports, api.send_request.call_count
+
+    deleted, reports, calls = asyncio.run(run())
+
+    assert [item.Ref for item in deleted] == REFS
+    assert len(reports) == 120
+    assert calls == 5
+
+
+def failing_send_request(model, method, properties):
+    # Фрагмент із ref-100 (другий) завершується помилкою API
+    if "ref-100" in properties["DocumentRefs"]:
+        raise NovaPostApiError("Сервіс тимчасово недоступний")
+    return fake_send_request(model, method, properties)
+
+
+def test_failed_chunk_keeps_results_of_other_chunks():
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=failing_send_request)
+
+    with pytest.raises(NovaPostBatchError) as error:
+        api.internet_document.delete_internet_documents(DeleteInternetDocumentRequest(DocumentRefs=REFS))
+
+    assert [item.Ref for item in error.value.results] == REFS[:100] + REFS[200:]
+    assert list(error.value.failed) == REFS[100:200]
+    assert api.send_request.call_count == 3
+
+
+def test_async_failed_chunk_keeps_results_of_other_chunks():
+    async def run():
+        async with AsyncNovaPostApi(api_key="test-key") as api:
+            api.send_request = AsyncMock(side_effect=failing_send_request)
+            await api.internet_document.generate_reports(GenerateReportRequest(
+                DocumentRefs=REFS, Type="xls", DateTime="01.03.2025"), max_workers=2)
+
+    with pytest.raises(NovaPostBatchError) as error:
+        asyncio.run(run())
+
+    assert len(error.value.results) == 150 and set(error.value.failed) == set(REFS[100:200])
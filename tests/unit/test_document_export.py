@@ -0,0 +1,193 @@
+import csv
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.cache import ResponseCache
+from nova_post.exceptions import NovaPostTimeoutError
+from nova_post.export import CsvSink, DocumentExporter, ExportCheckpoint, ParquetSink, date_shards
+from nova_post.models.internet_document import DocumentListRequest
+
+COLUMNS = ("Ref", "IntDocNumber", "DateTime")
+
+
+class FakeServer:
+    """
+    Імітація `getDocumentList`: по дві сторінки на добу, останній документ доби повторюється на наступній.
+    """
+
+    def __init__(self, fail_days=()):
+        self.fail_days = set(fail_days)
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def __call__(self, model, method, properties, use_cache=True):
+        with self.lock:
+            self.calls.append((properties["DateTimeFrom"], properties["Page"]))
+        day = int(properties["DateTimeFrom"][:2])
+        if day in self.fail_days:
+            raise NovaPostTimeoutError("Таймаут запроса")
+        if properties["Page"] > 2:
+            return []
+        first = day * 10 + (properties["Page"] - 1) * 3
+        refs = [f"ref-{n}" for n in range(first, first + 3)]
+        if properties["Page"] == 2:
+            refs.append(f"ref-{(day + 1) * 10}")
+        return [{"Ref": ref, "IntDocNumber": ref.replace("ref-", "204"), "DateTime": properties["DateTimeFrom"]}
+                for ref in refs]
+
+
+def make_exporter(server, checkpoint, **kwargs):
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=server)
+    return DocumentExporter(api, checkpoint, **kwargs)
+
+
+def read_refs(path):
+    with open(path, encoding="utf-8") as file:
+        return [row["Ref"] for row in csv.DictReader(file)]
+
+
+def test_date_shards():
+    assert date_shards("30.01.2025", "01.02.2025") == [
+        ("2025-01-30", "30.01.2025", "30.01.2025"),
+        ("2025-01-31", "31.01.2025", "31.01.2025"),
+        ("2025-02-01", "01.02.2025", "01.02.2025"),
+    ]
+    hours = date_shards("01.03.2025", "01.03.2025", "hour")
+    assert len(hours) == 24
+    assert hours[13] == ("2025-03-01T13", "01.03.2025 13:00:00", "01.03.2025 13:59:59")
+
+
+def test_export_to_csv_dedupes_across_shards(tmp_path):
+    server = FakeServer()
+    exporter = make_exporter(server, ExportCheckpoint(str(tmp_path / "export.db")), max_workers=3)
+    sink = CsvSink(str(tmp_path / "documents.csv"), COLUMNS)
+
+    result = exporter.export(DocumentListRequest(DateTimeFrom="01.03.2025", DateTimeTo="05.03.2025"), sink)
+    sink.close()
+
+    refs = read_refs(tmp_path / "documents.csv")
+    assert result.Shards == 5 and result.Rows == len(refs) == 31
+    # Документ, що повторюється на сусідній добі, записується один раз
+    assert len(set(refs)) == 31 and result.Duplicates == 4
+    assert {page for _, page in server.calls} == {1, 2, 3}
+
+
+def test_export_resumes_from_checkpoint(tmp_path):
+    path = str(tmp_path / "export.db")
+    request = DocumentListRequest(DateTimeFrom="01.03.2025", DateTimeTo="04.03.2025")
+
+    sink = CsvSink(str(tmp_path / "documents.csv"), COLUMNS)
+    first = make_exporter(FakeServer(fail_days={3}), ExportCheckpoint(path)).export(request, sink)
+    sink.close()
+    assert first.Failed == ["2025-03-03"] and first.Rows == 20
+
+    server = FakeServer()
+    sink = CsvSink(str(tmp_path / "documents.csv"), COLUMNS)
+    second = make_exporter(server, ExportCheckpoint(path)).export(request, sink)
+    sink.close()
+
+    # Повторно запитується лише незавершена доба
+    assert second.Resumed == 3 and second.Failed == []
+    assert {day for day, _ in server.calls} == {"03.03.2025"}
+    refs = read_refs(tmp_path / "documents.csv")
+    assert len(refs) == len(set(refs)) == 25
+
+
+def test_export_with_different_filters_is_separate(tmp_path):
+    checkpoint = ExportCheckpoint(str(tmp_path / "export.db"))
+    exporter = make_exporter(FakeServer(), checkpoint)
+    day = DocumentListRequest(DateTimeFrom="01.03.2025", DateTimeTo="01.03.2025")
+
+    assert exporter.export_id(day) != exporter.export_id(day.model_copy(update={"DateTimeTo": "02.03.2025"}))
+    assert exporter.export_id(day) != DocumentExporter(exporter.api, checkpoint, shard="hour").export_id(day)
+
+
+def test_release_forgets_refs_of_unfinished_shard(tmp_path):
+    checkpoint = ExportCheckpoint(str(tmp_path / "export.db"))
+    rows = [{"Ref": "ref-1"}, {"Ref": "ref-2"}, {"Ref": "ref-1"}]
+
+    assert checkpoint.fresh("export", rows) == rows[:2]
+    # Доки рядки не позначені записаними, вони залишаються новими
+    assert checkpoint.fresh("export", rows) == rows[:2]
+    checkpoint.record("export", "2025-03-01", rows[:2])
+    assert checkpoint.fresh("export", rows) == []
+    checkpoint.release("export", "2025-03-01")
+    assert checkpoint.fresh("export", rows) == rows[:2]
+
+
+class FailingSink(CsvSink):
+    """
+    CSV-приймач, перший запис у який завершується помилкою.
+    """
+
+    def __init__(self, path, columns):
+        super().__init__(path, columns)
+        self.failed = False
+
+    def write(self, shard, rows):
+        if not self.failed:
+            self.failed = True
+            raise OSError("Диск заповнено")
+        super().write(shard, rows)
+
+
+def test_sink_failure_does_not_lose_rows_on_resume(tmp_path):
+    path = str(tmp_path / "export.db")
+    request = DocumentListRequest(DateTimeFrom="01.03.2025", DateTimeTo="05.03.2025")
+
+    sink = FailingSink(str(tmp_path / "documents.csv"), COLUMNS)
+    with pytest.raises(OSError):
+        make_exporter(FakeServer(), ExportCheckpoint(path)).export(request, sink)
+    sink.close()
+
+    sink = CsvSink(str(tmp_path / "documents.csv"), COLUMNS)
+    make_exporter(FakeServer(), ExportCheckpoint(path)).export(request, sink)
+    sink.close()
+
+    refs = read_refs(tmp_path / "documents.csv")
+    assert len(refs) == len(set(refs)) == 31
+
+
+def test_sink_failure_stops_fetching(tmp_path):
+    server = FakeServer()
+    exporter = make_exporter(server, ExportCheckpoint(str(tmp_path / "export.db")), max_workers=1)
+    sink = FailingSink(str(tmp_path / "documents.csv"), COLUMNS)
+
+    with pytest.raises(OSError):
+        exporter.export(DocumentListRequest(DateTimeFrom="01.03.2025", DateTimeTo="20.03.2025"), sink)
+    sink.close()
+
+    # Після помилки нові відрізки не запитуються: дозавантажується щонайбільше відрізок, що вже почався
+    assert len({day for day, _ in server.calls}) <= 2 and len(server.calls) <= 6
+
+
+def test_export_reads_pages_past_response_cache(tmp_path):
+    server = FakeServer()
+    api = NovaPostApi(api_key="test-key", cache=ResponseCache(default_ttl=300))
+    api._send = MagicMock(side_effect=lambda payload, timeout: server(payload["modelName"], payload["calledMethod"],
+                                                                     payload["methodProperties"]))
+    request = DocumentListRequest(DateTimeFrom="01.03.2025", DateTimeTo="02.03.2025")
+
+    for name in ("first", "second"):
+        sink = CsvSink(str(tmp_path / f"{name}.csv"), COLUMNS)
+        DocumentExporter(api, ExportCheckpoint(str(tmp_path / f"{name}.db"))).export(request, sink)
+        sink.close()
+
+    # Друге вивантаження знову читає сторінки з API, а не з кешу першого
+    assert len(server.calls) == 12
+
+
+def test_export_to_parquet(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    exporter = make_exporter(FakeServer(), ExportCheckpoint(str(tmp_path / "export.db")))
+    sink = ParquetSink(str(tmp_path / "parquet"), COLUMNS, row_group_size=2)
+
+    result = exporter.export(DocumentListRequest(DateTimeFrom="01.03.2025", DateTimeTo="02.03.2025"), sink)
+    sink.close()
+
+    tables = [parquet.read_table(str(tmp_path / "parquet" / f"2025-03-0{day}.parquet")) for day in (1, 2)]
+    assert result.Rows == sum(table.num_rows for table in tables) == 13
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from nova_post.api import NovaPostApi
+from nova_post.async_api import AsyncNovaPostApi
+from nova_post.models.address import SearchSettlementsRequest
+from nova_post.models.internet_document import DocumentListRequest
+from nova_post.paging import afan_out_pages, fan_out_pages, page_count
+
+CITY = "8d5a980d-391c-11dd-90d9-001a92567626"
+
+
+def settlement(n):
+    return {"Present": f"с. Село {n}", "Warehouses": "1", "MainDescription": f"Село {n}", "Area": "Київська",
+            "Region": "", "SettlementTypeCode": "с.", "Ref": f"s-{n}", "DeliveryCity": f"d-{n}"}
+
+
+def document(n):
+    return {"Ref": f"ref-{n}", "DateTime": "01.01.2025", "IntDocNumber": str(20400000000000 + n), "Cost": "100",
+            "CitySender": CITY, "CityRecipient": CITY, "PayerType": "Sender", "StateId": 1, "StateName": "Створено"}
+
+
+def fake_search_settlements(total):
+    def send_request(model, method, properties):
+        start = (properties["Page"] - 1) * properties["Limit"]
+        addresses = [settlement(n) for n in range(start, min(start + properties["Limit"], total))]
+        return [{"TotalCount": total, "Addresses": addresses}]
+    return send_request
+
+
+def test_page_count():
+    assert [page_count(total, 50) for total in (0, 1, 50, 51, 120)] == [0, 1, 1, 2, 3]
+
+
+def test_known_page_count_yields_in_order_with_bounded_concurrency():
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def fetch_page(page):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        # Ранні сторінки відповідають повільніше за пізні
+        time.sleep(0.02 * (10 - page) / 10)
+        with lock:
+            active -= 1
+        return [page]
+
+    pages = list(fan_out_pages(fetch_page, 1, max_workers=3, last_page=10))
+
+    assert pages == [[page] for page in range(1, 11)]
+    assert 1 < peak <= 3
+
+
+def test_unknown_page_count_stops_at_empty_page():
+    requested = []
+
+    def fetch_page(page):
+        requested.append(page)
+        return [page] if page <= 5 else []
+
+    assert list(fan_out_pages(fetch_page, None, max_workers=2)) == [[page] for page in range(1, 6)]
+    assert max(requested) <= 7
+
+
+def test_search_all_settlements_probes_total_count():
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=fake_search_settlements(120))
+
+    response = api.address.search_all_settlements(SearchSettlementsRequest(CityName="Село", Limit=50, Page=3))
+
+    assert response.TotalCount == "120"
+    assert [item.Ref for item in response.Addresses] == [f"s-{n}" for n in range(120)]
+    assert sorted(call.args[2]["Page"] for call in api.send_request.call_args_list) == [1, 2, 3]
+
+
+def test_search_all_settlements_single_page():
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=fake_search_settlements(7))
+
+    response = api.address.search_all_settlements(SearchSettlementsRequest(CityName="Село"))
+
+    assert len(response.Addresses) == 7
+    assert api.send_request.call_count == 1
+    # Незадані поля не надсилаються, а `Limit` — завжди
+    assert api.send_request.call_args.args[2] == {"CityName": "Село", "Limit": 50, "Page": 1}
+
+
+def test_get_all_documents_in_page_order():
+    documents = [document(n) for n in range(430)]
+
+    def send_request(model, method, properties):
+        start = (properties["Page"] - 1) * 100
+        return documents[start:start + 100]
+
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=send_request)
+
+    result = api.internet_document.get_all_documents(
+        DocumentListRequest(DateTimeFrom="01.01.2025", DateTimeTo="31.01.2025"), max_workers=3
+    )
+
+    assert [item.Ref for item in result] == [f"ref-{n}" for n in range(430)]
+    assert all(call.args[2]["GetFullList"] == 0 for call in api.send_request.call_args_list)
+
+
+def test_async_fan_out_and_search_all_settlements():
+    async def fetch_page(page):
+        await asyncio.sleep(0.01 * (5 - page))
+        return [page] if page <= 4 else []
+
+    async def run():
+        pages = [page async for page in afan_out_pages(fetch_page, None, max_workers=2)]
+        async with AsyncNovaPostApi(api_key="test-key") as api:
+            api.send_request = AsyncMock(side_effect=fake_search_settlements(75))
+            response = await api.address.search_all_settlements(SearchSettlementsRequest(CityName="Село", Limit=20))
+        return pages, response
+
+    pages, response = asyncio.run(run())
+
+    assert pages == [[1], [2], [3], [4]]
+    assert [item.Ref for item in response.Addresses] == [f"s-{n}" for n in range(75)]
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from nova_post.directories.geo import WarehouseGeoIndex, haversine_km
+from nova_post.directories.warehouses import WarehouseDirectory
+from nova_post.models.address import Warehouse
+
+BRANCH = "841339c7-591a-42e2-8233-7a0a00f0ed6f"
+POSTOMAT = "f9316480-5f2d-425d-bc2c-ac7cd29decf0"
+
+
+def make_warehouse(site_key, lat, lon, type_of_warehouse=BRANCH, place_max_weight=0):
+    return Warehouse(SiteKey=site_key, Description=f"Відділення №{site_key}", Number=str(site_key), CityRef="c",
+                     Latitude=lat, Longitude=lon, TypeOfWarehouse=type_of_warehouse,
+                     PlaceMaxWeightAllowed=place_max_weight)
+
+
+@pytest.fixture
+def warehouses():
+    rng = random.Random(42)
+    return [
+        make_warehouse(n, rng.uniform(44.5, 52.3), rng.uniform(22.2, 40.1), rng.choice([BRANCH, POSTOMAT]),
+                       rng.choice([0, 30, 1000]))
+        for n in range(3000)
+    ]
+
+
+def brute_force(warehouses, lat, lon, predicate=lambda wh: True):
+    return sorted((haversine_km(lat, lon, wh.Latitude, wh.Longitude), wh.SiteKey)
+                  for wh in warehouses if predicate(wh))
+
+
+def test_warehouse_parses_api_strings():
+    warehouse = Warehouse.model_validate({
+        "SiteKey": "101", "Description": "Відділення №1", "Number": "1", "CityRef": "c",
+        "Latitude": "50.450100", "Longitude": "", "TotalMaxWeightAllowed": "0", "PlaceMaxWeightAllowed": "30",
+        "Schedule": {"Monday": "08:00-21:00"}, "CategoryOfWarehouse": "Branch",
+    })
+
+    assert warehouse.Latitude == pytest.approx(50.4501)
+    assert warehouse.Longitude is None
+    assert warehouse.PlaceMaxWeightAllowed == 30
+    assert warehouse.Schedule == {"Monday": "08:00-21:00"}
+
+
+def test_haversine_kyiv_lviv():
+    assert haversine_km(50.4501, 30.5234, 49.8397, 24.0297) == pytest.approx(468, abs=5)
+
+
+def test_nearest_matches_brute_force(warehouses):
+    index = WarehouseGeoIndex(warehouses)
+    rng = random.Random(7)
+    for _ in range(50):
+        lat, lon, k = rng.uniform(44, 53), rng.uniform(21, 41), rng.randint(1, 15)
+        expected = [site_key for _, site_key in brute_force(warehouses, lat, lon)[:k]]
+        assert [wh.SiteKey for wh, _ in index.nearest(lat, lon, k)] == expected
+
+
+def test_nearest_with_filters(warehouses):
+    index = WarehouseGeoIndex(warehouses)
+    result = index.nearest(50.45, 30.52, k=5, type_of_warehouse=POSTOMAT, max_weight=100)
+
+    expected = brute_force(warehouses, 50.45, 30.52, lambda wh: wh.TypeOfWarehouse == POSTOMAT
+                           and wh.PlaceMaxWeightAllowed in (0, 1000))[:5]
+    assert [wh.SiteKey for wh, _ in result] == [site_key for _, site_key in expected]
+    assert [distance for _, distance in result] == pytest.approx([distance for distance, _ in expected])
+
+
+def test_within_radius(warehouses):
+    index = WarehouseGeoIndex(warehouses)
+    result = index.within(48.5, 31.0, radius_km=60, predicate=lambda wh: wh.SiteKey % 2 == 0)
+
+    expected = [site_key for distance, site_key in
+                brute_force(warehouses, 48.5, 31.0, lambda wh: wh.SiteKey % 2 == 0) if distance <= 60]
+    assert [wh.SiteKey for wh, _ in result] == expected
+
+
+def test_warehouses_without_coordinates_are_skipped():
+    index = WarehouseGeoIndex([make_warehouse(1, 50.0, 30.0), make_warehouse(2, None, None)])
+
+    assert len(index) == 1
+    assert [wh.SiteKey for wh, _ in index.nearest(0, 0, k=5)] == [1]
+    assert WarehouseGeoIndex([]).nearest(50, 30) == []
+
+
+def test_directory_geo_index_is_cached(warehouses):
+    directory = WarehouseDirectory(warehouses)
+
+    assert directory.geo_index() is directory.geo_index()
+    assert directory.geo_index().nearest(50.45, 30.52, k=1)
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.async_api import AsyncNovaPostApi
+from nova_post.models.address import GetWarehousesRequest, Warehouse
+from nova_post.models.counterparty import GetCounterpartiesRequest
+from nova_post.models.internet_document import DocumentListRequest
+from nova_post.paging import iter_pages
+
+CITY = "8d5a980d-391c-11dd-90d9-001a92567626"
+
+
+def warehouse(n):
+    return {"SiteKey": n, "Description": f"Відділення №{n}", "Number": str(n), "CityRef": CITY}
+
+
+def document(n):
+    return {"Ref": f"ref-{n}", "DateTime": "01.01.2025", "IntDocNumber": str(20400000000000 + n), "Cost": "100",
+            "CitySender": CITY, "CityRecipient": CITY, "PayerType": "Sender", "StateId": 1, "StateName": "Створено"}
+
+
+def counterparty(n):
+    fields = ("City", "Counterparty", "FirstName", "LastName", "MiddleName", "OwnershipFormRef",
+              "OwnershipFormDescription", "EDRPOU", "CounterpartyType")
+    return dict(dict.fromkeys(fields), Ref=f"cp-{n}", Description=f"Контрагент {n}")
+
+
+def paged(records):
+    def fetch(model, method, properties, use_cache=True):
+        limit = properties.get("Limit", 100)
+        start = (properties["Page"] - 1) * limit
+        return records[start:start + limit]
+    return fetch
+
+
+def test_iter_pages_stops_on_short_page():
+    pages = []
+
+    def fetch_page(page):
+        pages.append(page)
+        return list(range(10)) if page < 3 else [1, 2]
+
+    assert [len(page) for page in iter_pages(fetch_page, 10)] == [10, 10, 2]
+    assert pages == [1, 2, 3]
+
+
+def test_iter_pages_without_page_size_stops_on_empty_page():
+    def fetch_page(page):
+        return [page] if page <= 2 else []
+
+    assert list(iter_pages(fetch_page, None, prefetch=False)) == [[1], [2]]
+
+
+def test_next_page_is_prefetched_while_current_is_consumed():
+    second_started = threading.Event()
+
+    def fetch_page(page):
+        if page == 2:
+            second_started.set()
+            return []
+        return [page]
+
+    pages = iter_pages(fetch_page, None)
+    assert next(pages) == [1]
+    # Споживач ще не попросив другу сторінку, а вона вже завантажується
+    assert second_started.wait(1)
+    assert list(pages) == []
+
+
+def test_iter_warehouses_is_lazy():
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=paged([warehouse(n) for n in range(1, 1001)]))
+
+    items = api.address.iter_warehouses(GetWarehousesRequest(CityRef=CITY, Page=2), page_size=100, prefetch=False)
+    first = next(items)
+
+    assert isinstance(first, Warehouse) and first.SiteKey == 101
+    assert api.send_request.call_count == 1
+    assert api.send_request.call_args.args[2] == {"CityRef": CITY, "Page": 2, "Limit": 100}
+    assert sum(1 for _ in items) == 899
+    items.close()
+
+
+def test_iter_document_list_forces_paging():
+    documents = [document(n) for n in range(250)]
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=paged(documents))
+
+    request = DocumentListRequest(DateTimeFrom="01.01.2025", DateTimeTo="31.01.2025", GetFullList=1)
+    refs = [item.Ref for item in api.internet_document.iter_document_list(request)]
+
+    assert refs == [f"ref-{n}" for n in range(250)]
+    assert all(call.args[2]["GetFullList"] == 0 for call in api.send_request.call_args_list)
+    assert sorted(call.args[2]["Page"] for call in api.send_request.call_args_list) == [1, 2, 3, 4]
+
+
+def test_async_iter_counterparties():
+    counterparties = [counterparty(n) for n in range(150)]
+
+    async def run():
+        async with AsyncNovaPostApi(api_key="test-key") as api:
+            api.send_request = AsyncMock(side_effect=paged(counterparties))
+            request = GetCounterpartiesRequest(CounterpartyProperty="Recipient")
+            return [cp.Ref async for cp in api.counterparty.iter_counterparties(request)], api.send_request
+
+    refs, send_request = asyncio.run(run())
+
+    assert refs == [f"cp-{n}" for n in range(150)]
+    assert sorted(call.args[2]["Page"] for call in send_request.call_args_list) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_errors_propagate(prefetch):
+    def fetch_page(page):
+        if page == 2:
+            raise RuntimeError("обрив з'єднання")
+        return [page]
+
+    pages = iter_pages(fetch_page, None, prefetch=prefetch)
+    assert next(pages) == [1]
+    with pytest.raises(RuntimeError):
+        next(pages)
@@ -0,0 +1,95 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.exceptions import NovaPostApiError, NovaPostHttpError
+from nova_post.logger import RedactedPayload, configure_logging, logger, mask_api_key
+
+
+@pytest.fixture
+def api():
+    api = NovaPostApi(api_key="secret-api-key-1234")
+    api.session = MagicMock()
+    api.session.post.return_value.json.return_value = {"success": True, "data": []}
+    return api
+
+
+def test_logger_has_no_output_handler_by_default():
+    assert all(isinstance(h, logging.NullHandler) for h in logger.handlers)
+
+
+def test_payload_is_not_formatted_when_debug_disabled(api, caplog, monkeypatch):
+    caplog.set_level(logging.WARNING, logger="NovaPostApi")
+    formatted = MagicMock(return_value="")
+    monkeypatch.setattr(RedactedPayload, "__str__", formatted)
+
+    api.send_request("Address", "getCities", {"FindByString": "Київ"})
+
+    formatted.assert_not_called()
+    assert caplog.records == []
+
+
+def test_debug_logs_redacted_payload(api, caplog):
+    caplog.set_level(logging.DEBUG, logger="NovaPostApi")
+
+    api.send_request("Address", "getCities", {"FindByString": "Київ"})
+
+    request_record = caplog.records[0]
+    assert request_record.levelno == logging.DEBUG
+    assert "Київ" in request_record.getMessage()
+    assert "secret-api-key-1234" not in request_record.getMessage()
+    assert "***1234" in request_record.getMessage()
+
+
+def test_info_logs_timing_fields(api, caplog):
+    caplog.set_level(logging.INFO, logger="NovaPostApi")
+
+    api.send_request("Address", "getCities", {})
+
+    assert len(caplog.records) == 1
+    record = caplog.records[0]
+    assert record.nova_post_model == "Address"
+    assert record.nova_post_method == "getCities"
+    assert record.nova_post_elapsed_ms >= 0
+    assert record.nova_post_success is True
+
+
+def test_mask_api_key():
+    assert mask_api_key("abcdefghijkl") == "***ijkl"
+    assert mask_api_key("short") == "***"
+    assert mask_api_key(None) == ""
+
+
+def test_configure_logging_attaches_handler():
+    handler = configure_logging(logging.DEBUG, logging.NullHandler())
+    try:
+        assert handler in logger.handlers
+        assert logger.level == logging.DEBUG
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+
+
+def test_api_error_is_logged_once(api, caplog):
+    caplog.set_level(logging.INFO, logger="NovaPostApi")
+    api.session.post.return_value.json.return_value = {"success": False, "errors": ["Invalid phone"]}
+
+    with pytest.raises(NovaPostApiError):
+        api.send_request("Counterparty", "save", {})
+
+    assert len(caplog.records) == 1
+    record = caplog.records[0]
+    assert record.levelno == logging.ERROR and record.nova_post_success is False
+    assert "Invalid phone" in record.getMessage()
+
+
+def test_http_error_is_logged_once(api, caplog):
+    caplog.set_level(logging.INFO, logger="NovaPostApi")
+    api.session.post.return_value.status_code = 503
+
+    with pytest.raises(NovaPostHttpError):
+        api.send_request("Address", "getCities", {})
+
+    assert [record.levelno for record in caplog.records] == [logging.ERROR]
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.async_api import AsyncNovaPostApi
+from nova_post.estimator import AsyncPriceQuoter, PriceEstimator, PriceQuoter
+from nova_post.exceptions import NovaPostApiError
+from nova_post.models.internet_document import DocumentPriceRequest, DocumentPriceResponse
+
+KYIV = "8d5a980d-391c-11dd-90d9-001a92567626"
+LVIV = "db5c88f5-391c-11dd-90d9-001a92567626"
+ODESA = "db5c88d0-391c-11dd-90d9-001a92567626"
+DNIPRO = "db5c88f0-391c-11dd-90d9-001a92567626"
+
+# Тестова тарифна сітка: зона між усіма обласними центрами однакова
+TARIFF = {0.5: 60, 1.0: 70, 2.0: 80, 5.0: 100, 10.0: 130}
+
+
+def request(sender, recipient, weight, service="WarehouseWarehouse"):
+    return DocumentPriceRequest(CitySender=sender, CityRecipient=recipient, Weight=weight, ServiceType=service,
+                                CargoType="Cargo", SeatsAmount=1)
+
+
+def response(weight, zone="2"):
+    step = min(step for step in TARIFF if weight <= step)
+    return DocumentPriceResponse(AssessedCost=300, Cost=TARIFF[step],
+                                 TZoneInfo={"TzoneName": "Україна", "TzoneID": zone})
+
+
+def fake_price(model, method, properties):
+    return [response(properties["Weight"]).model_dump()]
+
+
+def test_unknown_route_has_no_estimate():
+    assert PriceEstimator().estimate(request(KYIV, LVIV, 1)) is None
+
+
+def test_confidence_levels():
+    estimator = PriceEstimator()
+    estimator.observe(request(KYIV, LVIV, 0.8), response(0.8))
+    estimator.observe(request(KYIV, ODESA, 4), response(4))
+    estimator.observe(request(KYIV, DNIPRO, 0.3), response(0.3))
+
+    high = estimator.estimate(request(KYIV, LVIV, 0.6))
+    medium = estimator.estimate(request(KYIV, LVIV, 3))
+    low = estimator.estimate(request(KYIV, DNIPRO, 2))
+
+    assert (high.Cost, high.Confidence, high.Zone) == (70, "high", "2")
+    assert (medium.Cost, medium.Confidence) == (100, "medium")
+    # Поріг 2 кг у зоні ще невідомий: береться найближчий важчий, тож ціна не занижена
+    assert (low.Cost, low.Confidence) == (100, "low")
+    assert estimator.estimate(request(KYIV, LVIV, 1, service="WarehouseDoors")) is None
+
+
+def test_estimate_is_median_of_recent_samples():
+    estimator = PriceEstimator(window=3)
+    for cost in (50, 70, 75, 80):
+        estimator.observe(request(KYIV, LVIV, 1), DocumentPriceResponse(AssessedCost=300, Cost=cost))
+
+    estimate = estimator.estimate(request(KYIV, LVIV, 1))
+    assert (estimate.Cost, estimate.Samples, estimate.Zone) == (75, 3, None)
+
+
+def test_quoter_answers_instantly_and_refreshes_in_background():
+    release = threading.Event()
+
+    def slow_price(model, method, properties):
+        release.wait(1)
+        return fake_price(model, method, properties)
+
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=slow_price)
+    quoter = PriceQuoter(api)
+    quoter.estimator.observe(request(KYIV, ODESA, 1), response(1))
+
+    estimate, exact = quoter.quote(request(KYIV, LVIV, 1))
+    _, same = quoter.quote(request(KYIV, LVIV, 1))
+    assert estimate is None and not exact.done() and same is exact
+
+    release.set()
+    assert exact.result(1).Cost == 70
+    assert quoter.estimator.estimate(request(KYIV, LVIV, 2)).Confidence == "low"
+    assert api.send_request.call_count == 1
+    quoter.close()
+
+
+def test_quoter_refresh_error_is_reported_through_future():
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=NovaPostApiError(["Сервіс недоступний"]))
+    quoter = PriceQuoter(api)
+
+    _, exact = quoter.quote(request(KYIV, LVIV, 1))
+
+    with pytest.raises(NovaPostApiError):
+        exact.result(1)
+    assert len(quoter.estimator) == 0
+    quoter.close()
+
+
+def test_async_quoter():
+    async def run():
+        async with AsyncNovaPostApi(api_key="test-key") as api:
+            api.send_request = AsyncMock(side_effect=fake_price)
+            quoter = AsyncPriceQuoter(api)
+            first, task = quoter.quote(request(KYIV, LVIV, 5))
+            exact = await task
+            second, _ = quoter.quote(request(KYIV, LVIV, 5))
+            return first, exact, second
+
+    first, exact, second = asyncio.run(run())
+
+    assert first is None
+    assert exact.Cost == second.Cost == 100
+    assert second.Confidence == "high"
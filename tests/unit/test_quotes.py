@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from nova_post.api import NovaPostApi
+from nova_post.async_api import AsyncNovaPostApi
+from nova_post.models.internet_document import DocumentPriceRequest
+from nova_post.quotes import KYIV, QuoteCache, QuotePolicy, tariff_day_ttl
+
+KYIV_CITY = "8d5a980d-391c-11dd-90d9-001a92567626"
+LVIV_CITY = "db5c88f5-391c-11dd-90d9-001a92567626"
+
+
+def price_request(weight, cost=None, **fields):
+    if cost is not None:
+        fields["Cost"] = cost
+    return DocumentPriceRequest(CitySender=KYIV_CITY, CityRecipient=LVIV_CITY, Weight=weight,
+                                ServiceType="WarehouseWarehouse", CargoType="Cargo", SeatsAmount=1, **fields)
+
+
+def fake_price(model, method, properties):
+    return [{"AssessedCost": properties.get("Cost", 300), "Cost": int(70 + properties["Weight"] * 10)}]
+
+
+def at(*args):
+    return datetime(*args, tzinfo=KYIV).timestamp()
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_policy_rounds_weight_to_tariff_steps_and_cost_to_bands():
+    policy = QuotePolicy(cost_step=500)
+
+    assert [policy.round_weight(w) for w in (0.1, 0.5, 0.7, 3, 30, 31.2)] == [0.5, 0.5, 1.0, 5.0, 30.0, 32.0]
+    assert [policy.round_cost(c) for c in (1, 500, 501)] == [500, 500, 1000]
+    assert policy.normalize(price_request(1.3, cost=730)) == {
+        "CitySender": KYIV_CITY, "CityRecipient": LVIV_CITY, "Weight": 2.0, "ServiceType": "WarehouseWarehouse",
+        "CargoType": "Cargo", "SeatsAmount": 1, "Cost": 1000,
+    }
+    # Неявна вартість не додається до запиту
+    assert "Cost" not in policy.normalize(price_request(1.3))
+
+
+def test_tariff_day_ttl_ends_at_kyiv_midnight():
+    assert tariff_day_ttl(at(2025, 3, 10, 23, 0)) == 3600
+    # Перехід на літній час: доба коротша на годину
+    assert tariff_day_ttl(at(2025, 3, 30, 0, 0)) == 23 * 3600
+
+
+def test_carts_in_same_bucket_share_one_quote():
+    quotes = QuoteCache(QuotePolicy(cost_step=1000))
+    api = NovaPostApi(api_key="test-key", quote_cache=quotes)
+    api.send_request = MagicMock(side_effect=fake_price)
+
+    prices = [api.internet_document.get_document_price(price_request(w, cost=c)).Cost
+              for w, c in ((1.2, 300), (1.9, 999), (2.0, 1000), (2.1, 300))]
+
+    assert prices == [90, 90, 90, 120]
+    assert api.send_request.call_count == 2
+    assert api.send_request.call_args_list[0].args[2]["Weight"] == 2.0
+    assert quotes.stats() == {"hits": 2, "misses": 2, "hit_ratio": 0.5, "size": 2}
+
+
+def test_quotes_expire_with_tariff_day_and_lru_bound():
+    clock = FakeClock(at(2025, 3, 10, 23, 30))
+    quotes = QuoteCache(maxsize=2, clock=clock)
+    api = NovaPostApi(api_key="test-key", quote_cache=quotes)
+    api.send_request = MagicMock(side_effect=fake_price)
+
+    api.internet_document.get_document_price(price_request(1))
+    clock.now = at(2025, 3, 11, 0, 0, 1)
+    api.internet_document.get_document_price(price_request(1))
+    assert api.send_request.call_count == 2
+
+    api.internet_document.get_document_price(price_request(5))
+    api.internet_document.get_document_price(price_request(10))
+    assert len(quotes) == 2
+
+
+def test_without_quote_cache_request_is_sent_as_is():
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=fake_price)
+
+    api.internet_document.get_document_price(price_request(1.3))
+
+    assert api.send_request.call_args.args[2]["Weight"] == 1.3
+
+
+def test_async_adapter_uses_quote_cache():
+    quotes = QuoteCache()
+
+    async def run():
+        async with AsyncNovaPostApi(api_key="test-key", quote_cache=quotes) as api:
+            api.send_request = AsyncMock(side_effect=fake_price)
+            for weight in (0.2, 0.4):
+                await api.internet_document.get_document_price(price_request(weight))
+            return api.send_request.call_count
+
+    assert asyncio.run(run()) == 1
+    assert quotes.hits == 1
@@ -0,0 +1,118 @@
+import multiprocessing
+import os
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from nova_post import api as api_module
+from nova_post.api import NovaPostApi
+from nova_post import rate_limit
+from nova_post.rate_limit import FileTokenBucket, RateLimiter, TokenBucket, default_directory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_burst_then_wait():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now += 10
+    assert bucket.reserve() == 0
+
+
+def test_file_bucket_state_is_shared(tmp_path):
+    clock = FakeClock()
+    path = str(tmp_path / "bucket")
+    first = FileTokenBucket(path, rate=1, capacity=2, clock=clock)
+    second = FileTokenBucket(path, rate=1, capacity=2, clock=clock)
+
+    assert first.reserve() == 0
+    assert second.reserve() == 0
+    assert first.reserve() == pytest.approx(1.0)
+    assert second.reserve() == pytest.approx(2.0)
+
+
+def _reserve_many(path, count, queue):
+    bucket = FileTokenBucket(path, rate=1, capacity=5)
+    queue.put([bucket.reserve() for _ in range(count)])
+
+
+def test_file_bucket_across_processes(tmp_path):
+    path = str(tmp_path / "bucket")
+    queue = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=_reserve_many, args=(path, 5, queue)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    delays = sorted(d for _ in workers for d in queue.get(timeout=30))
+    for worker in workers:
+        worker.join()
+
+    # 15 запитів при місткості 5: рівно 5 без очікування, решта чекає приблизно 1..10 секунд
+    assert sum(1 for d in delays if d == 0) == 5
+    assert delays[-1] == pytest.approx(10, abs=0.5)
+
+
+def test_rate_limiter_per_method_limit():
+    limiter = RateLimiter(rate=100, per_method={"Address/getWarehouses": (1, 1)})
+
+    assert limiter.reserve("key", "Address", "getWarehouses") == 0
+    assert limiter.reserve("key", "Address", "getWarehouses") > 0.9
+    assert limiter.reserve("key", "Address", "getCities") == 0
+    assert limiter.reserve("other-key", "Address", "getWarehouses") == 0
+
+
+def test_rate_limiter_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, backend="redis")
+
+
+def test_send_request_waits_for_token(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(api_module.time, "sleep", sleeps.append)
+    api = NovaPostApi(api_key="test-key", rate_limiter=RateLimiter(rate=1, capacity=1))
+    api.session = MagicMock()
+    api.session.post.return_value = Mock(status_code=200, json=Mock(return_value={"success": True, "data": []}))
+
+    api.send_request("Address", "getCities", {})
+    api.send_request("Address", "getCities", {})
+
+    assert len(sleeps) == 1
+    assert 0.9 < sleeps[0] <= 1.0
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX-права")
+def test_default_directory_is_private(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(rate_limit.tempfile, "gettempdir", lambda: str(tmp_path))
+
+    limiter = RateLimiter(rate=1, backend="file")
+    assert limiter.reserve("key", "Address", "getCities") == 0
+
+    directory = default_directory()
+    assert limiter.directory == directory == str(tmp_path / f"nova_post-{os.getuid()}")
+    assert os.stat(directory).st_mode & 0o777 == 0o700
+    assert len(os.listdir(directory)) == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX-права")
+def test_default_directory_rejects_shared_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(rate_limit.tempfile, "gettempdir", lambda: str(tmp_path))
+    # Каталог, підготовлений іншим процесом із правами на запис для всіх
+    shared = tmp_path / f"nova_post-{os.getuid()}"
+    shared.mkdir()
+    shared.chmod(0o777)
+
+    with pytest.raises(PermissionError):
+        RateLimiter(rate=1, backend="file").reserve("key", "Address", "getCities")
@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import MagicMock, Mock
+
+import pytest
+import requests
+
+from nova_post import api as api_module
+from nova_post.api import NovaPostApi
+from nova_post.async_api import AsyncNovaPostApi
+from nova_post.exceptions import (
+    NovaPostApiError, NovaPostConnectionError, NovaPostHttpError, NovaPostTimeoutError
+)
+from nova_post.retry import RetryPolicy
+
+
+def ok_response(data=None):
+    return Mock(status_code=200, json=Mock(return_value={"success": True, "data": data or []}))
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(api_module.time, "sleep", delays.append)
+    return delays
+
+
+@pytest.fixture
+def api():
+    api = NovaPostApi(api_key="test-key", retry_policy=RetryPolicy(max_attempts=3, deadline=None))
+    api.session = MagicMock()
+    return api
+
+
+def test_read_method_retried_after_timeout(api, sleeps):
+    api.session.post.side_effect = [requests.Timeout(), requests.ConnectionError(), ok_response([{"Ref": "x"}])]
+
+    assert api.send_request("Address", "getCities", {}) == [{"Ref": "x"}]
+    assert api.session.post.call_count == 3
+    assert len(sleeps) == 2
+
+
+def test_gives_up_after_max_attempts(api, sleeps):
+    api.session.post.side_effect = requests.ConnectionError("refused")
+
+    with pytest.raises(NovaPostConnectionError):
+        api.send_request("TrackingDocument", "getStatusDocuments", {})
+    assert api.session.post.call_count == 3
+
+
+def test_http_5xx_is_retried(api, sleeps):
+    api.session.post.side_effect = [Mock(status_code=503), ok_response()]
+
+    assert api.send_request("Address", "getWarehouses", {}) == []
+    assert len(sleeps) == 1
+
+
+def test_save_is_not_retried_by_default(api, sleeps):
+    api.session.post.side_effect = requests.Timeout()
+
+    with pytest.raises(NovaPostTimeoutError, match="Таймаут запроса"):
+        api.send_request("InternetDocument", "save", {})
+    assert api.session.post.call_count == 1
+    assert sleeps == []
+
+
+def test_save_retried_when_opted_in(sleeps):
+    api = NovaPostApi(api_key="test-key", retry_policy=RetryPolicy(methods={"InternetDocument/save"}))
+    api.session = MagicMock()
+    api.session.post.side_effect = [requests.Timeout(), ok_response()]
+
+    assert api.send_request("InternetDocument", "save", {}) == []
+    assert api.session.post.call_count == 2
+
+
+def test_api_errors_are_not_retried(api, sleeps):
+    api.session.post.return_value = Mock(status_code=200, json=Mock(return_value={
+        "success": False, "errors": ["CityRef is invalid"]
+    }))
+
+    with pytest.raises(NovaPostApiError, match="CityRef is invalid"):
+        api.send_request("Address", "getWarehouses", {})
+    assert api.session.post.call_count == 1
+
+
+def test_deadline_stops_retries(sleeps):
+    policy = RetryPolicy(max_attempts=10, backoff_base=5, backoff_cap=5, deadline=0.01)
+    policy.backoff = lambda attempt: 5
+    api = NovaPostApi(api_key="test-key", retry_policy=policy)
+    api.session = MagicMock()
+    api.session.post.side_effect = requests.Timeout()
+
+    with pytest.raises(NovaPostTimeoutError):
+        api.send_request("Address", "getCities", {})
+    assert api.session.post.call_count == 1
+    assert sleeps == []
+
+
+def test_full_jitter_bounds():
+    policy = RetryPolicy(backoff_base=1, backoff_cap=4)
+    for attempt, cap in [(1, 1), (2, 2), (3, 4), (10, 4)]:
+        assert all(0 <= policy.backoff(attempt) <= cap for _ in range(100))
+
+
+def test_retry_if_for_api_errors():
+    policy = RetryPolicy(retry_if=lambda error: "To many requests" in str(error))
+    assert policy.is_retryable(NovaPostApiError(["To many requests"]))
+    assert not policy.is_retryable(NovaPostApiError(["Document not found"]))
+    assert policy.is_retryable(NovaPostHttpError(429))
+
+
+def test_async_client_retries(monkeypatch):
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    api = AsyncNovaPostApi(api_key="test-key", session=MagicMock(), retry_policy=RetryPolicy(deadline=None))
+    calls = []
+
+    async def fake_send(payload, timeout):
+        calls.append(payload["calledMethod"])
+        if len(calls) == 1:
+            raise NovaPostTimeoutError("Таймаут запроса: 10 секунд")
+        return []
+
+    api._send = fake_send
+
+    assert asyncio.run(api.send_request("Address", "getCities", {})) == []
+    assert calls == ["getCities", "getCities"]
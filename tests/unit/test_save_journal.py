@@ -0,0 +1,249 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.cache import ResponseCache
+from nova_post.async_api import AsyncNovaPostApi
+from nova_post.exceptions import NovaPostApiError, NovaPostHttpError, NovaPostTimeoutError
+from nova_post.journal import DOCUMENT_SAVE, AsyncJournaledSaver, JournaledSaver, SaveJournal, is_ambiguous
+from nova_post.models.counterparty import CounterpartyRequest
+from nova_post.models.internet_document import SaveInternetDocumentRequest
+
+CITY = "8d5a980d-391c-11dd-90d9-001a92567626"
+
+
+def waybill(n):
+    return SaveInternetDocumentRequest(
+        PayerType="Sender", PaymentMethod="Cash", DateTime="", CargoType="Parcel", Weight=1.5,
+        ServiceType="WarehouseWarehouse", SeatsAmount=1, Description=f"Замовлення {n}", Cost=500, CitySender=CITY,
+        Sender="sender", SenderAddress="address", ContactSender="contact", SendersPhone="380501112233",
+        CityRecipient=CITY, Recipient="recipient", RecipientAddress="address", ContactRecipient="contact",
+        RecipientsPhone="380671112233",
+    )
+
+
+class FakeServer:
+    """
+    Імітація API: `save` створює накладну, але відповідь може загубитися (таймаут після створення).
+    """
+
+    def __init__(self, lost_responses=0, fail_before_create=0):
+        self.documents = []
+        self.lost_responses = lost_responses
+        self.fail_before_create = fail_before_create
+        self.calls = []
+
+    def __call__(self, model, method, properties, use_cache=True):
+        self.calls.append(method)
+        if method == "getDocumentList":
+            return list(self.documents)
+        if method == "getCounterparties":
+            return [{"Ref": "cp-1", "Description": "Шевченко Тарас", "FirstName": "Тарас", "LastName": "Шевченко",
+                     "CounterpartyType": "PrivatePerson"}]
+        if self.fail_before_create:
+            self.fail_before_create -= 1
+            raise NovaPostTimeoutError("Таймаут запроса")
+        n = len(self.documents)
+        document = dict(properties, Ref=f"ref-{n}", IntDocNumber=str(20400000000000 + n), CostOnSite="70.00",
+                        Cost=f"{properties['Cost']}.00", Weight=str(properties["Weight"]), StateId=1)
+        self.documents.append(document)
+        if self.lost_responses:
+            self.lost_responses -= 1
+            raise NovaPostTimeoutError("Таймаут запроса")
+        return [{"Ref": document["Ref"], "CostOnSite": 70, "EstimatedDeliveryDate": "01.01.2025",
+                 "IntDocNumber": document["IntDocNumber"], "TypeDocument": "InternetDocument"}]
+
+
+def make_saver(server, journal=None):
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=server)
+    journal = journal if journal is not None else SaveJournal()
+    return JournaledSaver(api, journal, reconcile_delay=0, sleep=lambda delay: None)
+
+
+def test_ambiguous_errors():
+    assert is_ambiguous(NovaPostTimeoutError("Таймаут"))
+    assert is_ambiguous(NovaPostHttpError(502))
+    assert not is_ambiguous(NovaPostHttpError(429))
+    assert not is_ambiguous(NovaPostApiError(["Invalid phone"]))
+
+
+def test_timeout_after_create_is_reconciled_without_duplicate():
+    server = FakeServer(lost_responses=1)
+    saver = make_saver(server)
+
+    response = saver.save_internet_document(waybill(1), key="order-1")
+
+    assert response.Ref == "ref-0" and response.CostOnSite == 70
+    assert len(server.documents) == 1
+    assert server.calls == ["save", "getDocumentList"]
+    assert saver.journal.completed("order-1")["IntDocNumber"] == "20400000000000"
+    assert saver.journal.pending() == []
+
+
+def test_timeout_before_create_is_resent():
+    server = FakeServer(fail_before_create=1)
+    saver = make_saver(server)
+
+    assert saver.save_internet_document(waybill(1)).Ref == "ref-0"
+    assert server.calls == ["save", "getDocumentList", "save"]
+
+
+def test_identical_order_does_not_claim_existing_document():
+    server = FakeServer()
+    saver = make_saver(server)
+    saver.save_internet_document(waybill(1), key="order-1")
+
+    server.lost_responses = 1
+    second = saver.save_internet_document(waybill(1), key="order-2")
+
+    # Накладна order-1 вже належить іншому ключу, тож order-2 отримує власну
+    assert second.Ref == "ref-1"
+    assert len(server.documents) == 2
+
+
+def test_concurrent_reconciliation_cannot_take_the_same_document():
+    server = FakeServer()
+    saver = make_saver(server)
+    create = server.__call__
+    state = {"inside": False}
+
+    def send_request(model, method, properties, use_cache=True):
+        if method == "save" and not state["inside"]:
+            # Накладну order-b створено, але до запису відповіді в журнал звірка order-a встигає її побачити
+            state["inside"] = True
+            result = create(model, method, properties)
+            server.fail_before_create = 1
+            saver.save_internet_document(waybill(1), key="order-a")
+            return result
+        return create(model, method, properties)
+
+    saver.api.send_request = MagicMock(side_effect=send_request)
+    second = saver.save_internet_document(waybill(1), key="order-b")
+
+    first = saver.journal.completed("order-a")
+    # order-a забрала документ ref-0, тож order-b отримує власну накладну
+    assert first["Ref"] == "ref-0" and second.Ref == "ref-1"
+    assert len(server.documents) == 2
+
+
+def test_journal_refuses_second_owner_of_document():
+    journal = SaveJournal()
+    response = {"Ref": "ref-0", "IntDocNumber": "20400000000000"}
+
+    assert journal.complete("order-a", DOCUMENT_SAVE, "hash", response)
+    assert not journal.complete("order-b", DOCUMENT_SAVE, "hash", response)
+    assert journal.completed("order-b") is None
+    assert journal.complete("order-a", DOCUMENT_SAVE, "hash", response)
+
+
+def test_missing_required_field_does_not_match():
+    server = FakeServer()
+    request = waybill(1).model_dump(exclude_unset=True)
+    document = dict(request, Ref="ref-0", IntDocNumber="20400000000000")
+    del document["Recipient"]
+    server.documents.append(document)
+    journal = SaveJournal()
+    journal.begin("order-1", DOCUMENT_SAVE, request)
+
+    assert make_saver(server, journal).recover() == 0
+
+
+def test_realistic_document_list_row_matches():
+    request = waybill(1).model_dump(exclude_unset=True)
+    # Рядок getDocumentList без контакту й телефону одержувача, опису та кількості місць
+    row = {"Ref": "ref-0", "DateTime": request["DateTime"], "IntDocNumber": "20400000000000", "Sender": "sender",
+           "Recipient": "recipient", "CitySender": CITY, "CityRecipient": CITY, "Cost": "500.00", "Weight": "1.5",
+           "CostOnSite": "70.00", "PayerType": "Sender", "PaymentMethod": "Cash", "ServiceType": "WarehouseWarehouse",
+           "StateId": 1, "StateName": "Відправник самостійно створив цю накладну"}
+    server = FakeServer()
+    server.documents.append(row)
+    journal = SaveJournal()
+    journal.begin("order-1", DOCUMENT_SAVE, request)
+
+    assert make_saver(server, journal).recover() == 1
+    assert journal.completed("order-1")["Ref"] == "ref-0"
+
+
+def test_reconciliation_ignores_cached_document_list():
+    server = FakeServer(lost_responses=1)
+    api = NovaPostApi(api_key="test-key", cache=ResponseCache(default_ttl=300))
+    api._send = MagicMock(side_effect=lambda payload, timeout: server(payload["modelName"], payload["calledMethod"],
+                                                                     payload["methodProperties"]))
+    request = waybill(1)
+    # Список за день уже в кеші — отриманий до збереження, без нової накладної
+    api.send_request("InternetDocument", "getDocumentList",
+                     {"DateTimeFrom": request.DateTime, "DateTimeTo": request.DateTime, "GetFullList": 1})
+
+    response = JournaledSaver(api, SaveJournal(), reconcile_delay=0, sleep=lambda delay: None).save_internet_document(
+        request, key="order-1")
+
+    assert response.Ref == "ref-0"
+    assert server.calls.count("save") == 1 and len(server.documents) == 1
+
+
+def test_definite_error_clears_pending_entry():
+    saver = make_saver(MagicMock(side_effect=NovaPostApiError(["RecipientsPhone is invalid"])))
+
+    with pytest.raises(NovaPostApiError):
+        saver.save_internet_document(waybill(1), key="order-1")
+    assert saver.journal.pending() == []
+
+
+def test_exhausted_attempts_leave_entry_for_recovery(tmp_path):
+    path = str(tmp_path / "journal.db")
+    server = FakeServer(fail_before_create=3)
+    saver = make_saver(server, SaveJournal(path))
+
+    with pytest.raises(NovaPostTimeoutError):
+        saver.save_internet_document(waybill(1), key="order-1")
+    assert [entry.Key for entry in SaveJournal(path).pending(DOCUMENT_SAVE)] == ["order-1"]
+
+    # Після перезапуску незавершена операція звіряється: документа немає, запис видаляється
+    assert make_saver(server, SaveJournal(path)).recover() == 0
+    assert SaveJournal(path).pending() == []
+
+
+def test_recover_finds_document_created_before_crash():
+    server = FakeServer()
+    journal = SaveJournal()
+    request = waybill(1).model_dump(exclude_unset=True)
+    journal.begin("order-1", DOCUMENT_SAVE, request)
+    server("InternetDocument", "save", request)
+
+    assert make_saver(server, journal).recover() == 1
+    assert journal.completed("order-1")["Ref"] == "ref-0"
+
+
+def test_counterparty_save_is_reconciled():
+    server = FakeServer()
+    calls = iter([NovaPostTimeoutError("Таймаут запроса")])
+
+    def send_request(model, method, properties, use_cache=True):
+        if method == "save":
+            raise next(calls)
+        return server(model, method, properties)
+
+    saver = make_saver(send_request)
+    response = saver.save_counterparty(CounterpartyRequest(FirstName="Тарас", LastName="Шевченко",
+                                                           Phone="380671112233", CounterpartyType="PrivatePerson",
+                                                           CounterpartyProperty="Recipient"))
+
+    assert response.Ref == "cp-1"
+
+
+def test_async_saver_reconciles():
+    server = FakeServer(lost_responses=1)
+
+    async def run():
+        async with AsyncNovaPostApi(api_key="test-key") as api:
+            async def send_request(model, method, properties, use_cache=True):
+                return server(model, method, properties)
+            api.send_request = send_request
+            saver = AsyncJournaledSaver(api, SaveJournal(), reconcile_delay=0)
+            return await saver.save_internet_document(waybill(1), key="order-1")
+
+    assert asyncio.run(run()).Ref == "ref-0"
+    assert len(server.documents) == 1
@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.async_api import AsyncNovaPostApi, AsyncSingleFlight
+from nova_post.exceptions import NovaPostApiError
+from nova_post.singleflight import SingleFlight
+
+CITIES = [{"Ref": "city-1", "Description": "Київ"}]
+
+
+def slow_send(delay=0.05, result=CITIES):
+    def send(payload, timeout):
+        time.sleep(delay)
+        return result
+    return MagicMock(side_effect=send)
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    group = SingleFlight()
+    calls = []
+    barrier = threading.Barrier(5)
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    def run():
+        barrier.wait()
+        return group.do("key", fn)
+
+    with ThreadPoolExecutor(5) as executor:
+        results = list(executor.map(lambda _: run(), range(5)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert group.shared == 4
+    assert len(group) == 0
+
+
+def test_error_is_shared_and_key_released():
+    group = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.05)
+        raise NovaPostApiError(["Помилка"])
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(group.do, "key", failing)
+        started.wait(1)
+        follower = executor.submit(group.do, "key", lambda: "не викликається")
+        for future in (leader, follower):
+            with pytest.raises(NovaPostApiError):
+                future.result()
+
+    # Після завершення наступний виклик виконується заново
+    assert group.do("key", lambda: "ok") == "ok"
+
+
+def test_send_request_coalesces_reads_with_canonical_key():
+    api = NovaPostApi(api_key="test-key")
+    api._send_with_retry = slow_send()
+
+    with ThreadPoolExecutor(4) as executor:
+        futures = [executor.submit(api.send_request, "Address", "getCities", {"Page": 1, "Limit": 5})
+                   for _ in range(2)]
+        futures += [executor.submit(api.send_request, "Address", "getCities", {"Limit": 5, "Page": 1})
+                    for _ in range(2)]
+        results = [future.result() for future in futures]
+
+    assert api._send_with_retry.call_count == 1
+    assert all(result == CITIES for result in results)
+
+
+def test_writes_and_different_properties_are_not_coalesced():
+    api = NovaPostApi(api_key="test-key")
+    api._send_with_retry = slow_send()
+
+    with ThreadPoolExecutor(4) as executor:
+        calls = [("InternetDocument", "save", {"Cost": "100"})] * 2
+        calls += [("Address", "getCities", {"Page": 1}), ("Address", "getCities", {"Page": 2})]
+        list(executor.map(lambda args: api.send_request(*args), calls))
+
+    assert api._send_with_retry.call_count == 4
+
+
+def test_coalescing_can_be_disabled():
+    api = NovaPostApi(api_key="test-key", coalesce=False)
+    api._send_with_retry = slow_send()
+
+    with ThreadPoolExecutor(3) as executor:
+        list(executor.map(lambda _: api.send_request("Address", "getCities", {}), range(3)))
+
+    assert api.single_flight is None
+    assert api._send_with_retry.call_count == 3
+
+
+def test_uncached_read_does_not_join_running_request():
+    api = NovaPostApi(api_key="test-key")
+    api._send_with_retry = slow_send()
+
+    with ThreadPoolExecutor(2) as executor:
+        shared = executor.submit(api.send_request, "InternetDocument", "getDocumentList", {})
+        time.sleep(0.01)
+        fresh = executor.submit(api.send_request, "InternetDocument", "getDocumentList", {}, use_cache=False)
+        shared.result(), fresh.result()
+
+    # Запит без кешу надсилається окремо: відповідь уже запущеного могла бути отримана до зміни даних
+    assert api._send_with_retry.call_count == 2
+
+
+def test_async_send_request_coalesces_reads():
+    calls = []
+
+    async def send(payload, timeout):
+        calls.append(payload["calledMethod"])
+        await asyncio.sleep(0.02)
+        return CITIES
+
+    async def run():
+        async with AsyncNovaPostApi(api_key="test-key") as api:
+            api._send_with_retry = send
+            results = await asyncio.gather(*(api.send_request("Address", "getCities", {"Page": 1}) for _ in range(5)))
+            return results, api.single_flight
+
+    results, group = asyncio.run(run())
+
+    assert calls == ["getCities"]
+    assert all(result is results[0] for result in results)
+    assert group.shared == 4 and len(group) == 0
+
+
+def test_async_cancelled_caller_does_not_cancel_others():
+    async def fn():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    async def run():
+        group = AsyncSingleFlight()
+        first = asyncio.ensure_future(group.do("key", fn))
+        second = asyncio.ensure_future(group.do("key", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, first.cancelled()
+
+    assert asyncio.run(run()) == ("ok", True)
@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.directories.streets import StreetCache, StreetIndex
+from nova_post.models.address import Street
+
+CITY_KYIV = "8d5a980d-391c-11dd-90d9-001a92567626"
+CITY_LVIV = "db5c88f5-391c-11dd-90d9-001a92567626"
+SETTLEMENT = "e718a680-4b33-11e4-ab6d-005056801329"
+
+NAMES = ["Хрещатик", "Тараса Шевченка", "Шевченка", "Велика Васильківська", "Васильківська", "Січових Стрільців",
+         "Сагайдачного", "Шота Руставелі"]
+
+
+def make_streets(prefix, count):
+    return [
+        {"Ref": f"{prefix}-{n}", "Description": NAMES[n % len(NAMES)] + ("" if n < len(NAMES) else f" {n}"),
+         "StreetsTypeRef": "Street", "StreetsType": "вул."}
+        for n in range(count)
+    ]
+
+
+def settlement_item(n, name):
+    return {"SettlementRef": SETTLEMENT, "SettlementStreetRef": f"s-{n}", "SettlementStreetDescription": name,
+            "Present": f"вул. {name}", "StreetsType": "Street", "StreetsTypeDescription": "вул."}
+
+
+SETTLEMENT_STREETS = [settlement_item(n, name) for n, name in enumerate(NAMES)]
+
+
+@pytest.fixture
+def api():
+    streets = {CITY_KYIV: make_streets("kyiv", 1200), CITY_LVIV: make_streets("lviv", 300)}
+
+    def fake_send_request(model, method, properties):
+        if method == "getStreet":
+            start = (properties["Page"] - 1) * properties["Limit"]
+            return streets[properties["CityRef"]][start:start + properties["Limit"]]
+        found = [item for item in SETTLEMENT_STREETS
+                 if properties["StreetName"].lower() in item["SettlementStreetDescription"].lower()]
+        return [{"TotalCount": str(len(found)), "Addresses": found[:properties["Limit"]]}]
+
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=fake_send_request)
+    return api
+
+
+def test_index_matches_any_word_prefix():
+    index = StreetIndex(Street.model_validate(street) for street in make_streets("k", len(NAMES)))
+
+    assert {street.Description for street in index.search("шевч")} == {"Шевченка", "Тараса Шевченка"}
+    assert {street.Description for street in index.search("Vasylk")} == {"Васильківська", "Велика Васильківська"}
+    assert index.search("Сiчових")[0].Description == "Січових Стрільців"
+    assert index.search("невідома") == []
+    assert len(index.search("", limit=3)) == 3
+
+
+def test_first_lookup_downloads_city_then_serves_locally(api):
+    cache = StreetCache(api, page_size=500, max_workers=1)
+
+    first = cache.search(CITY_KYIV, "Хрещ", limit=5)
+    calls = api.send_request.call_count
+    second = cache.search(CITY_KYIV, "Шевч", limit=5)
+
+    assert calls == 3
+    assert api.send_request.call_count == calls
+    assert [street.Description for street in first][:2] == ["Хрещатик", "Хрещатик 1000"]
+    assert all("Шевченка" in street.Description for street in second)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1200
+
+
+def test_lru_eviction_by_street_count(api):
+    cache = StreetCache(api, max_streets=1300)
+    cache.search(CITY_LVIV, "Х")
+    cache.search(CITY_KYIV, "Х")
+
+    assert CITY_KYIV in cache
+    assert CITY_LVIV not in cache
+    assert len(cache) == 1200
+
+    cache.invalidate(CITY_KYIV)
+    assert len(cache) == 0
+
+
+def test_settlement_search_reuses_complete_responses(api):
+    cache = StreetCache(api)
+
+    assert [item.SettlementStreetDescription for item in cache.search_settlement(SETTLEMENT, "Ша")] == []
+    result = cache.search_settlement(SETTLEMENT, "Ш")
+    calls = api.send_request.call_count
+    refined = cache.search_settlement(SETTLEMENT, "Шевч")
+
+    assert {item.SettlementStreetDescription for item in result} == {"Шевченка", "Тараса Шевченка", "Шота Руставелі"}
+    assert {item.SettlementStreetDescription for item in refined} == {"Шевченка", "Тараса Шевченка"}
+    assert api.send_request.call_count == calls
+
+
+def test_incomplete_settlement_response_is_not_reused(api):
+    cache = StreetCache(api, settlement_limit=1)
+
+    assert len(cache.search_settlement(SETTLEMENT, "Ш")) == 1
+    cache.search_settlement(SETTLEMENT, "Шевч")
+
+    assert api.send_request.call_count == 2
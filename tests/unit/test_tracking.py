@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.exceptions import NovaPostTimeoutError
+from nova_post.models.tracking import TrackingRequest
+
+
+@pytest.fixture
+def api():
+    return NovaPostApi(api_key="test-key")
+
+
+def fake_status_documents(model, method, properties):
+    # API не повертає записів для номерів, що закінчуються на "9"
+    return [
+        {"Number": doc["DocumentNumber"], "Status": "Відправлення отримано"}
+        for doc in properties["Documents"] if not doc["DocumentNumber"].endswith("9")
+    ]
+
+
+def test_track_parcels_chunks_and_merges(api):
+    api.send_request = MagicMock(side_effect=fake_status_documents)
+    requests = [TrackingRequest(DocumentNumber=f"2040{n:06d}") for n in range(250)]
+
+    result = api.tracking.track_parcels(requests)
+
+    assert api.send_request.call_count == 3
+    chunk_sizes = sorted(len(call.args[2]["Documents"]) for call in api.send_request.call_args_list)
+    assert chunk_sizes == [50, 100, 100]
+    assert len(result.Documents) == 225
+    assert result.Documents["2040000000"].Status == "Відправлення отримано"
+    assert len(result.Missing) == 25
+    assert all(number.endswith("9") for number in result.Missing)
+
+
+def test_track_parcels_deduplicates_and_caps_chunk_size(api):
+    api.send_request = MagicMock(side_effect=fake_status_documents)
+    requests = [TrackingRequest(DocumentNumber="20400000000001", Phone="380991234567")] * 3
+
+    result = api.tracking.track_parcels(requests, chunk_size=500)
+
+    api.send_request.assert_called_once_with(
+        "TrackingDocument", "getStatusDocuments",
+        {"Documents": [{"DocumentNumber": "20400000000001", "Phone": "380991234567"}]}
+    )
+    assert list(result.Documents) == ["20400000000001"]
+    assert result.Missing == []
+
+
+def test_track_parcels_keeps_results_of_successful_chunks(api):
+    def send_request(model, method, properties):
+        if properties["Documents"][0]["DocumentNumber"] == "2040000100":
+            raise NovaPostTimeoutError("Таймаут запроса")
+        return fake_status_documents(model, method, properties)
+
+    api.send_request = MagicMock(side_effect=send_request)
+    requests = [TrackingRequest(DocumentNumber=f"2040{n:06d}") for n in range(250)]
+
+    result = api.tracking.track_parcels(requests)
+
+    # Другий фрагмент (100 накладних) не відповів, решта результатів збережена
+    assert len(result.Documents) == 135
+    assert len(result.Failed) == 100 and result.Failed["2040000150"] == "Таймаут запроса"
+    assert len(result.Missing) == 15 and "2040000109" not in result.Missing
@@ -0,0 +1,78 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from nova_post.api import NovaPostApi
+from nova_post.transport import PooledHTTPAdapter
+
+
+class JsonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"success": true, "data": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = HTTPServer(("127.0.0.1", 0), JsonHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_default_adapter_is_pooled():
+    api = NovaPostApi(api_key="test-key", pool_maxsize=32, pool_block=True)
+    assert isinstance(api.adapter, PooledHTTPAdapter)
+    assert api.adapter._pool_maxsize == 32
+    assert api.adapter._pool_block is True
+    assert api.connection_stats() == {"requests": 0, "created": 0, "reused": 0, "discarded": 0}
+
+
+def test_injected_session_and_adapter():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=5)
+    api = NovaPostApi(api_key="test-key", session=session, adapter=adapter)
+
+    assert api.session is session
+    assert api.adapter is adapter
+    assert api.connection_stats() == {}
+
+
+def test_keep_alive_disabled_sends_connection_close():
+    api = NovaPostApi(api_key="test-key", keep_alive=False)
+    assert api.session.headers["Connection"] == "close"
+
+
+def test_connections_are_reused(server_url):
+    adapter = PooledHTTPAdapter()
+    with NovaPostApi(api_key="test-key", adapter=adapter) as api:
+        api.session.mount("http://", adapter)
+        api.API_URL = server_url
+        for _ in range(5):
+            assert api.send_request("Address", "getAreas", {}) == []
+
+        assert api.connection_stats() == {"requests": 5, "created": 1, "reused": 4, "discarded": 0}
+
+
+def test_close_closes_session():
+    api = NovaPostApi(api_key="test-key")
+    api.session = MagicMock()
+    with api:
+        pass
+    api.session.close.assert_called_once()
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+from nova_post.api import NovaPostApi
+from nova_post.user_agent import DEFAULT_USER_AGENT, RotatingUserAgent, StaticUserAgent
+
+
+def test_import_does_not_load_fake_useragent():
+    """Тест: імпорт клієнта не повинен завантажувати базу браузерів fake_useragent"""
+    code = "import sys, nova_post.api; print('fake_useragent' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "False"
+
+
+def test_default_user_agent_is_static():
+    api = NovaPostApi(api_key="test-key")
+    assert isinstance(api.user_agent, StaticUserAgent)
+    assert api._build_headers() == {"User-Agent": DEFAULT_USER_AGENT}
+
+
+def test_custom_user_agent_string():
+    api = NovaPostApi(api_key="test-key", user_agent="my-shop/1.0")
+    assert api._build_headers()["User-Agent"] == "my-shop/1.0"
+
+
+def test_rotating_user_agent_builds_pool_lazily(monkeypatch):
+    policy = RotatingUserAgent(pool_size=5)
+    calls = []
+
+    def fake_build_pool():
+        calls.append(1)
+        return ["agent-a", "agent-b"]
+
+    monkeypatch.setattr(policy, "_build_pool", fake_build_pool)
+    api = NovaPostApi(api_key="test-key", user_agent=policy)
+    assert calls == []
+
+    agents = {api._build_headers()["User-Agent"] for _ in range(50)}
+
+    assert agents <= {"agent-a", "agent-b"}
+    assert calls == [1]
+
+
+def test_rotating_user_agent_with_explicit_pool():
+    policy = RotatingUserAgent(agents=["only-agent"])
+    assert policy() == "only-agent"
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.directories.warehouses import WarehouseDirectory
+from nova_post.models.address import GetWarehousesRequest, Warehouse
+
+CITY_KYIV = "8d5a980d-391c-11dd-90d9-001a92567626"
+CITY_LVIV = "db5c88f5-391c-11dd-90d9-001a92567626"
+POSTOMAT = "f9316480-5f2d-425d-bc2c-ac7cd29decf0"
+BRANCH = "841339c7-591a-42e2-8233-7a0a00f0ed6f"
+
+
+def make_warehouses(count):
+    return [
+        {
+            "SiteKey": 1000 + n,
+            "Description": f"Відділення №{n}",
+            "Number": str(n),
+            "CityRef": CITY_KYIV if n % 2 else CITY_LVIV,
+            "TypeOfWarehouse": POSTOMAT if n % 3 == 0 else BRANCH,
+        }
+        for n in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+def api():
+    warehouses = make_warehouses(1234)
+
+    def fake_send_request(model, method, properties):
+        start = (properties["Page"] - 1) * properties["Limit"]
+        return warehouses[start:start + properties["Limit"]]
+
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=fake_send_request)
+    return api
+
+
+def test_get_all_warehouses_pages_concurrently(api):
+    result = api.address.get_all_warehouses(
+        GetWarehousesRequest(CityRef=CITY_KYIV, Page=7, Limit=1), page_size=100, max_workers=4
+    )
+
+    assert [wh.SiteKey for wh in result] == list(range(1001, 2235))
+    pages = sorted(call.args[2]["Page"] for call in api.send_request.call_args_list)
+    # 13 потрібних сторінок і не більше max_workers - 1 спекулятивних запитів після останньої
+    assert pages[:13] == list(range(1, 14))
+    assert len(pages) <= 16
+    assert all(call.args[2]["CityRef"] == CITY_KYIV for call in api.send_request.call_args_list)
+    assert all(call.args[2]["Limit"] == 100 for call in api.send_request.call_args_list)
+
+
+def test_directory_indexes(api):
+    directory = WarehouseDirectory.download(api, page_size=500)
+
+    assert len(directory) == 1234
+    assert directory.find(CITY_KYIV, 13).Description == "Відділення №13"
+    assert directory.find(CITY_KYIV, "12") is None
+    assert directory.by_site_key(1012).Number == "12"
+    assert len(directory.in_city(CITY_LVIV)) == 617
+    assert all(wh.TypeOfWarehouse == POSTOMAT for wh in directory.of_type(POSTOMAT))
+    postomats_in_kyiv = directory.filter(city_ref=CITY_KYIV, type_of_warehouse=POSTOMAT)
+    assert len(postomats_in_kyiv) == len([n for n in range(1, 1235) if n % 2 and n % 3 == 0])
+    assert directory.in_city("unknown") == ()
+
+
+def test_directory_save_and_load(tmp_path):
+    directory = WarehouseDirectory(Warehouse.model_validate(wh) for wh in make_warehouses(10))
+    path = str(tmp_path / "warehouses.json.gz")
+
+    directory.save(path)
+    loaded = WarehouseDirectory.load(path)
+
+    assert list(loaded) == list(directory)
+    assert loaded.find(CITY_KYIV, 5).SiteKey == 1005
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova_post.api import NovaPostApi
+from nova_post.cache import ResponseCache
+from nova_post.models.internet_document import DocumentListRequest, DocumentListResponse
+from nova_post.waybill_state import WaybillStateStore
+
+STATES = {1: "Відправник самостійно створив цю накладну", 4: "Відправлення у місті відправника",
+          7: "Прибув на відділення", 9: "Відправлення отримано"}
+
+
+def row(n, state_id=1, cost="70"):
+    return {"Ref": f"ref-{n}", "DateTime": "01.03.2025", "IntDocNumber": str(20400000000000 + n), "Cost": cost,
+            "CitySender": "city-1", "CityRecipient": "city-2", "PayerType": "Sender", "StateId": state_id,
+            "StateName": STATES[state_id]}
+
+
+def test_new_documents_and_unchanged_pull():
+    store = WaybillStateStore()
+
+    first = store.apply([row(1), row(2)])
+    assert [(item.Ref, item.PreviousStateId, item.StateId) for item in first] == [("ref-1", None, 1),
+                                                                                  ("ref-2", None, 1)]
+    # Повторне вивантаження без змін нічого не повертає
+    assert store.apply([row(1), row(2)]) == []
+    assert len(store) == 2
+
+
+def test_state_changes_are_emitted_and_recorded():
+    store = WaybillStateStore(emit_new=False)
+    store.apply([row(1), row(2)])
+
+    changes = store.apply([row(1, 4), row(2), DocumentListResponse.model_validate(row(3, 7))])
+
+    assert [(item.Ref, item.PreviousStateId, item.StateId) for item in changes] == [("ref-1", 1, 4)]
+    assert changes[0].PreviousStateName == STATES[1] and changes[0].StateName == STATES[4]
+
+    store.apply([row(1, 9)])
+    assert [item.StateId for item in store.history("20400000000001")] == [1, 4, 9]
+    assert store.get("ref-1").StateId == 9 and store.get("ref-3").StateId == 7
+
+
+def test_other_field_changes_update_row_without_transition():
+    store = WaybillStateStore()
+    store.apply([row(1)])
+
+    assert store.apply([row(1, cost="85")]) == []
+    assert store.get("20400000000001").Cost == "85"
+    assert len(store.history("ref-1")) == 1
+
+
+def test_failed_callback_rolls_back_batch():
+    delivered = []
+
+    def on_transition(transition):
+        if transition.StateId == 9:
+            raise RuntimeError("Споживач недоступний")
+        delivered.append(transition.Ref)
+
+    store = WaybillStateStore(on_transition=on_transition, emit_new=False)
+    store.apply([row(1), row(2)])
+
+    with pytest.raises(RuntimeError):
+        store.apply([row(1, 4), row(2, 9)])
+    assert store.get("ref-1").StateId == 1
+
+    # Після відновлення споживача ті самі зміни доставляються повторно
+    store.on_transition = lambda transition: delivered.append(transition.Ref)
+    assert len(store.apply([row(1, 4), row(2, 9)])) == 2
+    assert delivered == ["ref-1", "ref-1", "ref-2"]
+
+
+def test_pull_streams_changes_from_document_list(tmp_path):
+    path = str(tmp_path / "waybills.db")
+    pages = {1: [row(1), row(2, 4)], 2: [row(3, 7)], 3: []}
+    api = NovaPostApi(api_key="test-key")
+    api.send_request = MagicMock(side_effect=lambda model, method, properties, use_cache: pages[properties["Page"]])
+    request = DocumentListRequest(DateTimeFrom="01.03.2025", DateTimeTo="07.03.2025")
+
+    assert len(list(WaybillStateStore(path).pull(api, request, chunk_size=2))) == 3
+
+    pages[1] = [row(1, 9), row(2, 4)]
+    store = WaybillStateStore(path)
+    assert [(item.Ref, item.StateId) for item in store.pull(api, request)] == [("ref-1", 9)]
+
+
+def test_pull_sees_changes_despite_response_cache():
+    pages = {1: [row(1)], 2: []}
+    api = NovaPostApi(api_key="test-key", cache=ResponseCache(default_ttl=300))
+    api._send = MagicMock(side_effect=lambda payload, timeout: pages[payload["methodProperties"]["Page"]])
+    request = DocumentListRequest(DateTimeFrom="01.03.2025", DateTimeTo="07.03.2025")
+    store = WaybillStateStore(emit_new=False)
+
+    assert list(store.pull(api, request)) == []
+    pages[1] = [row(1, 4)]
+    # Наступне опитування бачить новий статус, хоча кеш відповідей ще дійсний
+    assert [(item.Ref, item.StateId) for item in store.pull(api, request)] == [("ref-1", 4)]
+
+
+def test_async_changes():
+    async def rows():
+        for item in [row(1), row(2), row(1, 4)]:
+            yield item
+
+    async def run():
+        return [item async for item in WaybillStateStore().achanges(rows(), chunk_size=2)]
+
+    assert [(item.Ref, item.PreviousStateId) for item in asyncio.run(run())] == [("ref-1", None), ("ref-2", None),
+                                                                                 ("ref-1", 1)]
+
+
+def test_interrupted_consumer_gets_chunk_again():
+    store = WaybillStateStore(emit_new=False)
+    store.apply([row(1), row(2), row(3)])
+    rows = [row(1, 4), row(2, 4), row(3, 4)]
+
+    # Споживач упав після першої зміни пакета: пакет не зафіксовано
+    for transition in store.changes(rows, chunk_size=2):
+        break
+    assert store.get("ref-1").StateId == 1 and store.history("ref-1")[-1].StateId == 1
+
+    # Перший пакет фіксується, щойно споживач забрав усі його зміни й запросив наступну
+    stream = store.changes(rows, chunk_size=2)
+    assert [next(stream).Ref, next(stream).Ref, next(stream).Ref] == ["ref-1", "ref-2", "ref-3"]
+    assert store.get("ref-2").StateId == 4 and store.get("ref-3").StateId == 1
+    stream.close()
+    assert [item.Ref for item in store.changes(rows)] == ["ref-3"]
+
+
+def test_async_changes_run_sqlite_off_event_loop():
+    threads = set()
+    store = WaybillStateStore(on_transition=lambda transition: threads.add(threading.get_ident()))
+
+    async def rows():
+        for item in [row(1), row(2)]:
+            yield item
+
+    async def run():
+        return [item async for item in store.achanges(rows())]
+
+    assert len(asyncio.run(run())) == 2
+    assert threads and threading.get_ident() not in threads